@@ -0,0 +1,84 @@
+"""
+    Title: bench_columnar.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Compares the memory and iteration time of fetched rows kept
+        as a list of tuples against the shared ColumnarRows container.
+
+    Fetch times are taken with tracemalloc running and include generating
+    the synthetic rows, so only compare them with each other.
+
+    Usage:
+        python benchmarks/bench_columnar.py --rows 1000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+from bench_table_renderer import SyntheticCursor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.columnar import ColumnarRows
+
+
+def fetch_tuples(cursor, batch_size):
+    rows = []
+    while batch := cursor.fetchmany(batch_size):
+        rows.extend(batch)
+    return rows
+
+
+def fetch_columnar(cursor, batch_size):
+    return ColumnarRows.from_cursor(cursor, batch_size)
+
+
+def measure(name, fetch, row_count, batch_size):
+    """
+    Fetches synthetic transactions into a container and prints its size.
+
+    Returns:
+        - The bytes held by the container once fetching is done.
+        :rtype: int
+    """
+    gc.collect()
+    cursor = SyntheticCursor(row_count)
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = fetch(cursor, batch_size)
+    fetch_time = time.perf_counter() - start
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in rows:
+        pass
+    iterate_time = time.perf_counter() - start
+
+    per_million = held / row_count * 1_000_000 / 2**20
+    print(
+        f"{name:<10} {held / 2**20:>10.1f} MiB held {peak / 2**20:>10.1f} MiB peak "
+        f"{per_million:>10.1f} MiB/M rows {fetch_time:>8.2f}s fetch "
+        f"{iterate_time:>8.2f}s iterate"
+    )
+    return held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"Holding {args.rows:,} synthetic transactions\n")
+    tuples = measure("tuples", fetch_tuples, args.rows, args.batch_size)
+    columnar = measure("columnar", fetch_columnar, args.rows, args.batch_size)
+    print(f"\nMemory Reduction: {tuples / columnar:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+    Title: bench_prepared.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Compares the text and binary (prepared) protocols with the
+        pure Python driver and the C extension on a MySQL database.
+
+    Two workloads are timed for every combination:
+        - decode: the transactions of a date range are fetched in batches,
+          measuring how fast rows are read and converted to Python values.
+        - repeat: the high transaction clients report is executed once per
+          month of data, measuring the cost of sending the same query again.
+
+    Load a scratch database first, e.g.
+        python benchmarks/synthetic_data.py --size 100k --mysql willson_bench
+
+    Usage:
+        python benchmarks/bench_prepared.py --database willson_bench
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "module_11"))
+)
+
+from constants import DEFAULT_BATCH_SIZE, HIGH_TRANSACTION_CLIENTS_REPORT
+from periods import month_bounds
+from shared.connection import get_db_config, has_credentials
+from shared.lazy import lazy_import
+from shared.prepared import PreparedStatements
+
+mysql = lazy_import("mysql.connector")
+
+DECODE_QUERY = """
+SELECT
+    transaction_id,
+    client_id,
+    txn_date,
+    txn_type,
+    amount
+FROM
+    transactions
+WHERE
+    txn_date >= %s AND txn_date < %s;
+"""
+
+MONTHS_QUERY = """
+SELECT DISTINCT
+    YEAR(txn_date),
+    MONTH(txn_date)
+FROM
+    transactions
+ORDER BY
+    1, 2;
+"""
+
+
+def drain(cursor, batch_size):
+    """
+    Reads every row of a cursor in batches.
+
+    Returns:
+        - The number of rows read.
+        :rtype: int
+    """
+    count = 0
+    while batch := cursor.fetchmany(batch_size):
+        count += len(batch)
+    return count
+
+
+def run_query(cursor, statements, query, params):
+    """
+    Executes a query as text, or prepared when a registry is given.
+    """
+    if statements is None:
+        cursor.execute(query, params)
+        return cursor
+    return statements.execute(query, params)
+
+
+def bench_mode(database, use_pure, prepared, months, rounds, batch_size):
+    """
+    Runs both workloads on a new connection.
+
+    Returns:
+        - Rows per second of the decode workload and milliseconds per
+          execution of the repeat workload.
+        :rtype: tuple
+    """
+    config = get_db_config(database)
+    config["use_pure"] = use_pure
+    db = mysql.connector.connect(**config)
+    cursor = db.cursor()
+    statements = PreparedStatements(db) if prepared else None
+    date_range = (datetime.date(*months[0], 1), month_bounds(*months[-1])[1])
+    try:
+        rows = 0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            results = run_query(cursor, statements, DECODE_QUERY, date_range)
+            rows += drain(results, batch_size)
+        decode_time = time.perf_counter() - start
+
+        executions = 0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for year, month in months:
+                params = month_bounds(year, month)
+                results = run_query(
+                    cursor, statements, HIGH_TRANSACTION_CLIENTS_REPORT, params
+                )
+                drain(results, batch_size)
+                executions += 1
+        repeat_time = time.perf_counter() - start
+    finally:
+        if statements is not None:
+            statements.close()
+        cursor.close()
+        db.close()
+    return rows / decode_time, repeat_time / executions * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compares text and prepared queries with both MySQL drivers."
+    )
+    parser.add_argument("--database", default="willson_financial")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if not has_credentials(get_db_config(args.database)):
+        sys.exit("Error: Database Credentials (DB_USER, DB_PASSWORD) Not Found.")
+
+    db = mysql.connector.connect(**get_db_config(args.database))
+    cursor = db.cursor()
+    cursor.execute(MONTHS_QUERY)
+    months = cursor.fetchall()
+    cursor.close()
+    db.close()
+    if not months:
+        sys.exit(f"Error: No Transactions in '{args.database}'.")
+
+    drivers = [("pure", True)]
+    if getattr(mysql.connector, "HAVE_CEXT", False):
+        drivers.append(("cext", False))
+    else:
+        print("C extension not installed; only the pure Python driver is timed.")
+
+    print(
+        f"{'driver':<6} {'protocol':<9} {'decode rows/s':>15} {'repeat ms/query':>16}"
+    )
+    for driver, use_pure in drivers:
+        for prepared in (False, True):
+            rows_per_second, ms_per_query = bench_mode(
+                args.database, use_pure, prepared, months, args.rounds, args.batch_size
+            )
+            print(
+                f"{driver:<6} {'binary' if prepared else 'text':<9} "
+                f"{rows_per_second:>15,.0f} {ms_per_query:>16.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+    Title: bench_reports.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Times the willson_financial reports and table dumps on a
+        synthetic dataset and compares them against a stored baseline.
+
+    Each benchmark is run once for its wall time and throughput, then again
+    under `tracemalloc` for its peak Python memory, since tracing slows the
+    run down. Output is rendered to the null device with the shared table
+    renderer, as the display script would print it.
+
+    Usage:
+        python benchmarks/bench_reports.py --size 100k --save-baseline
+        python benchmarks/bench_reports.py --size 100k --baseline baseline.json
+        python benchmarks/bench_reports.py --size 10m --mysql willson_bench
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from synthetic_data import SyntheticDataset, load_mysql, load_sqlite, parse_size
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "module_11"))
+)
+
+from backends import DIALECT_QUERIES
+from constants import CURRENCY_COLUMNS
+from periods import month_bounds
+from shared.table_renderer import format_currency, render_cursor
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# A benchmark slower than its baseline by more than this fraction fails.
+DEFAULT_TOLERANCE = 0.25
+
+# Benchmarks faster than this are too noisy to flag as regressions.
+MIN_COMPARED_SECONDS = 0.01
+
+
+def report_queries(dialect, year, month):
+    """
+    Returns the benchmarked queries for a SQL dialect.
+
+    Parameters:
+        - dialect: "mysql" or "sqlite".
+        :type dialect: str
+
+        - year: The year of the high transaction clients report.
+        :type year: int
+
+        - month: The month of the high transaction clients report.
+        :type month: int
+
+    Returns:
+        - Tuples of benchmark name, query, parameters and currency columns.
+        :rtype: list
+    """
+    dialect_queries = DIALECT_QUERIES[dialect]
+    queries = [
+        (f"Table: {table}", f"SELECT * FROM {table}", (), CURRENCY_COLUMNS.get(table, ()))
+        for table in ("clients", "assets", "transactions", "billings")
+    ]
+    queries += [
+        ("New Client Report", dialect_queries["new_clients"], (), ()),
+        (
+            "Average Assets Report",
+            dialect_queries["avg_assets"],
+            (),
+            ("Avg Client Assets",),
+        ),
+        (
+            "High Transaction Clients Report",
+            dialect_queries["high_transactions"],
+            month_bounds(year, month),
+            (),
+        ),
+    ]
+    return queries
+
+
+def run_query(cursor, query, params, currency_columns, out):
+    """
+    Runs a query and renders its result.
+
+    Returns:
+        - The number of rows rendered.
+        :rtype: int
+    """
+    cursor.execute(query, params)
+    return render_cursor(
+        cursor, out=out, formatters=dict.fromkeys(currency_columns, format_currency)
+    )
+
+
+def run_benchmarks(cursor, queries):
+    """
+    Times every query, then measures its peak memory.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - queries: The queries from `report_queries`.
+        :type queries: list
+
+    Returns:
+        - The seconds, rows, rows/sec and peak KiB of each benchmark.
+        :rtype: dict
+    """
+    results = {}
+    with open(os.devnull, "w") as out:
+        for name, query, params, currency_columns in queries:
+            start = time.perf_counter()
+            rows = run_query(cursor, query, params, currency_columns, out)
+            seconds = time.perf_counter() - start
+
+            tracemalloc.start()
+            try:
+                run_query(cursor, query, params, currency_columns, out)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+            results[name] = {
+                "seconds": round(seconds, 6),
+                "rows": rows,
+                "rows_per_sec": round(rows / seconds) if seconds else 0,
+                "peak_kib": round(peak / 1024),
+            }
+    return results
+
+
+def print_results(results, baseline=None, tolerance=DEFAULT_TOLERANCE):
+    """
+    Prints the results, compared with a baseline if one is given.
+
+    Parameters:
+        - results: The results from `run_benchmarks`.
+        :type results: dict
+
+        - baseline: Earlier results of the same size and backend.
+        :type baseline: dict
+
+        - tolerance: The allowed slowdown, as a fraction of the baseline.
+        :type tolerance: float
+
+    Returns:
+        - The names of the benchmarks that regressed.
+        :rtype: list
+    """
+    regressions = []
+    print(
+        f"\n{'Benchmark':<35} {'Seconds':>9} {'Rows/sec':>14} {'Peak KiB':>10}"
+        f"{'  vs Baseline' if baseline else ''}"
+    )
+    for name, result in results.items():
+        line = (
+            f"{name:<35} {result['seconds']:>9.3f} {result['rows_per_sec']:>14,} "
+            f"{result['peak_kib']:>10,}"
+        )
+        previous = (baseline or {}).get(name)
+        if previous and previous["seconds"]:
+            ratio = result["seconds"] / previous["seconds"]
+            line += f"  {ratio:>6.2f}x"
+            if ratio > 1 + tolerance and result["seconds"] >= MIN_COMPARED_SECONDS:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+def main(argv=None):
+    """
+    Loads a synthetic dataset, benchmarks the reports and checks the baseline.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the willson_financial reports on synthetic data."
+    )
+    parser.add_argument(
+        "--size", default="100k", help="Number of transactions, e.g. 1k, 100k, 10m."
+    )
+    parser.add_argument("--seed", type=int, default=310)
+    parser.add_argument(
+        "--mysql",
+        metavar="DATABASE",
+        help="Benchmark on this scratch MySQL database instead of SQLite; its "
+        "tables are replaced.",
+    )
+    parser.add_argument(
+        "--sqlite",
+        metavar="PATH",
+        default=":memory:",
+        help="SQLite file for the stand-in database (default: in memory).",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON to compare against (default: benchmarks/baseline.json).",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store these results in the baseline instead of comparing.",
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    dataset = SyntheticDataset(parse_size(args.size), seed=args.seed)
+    # The last complete month has a full month of transactions
+    last_month = dataset.end.replace(day=1) - datetime.timedelta(days=1)
+
+    if args.mysql:
+        from shared.connection import pooled_connection
+
+        backend = "mysql"
+        with pooled_connection(args.mysql) as db:
+            load_timings = load_mysql(db, dataset)
+            cursor = db.cursor()
+            try:
+                results = run_benchmarks(
+                    cursor, report_queries("mysql", last_month.year, last_month.month)
+                )
+            finally:
+                cursor.close()
+    else:
+        backend = "sqlite"
+        connection, load_timings = load_sqlite(args.sqlite, dataset)
+        try:
+            results = run_benchmarks(
+                connection.cursor(),
+                report_queries("sqlite", last_month.year, last_month.month),
+            )
+        finally:
+            connection.close()
+
+    for table_name, (count, seconds) in load_timings.items():
+        results[f"Load: {table_name}"] = {
+            "seconds": round(seconds, 6),
+            "rows": count,
+            "rows_per_sec": round(count / seconds) if seconds else 0,
+            "peak_kib": 0,
+        }
+
+    # Results are only comparable for the same size, backend and interpreter
+    key = f"{backend}/{args.size}/python-{platform.python_version()}"
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baselines = json.load(baseline_file)
+
+    print(f"Benchmark: {key}")
+    if args.save_baseline:
+        print_results(results)
+        baselines[key] = results
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(baselines, baseline_file, indent=2, sort_keys=True)
+        print(f"\nBaseline Saved to {args.baseline}")
+        return
+
+    regressions = print_results(results, baselines.get(key), args.tolerance)
+    if key not in baselines:
+        print(f"\nNo Baseline for {key}; Run With --save-baseline to Store One.")
+    elif regressions:
+        print(
+            f"\n{len(regressions)} Benchmark(s) Regressed by More Than "
+            f"{args.tolerance:.0%}."
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+    Title: bench_startup.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Measures the import time of the report CLI with
+        `python -X importtime` and fails when it is over budget.
+
+    Each command is started several times with `cli.py --dry-run`, which
+    runs it like a real report start (arguments parsed, `.env` loaded,
+    settings resolved and the MySQL driver imported) and stops right before
+    the first connection. `--help` would exit before any of that. The median
+    total import time is compared against the budget, and the slowest
+    top-level imports are listed to show where the time goes.
+
+    The runs get placeholder DB_USER and DB_PASSWORD values when none are
+    set, so the credential check passes without a `.env` file.
+
+    Usage:
+        python benchmarks/bench_startup.py --budget-ms 100
+        python benchmarks/bench_startup.py --commands display snapshot
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+CLI = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "module_11", "cli.py"))
+
+DEFAULT_COMMANDS = ["display", "snapshot", "rollup"]
+
+# The arguments of a report start per command; {tmp} is a scratch directory.
+# Commands not listed here are started without arguments.
+DRY_RUN_ARGUMENTS = {
+    "display": ["--periods", "2025-01"],
+    "snapshot": ["sync", "--engine", "sqlite", "--path", "{tmp}/snapshot.sqlite"],
+    "rollup": ["check"],
+    "migrate": ["--check"],
+    "totals": ["check"],
+    "serve": ["--socket", "{tmp}/reports.sock"],
+}
+
+# Milliseconds of imports allowed before a report command starts working.
+DEFAULT_BUDGET_MS = 100
+
+DEFAULT_RUNS = 5
+
+
+def parse_importtime(stderr):
+    """
+    Reads the top-level imports from `-X importtime` output.
+
+    Lines look like `import time:  self [us] | cumulative | name`, with
+    nested imports indented under the module that imported them.
+
+    Parameters:
+        - stderr: The standard error of the process.
+        :type stderr: str
+
+    Returns:
+        - The cumulative microseconds of each top-level import.
+        :rtype: dict
+    """
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        # Top-level imports have a single space before the name
+        if not name.startswith("  "):
+            imports[name.strip()] = imports.get(name.strip(), 0) + int(cumulative)
+    return imports
+
+
+def measure_command(command, runs):
+    """
+    Dry-runs a command `runs` times and collects its import times.
+
+    Returns:
+        - The median total import time in milliseconds, the top-level
+          imports of the median run and its wall time in milliseconds.
+        :rtype: tuple
+    """
+    env = dict(os.environ, DB_DRY_RUN="1")
+    env.setdefault("DB_USER", "dry-run")
+    env.setdefault("DB_PASSWORD", "dry-run")
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        arguments = [
+            argument.format(tmp=tmp) for argument in DRY_RUN_ARGUMENTS.get(command, [])
+        ]
+        for _ in range(runs):
+            start = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, "-X", "importtime", CLI, "--dry-run", command]
+                + arguments,
+                capture_output=True,
+                text=True,
+                env=env,
+            )
+            wall_ms = (time.perf_counter() - start) * 1000
+            if completed.returncode != 0 or "Dry Run:" not in completed.stdout:
+                raise RuntimeError(
+                    f"'{command}' Dry Run Failed:\n"
+                    f"{(completed.stdout + completed.stderr).strip()[-2000:]}"
+                )
+            imports = parse_importtime(completed.stderr)
+            samples.append((sum(imports.values()) / 1000, imports, wall_ms))
+    samples.sort(key=lambda sample: sample[0])
+    return samples[len(samples) // 2]
+
+
+def main(argv=None):
+    """
+    Measures each command and exits non-zero if one is over budget.
+    """
+    parser = argparse.ArgumentParser(
+        description="Checks the import time of the report CLI against a budget."
+    )
+    parser.add_argument("--commands", nargs="+", default=DEFAULT_COMMANDS)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument(
+        "--top", type=int, default=8, help="Number of slowest imports to list."
+    )
+    args = parser.parse_args(argv)
+
+    over_budget = []
+    for command in args.commands:
+        total_ms, imports, wall_ms = measure_command(command, args.runs)
+        status = "OK" if total_ms <= args.budget_ms else "OVER BUDGET"
+        print(
+            f"\n-- {command} --  {total_ms:.1f} ms of imports, "
+            f"{wall_ms:.1f} ms wall ({status})"
+        )
+        slowest = sorted(imports.items(), key=lambda item: item[1], reverse=True)
+        for name, microseconds in slowest[: args.top]:
+            print(f"    {name:<40} {microseconds / 1000:>8.1f} ms")
+        if total_ms > args.budget_ms:
+            over_budget.append(command)
+
+    print(
+        f"\nMedian of {args.runs} Runs; Budget {args.budget_ms:.0f} ms; "
+        f"{len(over_budget)} Command(s) Over Budget."
+    )
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
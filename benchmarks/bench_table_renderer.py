@@ -0,0 +1,109 @@
+"""
+    Title: bench_table_renderer.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Measures rows/sec of the shared table renderer against the
+        original per-cell f-string and `print` rendering.
+
+    Usage:
+        python benchmarks/bench_table_renderer.py --rows 1000000
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.table_renderer import render_cursor
+
+COLUMNS = ("transaction_id", "client_id", "txn_date", "txn_type", "amount")
+TXN_TYPES = ("Deposit", "Withdrawal", "Trade")
+
+
+class SyntheticCursor:
+    """
+    Minimal stand-in for a MySQL cursor that yields synthetic transactions.
+    """
+
+    def __init__(self, row_count):
+        self.description = [(name,) for name in COLUMNS]
+        self._rows = self._generate(row_count)
+
+    @staticmethod
+    def _generate(row_count):
+        start = datetime.date(2025, 1, 1)
+        for i in range(row_count):
+            yield (
+                i + 1,
+                i % 5000 + 1,
+                start + datetime.timedelta(days=i % 365),
+                TXN_TYPES[i % 3],
+                Decimal(i % 100000) / 100,
+            )
+
+    def fetchmany(self, size):
+        rows = []
+        for row in self._rows:
+            rows.append(row)
+            if len(rows) == size:
+                break
+        return rows
+
+
+def legacy_render(cursor, batch_size, out):
+    """
+    The rendering previously duplicated across the display scripts.
+    """
+    column_names = [i[0] for i in cursor.description]
+    header = " | ".join(f"{name:<20}" for name in column_names)
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    while rows := cursor.fetchmany(batch_size):
+        for row in rows:
+            print(" | ".join(f"{str(item):<20}" for item in row), file=out)
+
+
+def time_renderer(name, render, row_count, batch_size):
+    """
+    Times one renderer writing to the null device and prints its throughput.
+    """
+    # Generating the rows is part of both runs, so measure it on its own
+    cursor = SyntheticCursor(row_count)
+    start = time.perf_counter()
+    while cursor.fetchmany(batch_size):
+        pass
+    generation = time.perf_counter() - start
+
+    cursor = SyntheticCursor(row_count)
+    with open(os.devnull, "w") as out:
+        start = time.perf_counter()
+        render(cursor, batch_size, out)
+        elapsed = time.perf_counter() - start - generation
+
+    print(f"{name:<10} {elapsed:8.2f}s {row_count / elapsed:14,.0f} rows/sec")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"Rendering {args.rows:,} synthetic rows in batches of {args.batch_size:,}\n")
+    legacy = time_renderer("legacy", legacy_render, args.rows, args.batch_size)
+    shared = time_renderer(
+        "shared",
+        lambda cursor, batch_size, out: render_cursor(cursor, batch_size, out=out),
+        args.rows,
+        args.batch_size,
+    )
+    print(f"\nSpeedup: {legacy / shared:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+"""
+    Title: synthetic_data.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Generates a synthetic willson_financial dataset and loads it
+        into MySQL or a SQLite stand-in.
+
+    The dataset is sized by its number of transactions, with one client per
+    50 transactions. Transactions are spread over clients with a Pareto
+    distribution, so a few clients are far busier than the rest, as in the
+    real firm. Every table is generated lazily from a fixed seed, so the
+    same size and seed always give the same data without holding it in
+    memory.
+
+    Usage:
+        python benchmarks/synthetic_data.py --size 100k --sqlite bench.db
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sqlite3
+import sys
+import time
+from decimal import Decimal
+from itertools import accumulate, islice
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Named dataset sizes, as numbers of transactions.
+SIZES = {"1k": 1_000, "100k": 100_000, "10m": 10_000_000}
+
+TRANSACTIONS_PER_CLIENT = 50
+
+# The number of months the transactions and billings are spread over,
+# ending with the current month.
+HISTORY_MONTHS = 24
+
+# Lower values give busier top clients; 1.16 is the classic 80/20 split.
+PARETO_ALPHA = 1.16
+
+ASSET_TYPES = ("Stock", "Bond", "Mutual Fund", "Real Estate", "Cash")
+TXN_TYPES = ("Deposit", "Withdrawal", "Trade")
+
+# The columns used by the scripts, in insert order.
+TABLE_COLUMNS = {
+    "clients": ["client_id", "name", "date_added"],
+    "assets": ["asset_id", "client_id", "asset_type", "asset_value"],
+    "transactions": ["transaction_id", "client_id", "txn_date", "txn_type", "amount"],
+    "billings": ["billing_id", "client_id", "bill_date", "bill_amount"],
+}
+
+# Written to work on both MySQL and SQLite.
+SCHEMA = {
+    "clients": """
+CREATE TABLE clients (
+    client_id INT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    date_added DATE NOT NULL
+)""",
+    "assets": """
+CREATE TABLE assets (
+    asset_id INT PRIMARY KEY,
+    client_id INT NOT NULL,
+    asset_type VARCHAR(50) NOT NULL,
+    asset_value DECIMAL(15, 2) NOT NULL
+)""",
+    "transactions": """
+CREATE TABLE transactions (
+    transaction_id INT PRIMARY KEY,
+    client_id INT NOT NULL,
+    txn_date DATE NOT NULL,
+    txn_type VARCHAR(20) NOT NULL,
+    amount DECIMAL(15, 2) NOT NULL
+)""",
+    "billings": """
+CREATE TABLE billings (
+    billing_id INT PRIMARY KEY,
+    client_id INT NOT NULL,
+    bill_date DATE NOT NULL,
+    bill_amount DECIMAL(10, 2) NOT NULL
+)""",
+}
+
+# The same indexes module_11/migrations.py adds to the real database.
+INDEXES = [
+    "CREATE INDEX idx_transactions_txn_date_client ON transactions (txn_date, client_id)",
+    "CREATE INDEX idx_clients_date_added ON clients (date_added)",
+]
+
+# The number of rows inserted per executemany call.
+LOAD_CHUNK_SIZE = 5000
+
+
+def parse_size(text):
+    """
+    Converts a named size such as "100k", or a plain number, to a row count.
+
+    Parameters:
+        - text: The size given on the command line.
+        :type text: str
+
+    Returns:
+        - The number of transactions.
+        :rtype: int
+    """
+    if text.lower() in SIZES:
+        return SIZES[text.lower()]
+    return int(text)
+
+
+class SyntheticDataset:
+    """
+    A reproducible willson_financial dataset of a given size.
+    """
+
+    def __init__(self, transaction_count, seed=310, today=None):
+        """
+        Parameters:
+            - transaction_count: The number of transactions to generate.
+            :type transaction_count: int
+
+            - seed: The random seed; each table derives its own from it.
+            :type seed: int
+
+            - today: The last day of the generated history, defaults to today.
+            :type today: datetime.date
+        """
+        self.transaction_count = transaction_count
+        self.client_count = max(10, transaction_count // TRANSACTIONS_PER_CLIENT)
+        self.seed = seed
+        self.end = today or datetime.date.today()
+        self.start = self.end - datetime.timedelta(days=HISTORY_MONTHS * 30)
+        rng = random.Random(seed)
+        self._cum_weights = list(
+            accumulate(rng.paretovariate(PARETO_ALPHA) for _ in range(self.client_count))
+        )
+
+    def _day(self, rng):
+        return self.start + datetime.timedelta(
+            days=rng.randrange((self.end - self.start).days + 1)
+        )
+
+    @staticmethod
+    def _money(rng, max_cents):
+        return Decimal(rng.randrange(1, max_cents)).scaleb(-2)
+
+    def rows(self, table_name):
+        """
+        Returns the row generator of a table.
+
+        Parameters:
+            - table_name: One of the tables in `TABLE_COLUMNS`.
+            :type table_name: str
+
+        Returns:
+            - The rows of the table, as dictionaries keyed by column.
+            :rtype: iterator
+        """
+        return getattr(self, table_name)()
+
+    def clients(self):
+        rng = random.Random(self.seed + 1)
+        for client_id in range(1, self.client_count + 1):
+            yield {
+                "client_id": client_id,
+                "name": f"Client {client_id:07d}",
+                "date_added": self._day(rng),
+            }
+
+    def assets(self):
+        rng = random.Random(self.seed + 2)
+        asset_id = 0
+        for client_id in range(1, self.client_count + 1):
+            for _ in range(rng.randint(1, 5)):
+                asset_id += 1
+                yield {
+                    "asset_id": asset_id,
+                    "client_id": client_id,
+                    "asset_type": rng.choice(ASSET_TYPES),
+                    "asset_value": self._money(rng, 50_000_000),
+                }
+
+    def transactions(self, batch_size=10_000):
+        rng = random.Random(self.seed + 3)
+        client_ids = range(1, self.client_count + 1)
+        transaction_id = 0
+        while transaction_id < self.transaction_count:
+            count = min(batch_size, self.transaction_count - transaction_id)
+            # Drawing the skewed client ids in bulk is much faster per row
+            for client_id in rng.choices(
+                client_ids, cum_weights=self._cum_weights, k=count
+            ):
+                transaction_id += 1
+                yield {
+                    "transaction_id": transaction_id,
+                    "client_id": client_id,
+                    "txn_date": self._day(rng),
+                    "txn_type": rng.choice(TXN_TYPES),
+                    "amount": self._money(rng, 2_500_000),
+                }
+
+    def billings(self):
+        rng = random.Random(self.seed + 4)
+        billing_id = 0
+        for client_id in range(1, self.client_count + 1):
+            for _ in range(rng.randint(1, 3)):
+                billing_id += 1
+                yield {
+                    "billing_id": billing_id,
+                    "client_id": client_id,
+                    "bill_date": self._day(rng),
+                    "bill_amount": self._money(rng, 500_000),
+                }
+
+
+def _load_timed(tables, insert_table):
+    """
+    Calls `insert_table(table_name)` for each table and times it.
+
+    Returns:
+        - The number of rows and seconds taken, keyed by table name.
+        :rtype: dict
+    """
+    timings = {}
+    for table_name in tables:
+        start = time.perf_counter()
+        count = insert_table(table_name)
+        timings[table_name] = (count, time.perf_counter() - start)
+    return timings
+
+
+def load_sqlite(path, dataset):
+    """
+    Replaces the willson_financial tables of a SQLite database with a dataset.
+
+    Dates are stored as ISO text and decimals as numbers, so the SQLite
+    dialect of the reports compares and sums them correctly.
+
+    Parameters:
+        - path: The SQLite database file, or ":memory:".
+        :type path: str
+
+        - dataset: The dataset to load.
+        :type dataset: SyntheticDataset
+
+    Returns:
+        - The open connection and the load timings of each table.
+        :rtype: tuple
+    """
+    sqlite3.register_adapter(Decimal, str)
+    sqlite3.register_adapter(datetime.date, datetime.date.isoformat)
+    connection = sqlite3.connect(path)
+    for table_name in TABLE_COLUMNS:
+        connection.execute(f"DROP TABLE IF EXISTS {table_name}")
+        connection.execute(SCHEMA[table_name])
+
+    def insert_table(table_name):
+        columns = TABLE_COLUMNS[table_name]
+        insert = (
+            f"INSERT INTO {table_name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(['?'] * len(columns))})"
+        )
+        count = 0
+        rows = dataset.rows(table_name)
+        while chunk := list(islice(rows, LOAD_CHUNK_SIZE)):
+            connection.executemany(insert, [tuple(row.values()) for row in chunk])
+            count += len(chunk)
+        connection.commit()
+        return count
+
+    timings = _load_timed(TABLE_COLUMNS, insert_table)
+    for index in INDEXES:
+        connection.execute(index)
+    connection.commit()
+    return connection, timings
+
+
+def load_mysql(db, dataset):
+    """
+    Replaces the willson_financial tables of a MySQL database with a dataset.
+
+    Use a scratch database: the existing tables are dropped.
+
+    Parameters:
+        - db: Database connection.
+        :type db: mysql.connector.connection.MySQLConnection
+
+        - dataset: The dataset to load.
+        :type dataset: SyntheticDataset
+
+    Returns:
+        - The load timings of each table.
+        :rtype: dict
+    """
+    from shared.bulk_insert import bulk_insert
+
+    cursor = db.cursor()
+    try:
+        # Checked first, as DROP TABLE IF EXISTS warns when a table is missing
+        cursor.execute(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_schema = DATABASE()"
+        )
+        existing = {name for (name,) in cursor.fetchall()}
+        for table_name in TABLE_COLUMNS:
+            if table_name in existing:
+                cursor.execute(f"DROP TABLE {table_name}")
+            cursor.execute(SCHEMA[table_name])
+    finally:
+        cursor.close()
+
+    timings = _load_timed(
+        TABLE_COLUMNS,
+        lambda table_name: bulk_insert(
+            db,
+            table_name,
+            TABLE_COLUMNS[table_name],
+            dataset.rows(table_name),
+            chunk_size=LOAD_CHUNK_SIZE,
+        ),
+    )
+    cursor = db.cursor()
+    try:
+        for index in INDEXES:
+            cursor.execute(index)
+    finally:
+        cursor.close()
+    return timings
+
+
+def print_load_timings(timings):
+    """
+    Prints the rows, time and throughput of each loaded table.
+    """
+    print("\n-- LOAD --")
+    for table_name, (count, seconds) in timings.items():
+        print(
+            f"{table_name:<15} {count:>12,} rows {seconds:>9.3f}s "
+            f"{count / seconds if seconds else 0:>14,.0f} rows/sec"
+        )
+
+
+def main(argv=None):
+    """
+    Generates a dataset and loads it into SQLite or MySQL.
+    """
+    parser = argparse.ArgumentParser(
+        description="Loads a synthetic willson_financial dataset."
+    )
+    parser.add_argument(
+        "--size",
+        default="100k",
+        help=f"Number of transactions, or one of {', '.join(SIZES)} (default: 100k).",
+    )
+    parser.add_argument("--seed", type=int, default=310)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--sqlite", metavar="PATH", help="SQLite file to load.")
+    target.add_argument(
+        "--mysql",
+        metavar="DATABASE",
+        help="Existing scratch MySQL database to load; its tables are replaced.",
+    )
+    args = parser.parse_args(argv)
+
+    dataset = SyntheticDataset(parse_size(args.size), seed=args.seed)
+    if args.sqlite:
+        connection, timings = load_sqlite(args.sqlite, dataset)
+        connection.close()
+    else:
+        from shared.connection import pooled_connection
+
+        with pooled_connection(args.mysql) as db:
+            timings = load_mysql(db, dataset)
+    print_load_timings(timings)
+
+
+if __name__ == "__main__":
+    main()
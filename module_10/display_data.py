@@ -5,16 +5,24 @@
     Description: Displays data from the willson_financial database.
 """
 
+import argparse
 import os
-import mysql.connector
-from mysql.connector import errorcode
-from dotenv import load_dotenv
+import sys
 
-# Load environment variables from .env file
-load_dotenv()
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from shared.connection import get_connection, get_db_config, has_credentials
+from shared.export import add_export_arguments, exporter_from_args
+from shared.keyset import add_browse_arguments, browse_table, pager_from_args
+from shared.lazy import lazy_import
+from shared.profiling import add_profile_arguments, finish_profile, profiler_from_args
+from shared.table_renderer import render_cursor, render_rows
 
-def show_table_data(cursor, table_name):
+# The driver is loaded on first use, so --help and argument errors skip it
+mysql = lazy_import("mysql.connector")
+
+
+def show_table_data(cursor, table_name, exporter=None):
     """
     Function to display all data from a table with dynamic formatting.
 
@@ -24,69 +32,82 @@ def show_table_data(cursor, table_name):
 
         - table_name: The name of the table to display data from.
         :type table_name: str
+
+        - exporter: Writes the table to a file instead of printing it.
+        :type exporter: shared.export.Exporter
     """
     print(f"\n--- {table_name.upper()} ---")
     try:
         cursor.execute(f"SELECT * FROM {table_name}")
-        rows = cursor.fetchall()
 
-        if not rows:
-            print(f"No data found in {table_name}.")
+        if exporter is not None:
+            path, count = exporter.export_cursor(cursor, table_name)
+            print(f"Exported {count} rows to {path}")
             return
 
-        # Get column names from cursor.description
-        column_names = [i[0] for i in cursor.description]
-
-        # Print header
-        header = " | ".join(f"{name:<20}" for name in column_names)
-        print(header)
-        print("-" * len(header))
-
-        # Print rows
-        for row in rows:
-            row_data = " | ".join(f"{str(item):<20}" for item in row)
-            print(row_data)
+        # Column widths are sized from the first rows and each batch of rows
+        # is written in a single call
+        if not render_cursor(cursor):
+            print(f"No data found in {table_name}.")
 
     except mysql.connector.Error as err:
         print(f"Error fetching data from {table_name}: {err}")
 
 
-def main():
+def main(argv=None):
     """
     Main function to connect to the database and display table data.
     """
+    parser = argparse.ArgumentParser(
+        description="Displays data from the willson_financial database."
+    )
+    add_export_arguments(parser)
+    add_profile_arguments(parser)
+    add_browse_arguments(parser)
+    args = parser.parse_args(argv)
+    exporter = exporter_from_args(args)
+    profiler = profiler_from_args(args)
+
     db = None
     cursor = None
     try:
         # Get database credentials from environment variables
-        db_user = os.getenv("DB_USER")
-        db_password = os.getenv("DB_PASSWORD")
-        db_host = os.getenv("DB_HOST", "localhost")
+        config = get_db_config("willson_financial")
 
-        if not db_user or not db_password:
+        if not has_credentials(config):
             print(
                 "Error: Database Credentials (DB_USER, DB_PASSWORD) Not Found in .env File."
             )
             return
 
-        config = {
-            "user": db_user,
-            "password": db_password,
-            "host": db_host,
-            "database": "willson_financial",
-            "raise_on_warnings": True,
-        }
-
-        db = mysql.connector.connect(**config)
-        cursor = db.cursor()
+        if profiler is not None:
+            with profiler.phase("connect"):
+                db = get_connection("willson_financial")
+            cursor = profiler.wrap_cursor(db.cursor())
+            sys.stdout = profiler.wrap_stream(sys.stdout)
+        else:
+            db = get_connection("willson_financial")
+            cursor = db.cursor()
 
         print("Successfully connected to the 'willson_financial' database.")
 
+        if args.browse:
+            # Pages are read by primary key, so any page costs the same
+            try:
+                pager = pager_from_args(cursor, args)
+            except ValueError as err:
+                print(f"Error: {err}")
+                return
+            browse_table(pager, render_rows)
+            return
+
         tables_to_show = ["clients", "assets", "transactions", "billings"]
         for table in tables_to_show:
-            show_table_data(cursor, table)
+            show_table_data(cursor, table, exporter)
 
     except mysql.connector.Error as err:
+        from mysql.connector import errorcode
+
         if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
             print("Something Is Wrong With Your User Name Or Password")
         elif err.errno == errorcode.ER_BAD_DB_ERROR:
@@ -99,6 +120,8 @@ def main():
         if db and db.is_connected():
             db.close()
             print("\nMySQL Connection Is Closed.")
+        sys.stdout = sys.__stdout__
+        finish_profile(profiler, args)
 
 
 if __name__ == "__main__":
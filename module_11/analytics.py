@@ -0,0 +1,340 @@
+"""
+    Title: analytics.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Answers the aggregate reports from NumPy arrays held in memory.
+
+    The columns the reports need are read once into compact arrays: int32
+    client ids, datetime64[D] dates and int64 amounts in cents. Every report
+    is then a vectorized group-by over those arrays, so variants with other
+    thresholds and windows are answered in milliseconds without another
+    server-side aggregation.
+
+    The arrays can be loaded from MySQL or from a snapshot made by snapshot.py.
+    Requires the optional `numpy` package (pip install numpy).
+
+    Usage:
+        python analytics.py --threshold 5 10 20 --months 3 6 12 \
+            --periods 2025-01..2025-06 [--engine duckdb --path snapshot.duckdb]
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import time
+from decimal import Decimal
+
+from backends import get_backend
+from constants import DEFAULT_BATCH_SIZE
+from periods import month_bounds, parse_periods
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.lazy import lazy_import
+from shared.table_renderer import format_currency, render_rows
+
+try:
+    # Loaded on first use, so `--help` and argument errors stay fast
+    np = lazy_import("numpy")
+except ImportError:
+    np = None
+
+# The threshold and window of the reports as written in constants.py.
+DEFAULT_THRESHOLD = 10
+DEFAULT_MONTHS = 6
+
+
+def _fetch_columns(cursor, query, batch_size):
+    """
+    Streams a query and returns its result as one list per column.
+    """
+    cursor.execute(query)
+    columns = [[] for _ in cursor.description]
+    while rows := cursor.fetchmany(batch_size):
+        for column, values in zip(columns, zip(*rows)):
+            column.extend(values)
+    return columns
+
+
+def _cents(values):
+    """
+    Converts Decimal (MySQL, DuckDB) or float (SQLite) amounts to int64 cents.
+    """
+    return np.fromiter(
+        (round(value * 100) for value in values), dtype=np.int64, count=len(values)
+    )
+
+
+def _dates(values):
+    """
+    Converts date objects or ISO date text to datetime64[D].
+    """
+    return np.array([str(value)[:10] for value in values], dtype="datetime64[D]")
+
+
+def _subtract_months(day, months):
+    """
+    Returns the date `months` calendar months before `day`, like DATE_SUB,
+    moving to the end of the month when the day does not exist.
+    """
+    month_index = day.year * 12 + day.month - 1 - months
+    year, month = divmod(month_index, 12)
+    month += 1
+    last_day = (month_bounds(year, month)[1] - datetime.timedelta(days=1)).day
+    return datetime.date(year, month, min(day.day, last_day))
+
+
+class ReportArrays:
+    """
+    The columns of the willson_financial reports as NumPy arrays.
+    """
+
+    def __init__(self, cursor, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Reads the columns the reports use, one streamed query per table.
+
+        Parameters:
+            - cursor: Cursor on MySQL or on a snapshot.
+            :type cursor: object
+
+            - batch_size: The number of rows fetched at a time.
+            :type batch_size: int
+        """
+        if np is None:
+            raise ImportError(
+                "The Analytics Mode Requires numpy (pip install numpy)."
+            )
+        client_ids, names, dates_added = _fetch_columns(
+            cursor, "SELECT client_id, name, date_added FROM clients", batch_size
+        )
+        self.client_ids = np.array(client_ids, dtype=np.int32)
+        self.client_dates_added = _dates(dates_added)
+        # Names are looked up by id only for the rows a report returns
+        self.client_names = dict(zip(client_ids, names))
+
+        client_ids, asset_values = _fetch_columns(
+            cursor, "SELECT client_id, asset_value FROM assets", batch_size
+        )
+        self.asset_client_ids = np.array(client_ids, dtype=np.int32)
+        self.asset_cents = _cents(asset_values)
+
+        client_ids, txn_dates = _fetch_columns(
+            cursor, "SELECT client_id, txn_date FROM transactions", batch_size
+        )
+        self.txn_client_ids = np.array(client_ids, dtype=np.int32)
+        self.txn_dates = _dates(txn_dates)
+
+    @property
+    def nbytes(self):
+        """
+        The memory held by the arrays, not counting the client names.
+        """
+        return sum(
+            array.nbytes
+            for array in (
+                self.client_ids,
+                self.client_dates_added,
+                self.asset_client_ids,
+                self.asset_cents,
+                self.txn_client_ids,
+                self.txn_dates,
+            )
+        )
+
+    def new_clients(self, months=DEFAULT_MONTHS, today=None):
+        """
+        Counts new clients per month, as NEW_CLIENT_REPORT does.
+
+        Parameters:
+            - months: The number of months to look back.
+            :type months: int
+
+            - today: The day the window ends, defaults to today.
+            :type today: datetime.date
+
+        Returns:
+            - (month, year, new clients) rows in date order.
+            :rtype: list
+        """
+        start = np.datetime64(
+            _subtract_months(today or datetime.date.today(), months), "D"
+        )
+        added = self.client_dates_added[self.client_dates_added >= start]
+        added_months, counts = np.unique(
+            added.astype("datetime64[M]"), return_counts=True
+        )
+        return [
+            (int(month) % 12 + 1, int(month) // 12 + 1970, int(count))
+            for month, count in zip(added_months.astype(np.int64), counts)
+        ]
+
+    def avg_assets(self):
+        """
+        Averages the total asset value per client, as AVG_ASSETS_REPORT does.
+
+        Returns:
+            - The average in dollars, or None when there are no assets.
+            :rtype: decimal.Decimal
+        """
+        if not len(self.asset_cents):
+            return None
+        # Only clients with assets count towards the average, as in the GROUP BY
+        client_count = len(np.unique(self.asset_client_ids))
+        total = int(self.asset_cents.sum())
+        return (Decimal(total) / client_count / 100).quantize(Decimal("0.0001"))
+
+    def high_transaction_clients(self, start, end, threshold=DEFAULT_THRESHOLD):
+        """
+        Finds the clients with more than `threshold` transactions in a range,
+        as HIGH_TRANSACTION_CLIENTS_REPORT does.
+
+        Parameters:
+            - start: The first day of the range.
+            :type start: datetime.date
+
+            - end: The day after the range.
+            :type end: datetime.date
+
+            - threshold: Clients need more transactions than this.
+            :type threshold: int
+
+        Returns:
+            - (client, transaction count) rows, busiest first.
+            :rtype: list
+        """
+        in_range = (self.txn_dates >= np.datetime64(start, "D")) & (
+            self.txn_dates < np.datetime64(end, "D")
+        )
+        counts = np.bincount(self.txn_client_ids[in_range])
+        client_ids = np.flatnonzero(counts > threshold)
+        # Stable sort so equal counts keep client id order
+        client_ids = client_ids[np.argsort(-counts[client_ids], kind="stable")]
+        return [
+            (self.client_names[int(client_id)], int(counts[client_id]))
+            for client_id in client_ids
+        ]
+
+
+def print_variants(arrays, thresholds, windows, periods, out=None):
+    """
+    Prints every requested report variant and the time it took.
+
+    Parameters:
+        - arrays: The loaded report columns.
+        :type arrays: ReportArrays
+
+        - thresholds: Transaction count thresholds to report.
+        :type thresholds: list
+
+        - windows: New client windows to report, in months.
+        :type windows: list
+
+        - periods: The (year, month) pairs of the high transaction report.
+        :type periods: list
+
+        - out: The stream to write to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+    """
+    start = time.perf_counter()
+    average = arrays.avg_assets()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n\n-- AVERAGE ASSETS REPORT ({elapsed:.2f} ms) --", file=out)
+    if average is None:
+        print("No Asset Data Found.", file=out)
+    else:
+        print(f"Average Total Assets Per Client: {format_currency(average)}", file=out)
+
+    for months in windows:
+        start = time.perf_counter()
+        rows = arrays.new_clients(months)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(
+            f"\n\n-- NEW CLIENT REPORT, LAST {months} MONTHS ({elapsed:.2f} ms) --",
+            file=out,
+        )
+        for row in rows:
+            print(f"Month: {row[0]}, Year: {row[1]}, New Clients: {row[2]}", file=out)
+
+    for year, month in periods:
+        for threshold in thresholds:
+            start = time.perf_counter()
+            rows = arrays.high_transaction_clients(
+                *month_bounds(year, month), threshold=threshold
+            )
+            elapsed = (time.perf_counter() - start) * 1000
+            print(
+                f"\n\n-- CLIENTS WITH MORE THAN {threshold} TRANSACTIONS IN "
+                f"{year}-{month:02d} ({elapsed:.2f} ms) --",
+                file=out,
+            )
+            if rows:
+                render_rows(["Client", "Transaction Count"], rows, out=out)
+            else:
+                print(f"No Clients With More Than {threshold} Transactions.", file=out)
+
+
+def main(argv=None):
+    """
+    Loads the report columns once and prints every requested variant.
+    """
+    parser = argparse.ArgumentParser(
+        description="Answers willson_financial report variants from memory."
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["mysql", "sqlite", "duckdb"],
+        default="mysql",
+        help="Where to load the columns from (default: mysql).",
+    )
+    parser.add_argument("--path", help="The snapshot file of a sqlite or duckdb engine.")
+    parser.add_argument(
+        "--threshold",
+        type=int,
+        nargs="+",
+        default=[DEFAULT_THRESHOLD],
+        help="Transaction count thresholds of the high transaction report.",
+    )
+    parser.add_argument(
+        "--months",
+        type=int,
+        nargs="+",
+        default=[DEFAULT_MONTHS],
+        help="Windows of the new client report, in months.",
+    )
+    parser.add_argument(
+        "--periods",
+        help="Months for the high transaction report, e.g. 2025-01..2025-06 "
+        "(default: the current month).",
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.periods:
+            periods = parse_periods(args.periods)
+        else:
+            today = datetime.date.today()
+            periods = [(today.year, today.month)]
+        backend = get_backend(args.engine, args.path)
+        connection = backend.connect()
+        try:
+            cursor = connection.cursor()
+            start = time.perf_counter()
+            arrays = ReportArrays(cursor, args.batch_size)
+            cursor.close()
+        finally:
+            connection.close()
+    except (ImportError, ValueError) as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+
+    print(
+        f"Loaded {len(arrays.txn_dates):,} Transactions Into "
+        f"{arrays.nbytes / 2**20:.1f} MiB in {time.perf_counter() - start:.2f}s"
+    )
+    print_variants(arrays, args.threshold, args.months, periods)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,499 @@
+"""
+    Title: asset_totals.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Maintains the client_asset_totals summary table.
+
+    The table holds one row per client with the sum and the number of their
+    assets, so the average assets report reads one row per client instead of
+    summing every asset again. A NULL asset_value adds nothing to the sum
+    and is left out of valued_count, so a client whose assets are all NULL
+    is skipped by the average, as SUM and AVG skip them in AVG_ASSETS_REPORT.
+
+    Unlike the transaction rollup, assets are updated and deleted as well as
+    inserted, so there is no high-water mark to refresh from. Triggers on
+    the assets table add and subtract each changed row in the same
+    transaction as the change, which covers ingest.py and every other
+    writer. `rebuild` recomputes the table from the assets table, and
+    `check` compares the two.
+
+    Usage:
+        python asset_totals.py install               # create the table and triggers
+        python asset_totals.py rebuild               # re-sum every asset
+        python asset_totals.py check                 # compare with the assets table
+        python asset_totals.py report --top 10 --percentiles 50,90
+"""
+
+import argparse
+import heapq
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import pooled_connection
+from shared.lazy import lazy_import
+from shared.table_renderer import format_currency, render_rows
+
+mysql = lazy_import("mysql.connector")
+
+CREATE_TOTALS_TABLE = """
+CREATE TABLE client_asset_totals (
+    client_id INT NOT NULL PRIMARY KEY,
+    asset_total DECIMAL(20, 2) NOT NULL,
+    asset_count INT NOT NULL,
+    valued_count INT NOT NULL
+);
+"""
+
+EXISTING_TABLE = """
+SELECT
+    table_name
+FROM
+    information_schema.tables
+WHERE
+    table_schema = DATABASE()
+    AND table_name = 'client_asset_totals';
+"""
+
+EXISTING_TRIGGERS = """
+SELECT
+    trigger_name
+FROM
+    information_schema.triggers
+WHERE
+    trigger_schema = DATABASE()
+    AND event_object_table = 'assets';
+"""
+
+# Adds one asset to its client's row, creating the row for a new client.
+# A NULL value would make the total NULL, so it counts as 0 and is not valued.
+_ADD_ASSET = """
+    INSERT INTO client_asset_totals
+        (client_id, asset_total, asset_count, valued_count)
+    VALUES
+        (NEW.client_id, COALESCE(NEW.asset_value, 0), 1, NEW.asset_value IS NOT NULL)
+    ON DUPLICATE KEY UPDATE
+        asset_total = asset_total + COALESCE(NEW.asset_value, 0),
+        asset_count = asset_count + 1,
+        valued_count = valued_count + (NEW.asset_value IS NOT NULL);
+"""
+
+# Takes one asset off its client's row and drops the row of a client with no
+# assets left, who no longer counts towards the average.
+_REMOVE_ASSET = """
+    UPDATE client_asset_totals
+    SET
+        asset_total = asset_total - COALESCE(OLD.asset_value, 0),
+        asset_count = asset_count - 1,
+        valued_count = valued_count - (OLD.asset_value IS NOT NULL)
+    WHERE
+        client_id = OLD.client_id;
+    DELETE FROM client_asset_totals
+    WHERE
+        client_id = OLD.client_id AND asset_count = 0;
+"""
+
+# Trigger name: CREATE TRIGGER statement. Each runs once per changed row.
+TRIGGERS = {
+    "assets_totals_insert": (
+        "CREATE TRIGGER assets_totals_insert AFTER INSERT ON assets "
+        f"FOR EACH ROW BEGIN {_ADD_ASSET} END"
+    ),
+    "assets_totals_update": (
+        "CREATE TRIGGER assets_totals_update AFTER UPDATE ON assets "
+        f"FOR EACH ROW BEGIN {_REMOVE_ASSET} {_ADD_ASSET} END"
+    ),
+    "assets_totals_delete": (
+        "CREATE TRIGGER assets_totals_delete AFTER DELETE ON assets "
+        f"FOR EACH ROW BEGIN {_REMOVE_ASSET} END"
+    ),
+}
+
+REBUILD_TOTALS = """
+INSERT INTO client_asset_totals (client_id, asset_total, asset_count, valued_count)
+SELECT
+    client_id,
+    COALESCE(SUM(asset_value), 0),
+    COUNT(*),
+    COUNT(asset_value)
+FROM
+    assets
+GROUP BY
+    client_id;
+"""
+
+RAW_ASSET_TOTALS = """
+SELECT
+    client_id,
+    COALESCE(SUM(asset_value), 0),
+    COUNT(*),
+    COUNT(asset_value)
+FROM
+    assets
+GROUP BY
+    client_id;
+"""
+
+SUMMARY_ASSET_TOTALS = """
+SELECT
+    client_id,
+    asset_total,
+    asset_count,
+    valued_count
+FROM
+    client_asset_totals;
+"""
+
+
+class AssetTotals:
+    """
+    Per-client asset totals held in memory with their running sum.
+
+    The average is the running sum over the number of clients with a
+    valued asset, so it costs the same however many assets there are.
+    Top clients and percentiles read the per-client totals, one entry per
+    client. Clients whose assets are all NULL are kept for their count but
+    left out of the average, totals, top clients and percentiles.
+    """
+
+    def __init__(self):
+        # client_id: [asset total, asset count, valued count]
+        self._clients = {}
+        self._sum = 0
+        self._valued_clients = 0
+
+    @classmethod
+    def from_cursor(cls, cursor, query=SUMMARY_ASSET_TOTALS):
+        """
+        Loads the totals from (client_id, total, count, valued count) rows.
+
+        Parameters:
+            - cursor: Database cursor object.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+            - query: The query returning the rows, the summary table by
+              default or RAW_ASSET_TOTALS to sum the assets table.
+            :type query: str
+
+        Returns:
+            - The loaded totals.
+            :rtype: AssetTotals
+        """
+        totals = cls()
+        cursor.execute(query)
+        for client_id, total, count, valued_count in cursor.fetchall():
+            totals.add(client_id, total, count, valued_count)
+        return totals
+
+    def __len__(self):
+        """
+        Returns the number of clients with a valued asset.
+        """
+        return self._valued_clients
+
+    def _change(self, client_id, value, count, valued_count, sign):
+        if valued_count is None:
+            valued_count = 0 if value is None else count
+        entry = self._clients.setdefault(client_id, [0, 0, 0])
+        was_valued = entry[2] > 0
+        value = sign * (value or 0)
+        entry[0] += value
+        entry[1] += sign * count
+        entry[2] += sign * valued_count
+        self._sum += value
+        self._valued_clients += (entry[2] > 0) - was_valued
+        if entry[1] <= 0:
+            del self._clients[client_id]
+
+    def add(self, client_id, value, count=1, valued_count=None):
+        """
+        Adds `count` assets worth `value` in total to a client.
+
+        `value` may be None for a single asset without a value.
+        `valued_count` is the number of those assets with a value, all of
+        them by default unless `value` is None.
+        """
+        self._change(client_id, value, count, valued_count, 1)
+
+    def remove(self, client_id, value, count=1, valued_count=None):
+        """
+        Takes `count` assets worth `value` in total off a client. An update
+        is a removal of the old row followed by an addition of the new one.
+
+        Raises:
+            - KeyError: If the client has no assets.
+        """
+        if client_id not in self._clients:
+            raise KeyError(client_id)
+        self._change(client_id, value, count, valued_count, -1)
+
+    def totals(self):
+        """
+        Returns the asset total of each client with a valued asset.
+
+        Returns:
+            - The totals keyed by client_id.
+            :rtype: dict
+        """
+        return {
+            client_id: entry[0]
+            for client_id, entry in self._clients.items()
+            if entry[2] > 0
+        }
+
+    def average(self):
+        """
+        Averages the total asset value per client, as AVG_ASSETS_REPORT does.
+
+        Returns:
+            - The average, or None when no client has a valued asset.
+            :rtype: decimal.Decimal
+        """
+        if not self._valued_clients:
+            return None
+        # Clients without a valued asset add 0 to the sum
+        return self._sum / self._valued_clients
+
+    def top(self, count):
+        """
+        Returns the clients with the largest totals.
+
+        Returns:
+            - (client_id, total) pairs, largest first.
+            :rtype: list
+        """
+        return heapq.nlargest(count, self.totals().items(), key=lambda item: item[1])
+
+    def percentiles(self, percents):
+        """
+        Returns the per-client totals at the given percentiles.
+
+        Uses the nearest-rank method, so every value is an actual client's
+        total. The totals are sorted once for all the percentiles.
+
+        Parameters:
+            - percents: Percentiles between 0 and 100.
+            :type percents: list
+
+        Returns:
+            - The total at each percentile, None when no client has a
+              valued asset.
+            :rtype: dict
+        """
+        ordered = sorted(self.totals().values())
+        result = {}
+        for percent in percents:
+            if not ordered:
+                result[percent] = None
+                continue
+            rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+            result[percent] = ordered[rank - 1]
+        return result
+
+
+def create_totals_table(cursor):
+    """
+    Creates the summary table and its triggers if they do not exist.
+
+    The table and triggers are looked up first because `IF NOT EXISTS` on an
+    existing one raises a note, which fails with `raise_on_warnings`.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+    Returns:
+        - The names of the triggers that were created.
+        :rtype: list
+    """
+    cursor.execute(EXISTING_TABLE)
+    if not cursor.fetchall():
+        cursor.execute(CREATE_TOTALS_TABLE)
+    cursor.execute(EXISTING_TRIGGERS)
+    existing = {row[0].lower() for row in cursor.fetchall()}
+    created = []
+    for name, statement in TRIGGERS.items():
+        if name not in existing:
+            cursor.execute(statement)
+            created.append(name)
+    return created
+
+
+def rebuild_totals(db):
+    """
+    Recomputes the summary table from the assets table in one transaction.
+
+    INSERT ... SELECT locks the asset rows it reads, so changes made while
+    it runs wait for it and then reach the new rows through the triggers.
+
+    Parameters:
+        - db: Database connection.
+        :type db: mysql.connector.connection.MySQLConnection
+
+    Returns:
+        - The number of clients with assets.
+        :rtype: int
+    """
+    cursor = db.cursor()
+    try:
+        # DELETE rather than TRUNCATE so the rebuild stays in one transaction
+        cursor.execute("DELETE FROM client_asset_totals")
+        cursor.execute(REBUILD_TOTALS)
+        clients = cursor.rowcount
+        db.commit()
+        return clients
+    except mysql.connector.Error:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def check_totals(db):
+    """
+    Compares the summary table against totals taken from the assets table.
+
+    Both are read from one consistent snapshot, so asset changes committed
+    during the check are not reported as differences.
+
+    Parameters:
+        - db: Database connection.
+        :type db: mysql.connector.connection.MySQLConnection
+
+    Returns:
+        - One message per client whose total or either count differs.
+        :rtype: list
+    """
+    db.start_transaction(consistent_snapshot=True, readonly=True)
+    cursor = db.cursor()
+    try:
+        cursor.execute(RAW_ASSET_TOTALS)
+        expected = {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+        cursor.execute(SUMMARY_ASSET_TOTALS)
+        actual = {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+        db.rollback()
+
+    problems = []
+    for client_id in sorted(expected.keys() | actual.keys()):
+        if expected.get(client_id) != actual.get(client_id):
+            problems.append(
+                f"client {client_id}: expected (total, count, valued count) "
+                f"{expected.get(client_id)}, found {actual.get(client_id)}"
+            )
+    return problems
+
+
+def print_totals_report(cursor, top=10, percents=(50, 90, 99), out=None):
+    """
+    Prints the average, percentiles and top clients from the summary table.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - top: The number of largest clients to list.
+        :type top: int
+
+        - percents: The percentiles of the per-client totals to print.
+        :type percents: list
+
+        - out: The stream to write the report to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+    """
+    totals = AssetTotals.from_cursor(cursor)
+    print("\n\n-- CLIENT ASSET TOTALS --", file=out)
+    if not totals:
+        print("No Asset Data Found.", file=out)
+        return
+    print(f"Clients With Asset Values: {len(totals)}", file=out)
+    print(f"Average Client Assets: {format_currency(totals.average())}", file=out)
+    for percent, value in totals.percentiles(percents).items():
+        print(f"P{percent:g} Client Assets: {format_currency(value)}", file=out)
+
+    largest = totals.top(top)
+    if not largest:
+        return
+    placeholders = ", ".join(["%s"] * len(largest))
+    cursor.execute(
+        f"SELECT client_id, name FROM clients WHERE client_id IN ({placeholders})",
+        [client_id for client_id, _ in largest],
+    )
+    names = dict(cursor.fetchall())
+    print(f"\nTop {len(largest)} Clients by Assets:", file=out)
+    render_rows(
+        ["Client", "Total Assets"],
+        [(names.get(client_id), total) for client_id, total in largest],
+        out=out,
+        formatters={"Total Assets": format_currency},
+    )
+
+
+def _percentile_list(text):
+    try:
+        percents = [float(part) for part in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid Percentiles '{text}'") from None
+    if any(not 0 < percent <= 100 for percent in percents):
+        raise argparse.ArgumentTypeError("Percentiles Must Be Above 0 and at Most 100.")
+    return percents
+
+
+def main(argv=None):
+    """
+    Runs a client_asset_totals maintenance command.
+    """
+    parser = argparse.ArgumentParser(
+        description="Maintains the client_asset_totals summary table."
+    )
+    parser.add_argument("command", choices=["install", "rebuild", "check", "report"])
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Clients listed by the report (default: 10).",
+    )
+    parser.add_argument(
+        "--percentiles",
+        type=_percentile_list,
+        default=[50, 90, 99],
+        help="Comma-separated percentiles of the per-client totals printed by "
+        "the report (default: 50,90,99).",
+    )
+    args = parser.parse_args(argv)
+    if args.top < 0:
+        parser.error("--top must not be negative")
+
+    try:
+        with pooled_connection("willson_financial") as db:
+            if args.command == "install":
+                cursor = db.cursor()
+                created = create_totals_table(cursor)
+                cursor.close()
+                for name in created:
+                    print(f"Created Trigger {name}.")
+                # Existing assets are summed once the triggers track new changes
+                print(f"Asset Totals Rebuilt for {rebuild_totals(db)} Clients.")
+            elif args.command == "rebuild":
+                print(f"Asset Totals Rebuilt for {rebuild_totals(db)} Clients.")
+            elif args.command == "check":
+                problems = check_totals(db)
+                for problem in problems:
+                    print(f"***{problem}")
+                if problems:
+                    sys.exit(1)
+                print("Asset Totals Match the Assets Table.")
+            else:
+                cursor = db.cursor()
+                print_totals_report(cursor, args.top, args.percentiles)
+                cursor.close()
+    except mysql.connector.Error as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
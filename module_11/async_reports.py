@@ -0,0 +1,303 @@
+"""
+    Title: async_reports.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: asyncio versions of the willson_financial reports.
+
+    The reports run on an aiomysql connection pool, so many of them can run
+    concurrently on one event loop without blocking it. The report functions
+    return their column names and rows rather than printing, so they can be
+    embedded in an asyncio service. Nothing here prompts for input.
+
+    Requires the optional `aiomysql` package (pip install aiomysql).
+
+    Usage:
+        python async_reports.py --periods 2025-01..2025-03
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from constants import (
+    AVG_ASSETS_REPORT,
+    CURRENCY_COLUMNS,
+    DEFAULT_BATCH_SIZE,
+    FIRST_TXN_DATE,
+    HIGH_TRANSACTION_CLIENTS_REPORT,
+    NEW_CLIENT_REPORT,
+    NEXT_TXN_DATE,
+)
+from periods import month_bounds, parse_periods
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import get_db_config
+from shared.table_renderer import TableRenderer, format_currency, render_rows
+
+try:
+    import aiomysql
+except ImportError:
+    aiomysql = None
+
+DEFAULT_POOL_SIZE = 10
+
+
+async def create_pool(database="willson_financial", maxsize=DEFAULT_POOL_SIZE):
+    """
+    Creates an asyncio connection pool from the usual environment variables.
+
+    Parameters:
+        - database: The database to connect to.
+        :type database: str
+
+        - maxsize: The largest number of open connections.
+        :type maxsize: int
+
+    Returns:
+        - The connection pool.
+        :rtype: aiomysql.Pool
+    """
+    if aiomysql is None:
+        raise ImportError(
+            "The Async Reports Require aiomysql (pip install aiomysql)."
+        )
+    config = get_db_config(database)
+    return await aiomysql.create_pool(
+        host=config["host"],
+        port=config.get("port", 3306),
+        user=config["user"],
+        password=config["password"],
+        db=config["database"],
+        minsize=1,
+        maxsize=maxsize,
+        autocommit=True,
+    )
+
+
+async def _fetch(pool, query, params=None):
+    """
+    Runs a query on a pooled connection and returns the whole result.
+
+    Returns:
+        - The column names and the rows of the result.
+        :rtype: tuple
+    """
+    async with pool.acquire() as connection:
+        async with connection.cursor() as cursor:
+            await cursor.execute(query, params)
+            rows = await cursor.fetchall()
+            return [i[0] for i in cursor.description], list(rows)
+
+
+async def get_new_client_report(pool):
+    """
+    Fetches the number of new clients per month for the last 6 months.
+
+    Parameters:
+        - pool: The connection pool.
+        :type pool: aiomysql.Pool
+
+    Returns:
+        - The column names and the rows of the report.
+        :rtype: tuple
+    """
+    return await _fetch(pool, NEW_CLIENT_REPORT)
+
+
+async def get_avg_assets_report(pool):
+    """
+    Fetches the average total asset value per client.
+
+    Parameters:
+        - pool: The connection pool.
+        :type pool: aiomysql.Pool
+
+    Returns:
+        - The column names and the rows of the report.
+        :rtype: tuple
+    """
+    return await _fetch(pool, AVG_ASSETS_REPORT)
+
+
+async def get_available_dates(pool):
+    """
+    Fetches the years and months that have transactions.
+
+    Parameters:
+        - pool: The connection pool.
+        :type pool: aiomysql.Pool
+
+    Returns:
+        - A dictionary mapping years to a list of months.
+        :rtype: dict
+    """
+    dates = {}
+    async with pool.acquire() as connection:
+        async with connection.cursor() as cursor:
+            await cursor.execute(FIRST_TXN_DATE)
+            (txn_date,) = await cursor.fetchone()
+            while txn_date is not None:
+                dates.setdefault(txn_date.year, []).append(txn_date.month)
+                next_month = month_bounds(txn_date.year, txn_date.month)[1]
+                await cursor.execute(NEXT_TXN_DATE, (next_month,))
+                (txn_date,) = await cursor.fetchone()
+    return dates
+
+
+async def get_high_transaction_clients_report(pool, year, month):
+    """
+    Fetches the clients with more than 10 transactions in a month.
+
+    Parameters:
+        - pool: The connection pool.
+        :type pool: aiomysql.Pool
+
+        - year: The year to filter the report by.
+        :type year: int
+
+        - month: The month to filter the report by.
+        :type month: int
+
+    Returns:
+        - The column names and the rows of the report.
+        :rtype: tuple
+    """
+    return await _fetch(
+        pool, HIGH_TRANSACTION_CLIENTS_REPORT, month_bounds(year, month)
+    )
+
+
+async def iter_table_batches(pool, table_name, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Streams the rows of a table in batches with a server-side cursor.
+
+    Parameters:
+        - pool: The connection pool.
+        :type pool: aiomysql.Pool
+
+        - table_name: The name of the table.
+        :type table_name: str
+
+        - batch_size: The number of rows per batch.
+        :type batch_size: int
+
+    Yields:
+        - The column names and a batch of rows.
+        :rtype: tuple
+    """
+    async with pool.acquire() as connection:
+        async with connection.cursor(aiomysql.SSCursor) as cursor:
+            await cursor.execute(f"SELECT * FROM {table_name}")
+            column_names = [i[0] for i in cursor.description]
+            while rows := await cursor.fetchmany(batch_size):
+                yield column_names, rows
+
+
+async def show_table_data(pool, table_name, batch_size=DEFAULT_BATCH_SIZE, out=None):
+    """
+    Streams a table as a text table without blocking the event loop.
+
+    Parameters:
+        - pool: The connection pool.
+        :type pool: aiomysql.Pool
+
+        - table_name: The name of the table.
+        :type table_name: str
+
+        - batch_size: The number of rows fetched at a time.
+        :type batch_size: int
+
+        - out: The stream to write the table to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+
+    Returns:
+        - The number of rows written.
+        :rtype: int
+    """
+    print(f"\n--- {table_name.upper()} ---", file=out)
+    formatters = {
+        column: format_currency for column in CURRENCY_COLUMNS.get(table_name, ())
+    }
+    renderer = None
+    async for column_names, rows in iter_table_batches(pool, table_name, batch_size):
+        if renderer is None:
+            # The first batch sizes the columns
+            renderer = TableRenderer(
+                column_names, rows, out=out, formatters=formatters
+            )
+            renderer.write_header()
+        renderer.write_rows(rows)
+
+    if renderer is None:
+        print(f"No Data Found in {table_name}.", file=out)
+        return 0
+    return renderer.rows_written
+
+
+async def run_reports(pool, periods):
+    """
+    Runs the aggregate reports for several months concurrently.
+
+    Parameters:
+        - pool: The connection pool.
+        :type pool: aiomysql.Pool
+
+        - periods: The (year, month) pairs for the high transaction report.
+        :type periods: list
+
+    Returns:
+        - The column names and rows of each report, keyed by report name.
+        :rtype: dict
+    """
+    names = ["New Client Report", "Average Assets Report"]
+    tasks = [get_new_client_report(pool), get_avg_assets_report(pool)]
+    for year, month in periods:
+        names.append(f"High Transaction Clients Report For {year}-{month:02d}")
+        tasks.append(get_high_transaction_clients_report(pool, year, month))
+    return dict(zip(names, await asyncio.gather(*tasks)))
+
+
+async def main(argv=None):
+    """
+    Prints the willson_financial reports, running them concurrently.
+    """
+    parser = argparse.ArgumentParser(
+        description="Runs the willson_financial reports on asyncio."
+    )
+    parser.add_argument(
+        "--periods",
+        help="Months for the high transaction clients report, e.g. 2025-01..2025-06 "
+        "(default: every month with transactions).",
+    )
+    args = parser.parse_args(argv)
+    periods = None
+    if args.periods:
+        # Parsed before connecting, so bad input fails fast with a usage error
+        try:
+            periods = parse_periods(args.periods)
+        except ValueError as err:
+            parser.error(str(err))
+
+    pool = await create_pool()
+    try:
+        if periods is None:
+            dates = await get_available_dates(pool)
+            periods = [(year, month) for year in dates for month in dates[year]]
+
+        for name, (columns, rows) in (await run_reports(pool, periods)).items():
+            print(f"\n\n-- {name.upper()} --")
+            if rows:
+                render_rows(
+                    columns, rows, formatters={"Avg Client Assets": format_currency}
+                )
+            else:
+                print("No Data Found.")
+    finally:
+        pool.close()
+        await pool.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
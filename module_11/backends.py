@@ -0,0 +1,193 @@
+"""
+    Title: backends.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Runs the willson_financial report queries on MySQL or on an
+        embedded SQLite or DuckDB snapshot.
+
+    A Backend pairs a way of opening a DB-API connection with the report
+    queries written in its SQL dialect. The MySQL backend uses the shared
+    connection pool; the embedded ones open a local file kept up to date
+    by snapshot.py, so heavy scans run without touching the MySQL primary.
+
+    DuckDB needs the optional `duckdb` package (pip install duckdb).
+"""
+
+import datetime
+import os
+import sqlite3
+import sys
+from decimal import Decimal
+
+from constants import (
+    AVG_ASSETS_REPORT,
+    DUCKDB_NEW_CLIENT_REPORT,
+    FIRST_TXN_DATE,
+    HIGH_TRANSACTION_CLIENTS_REPORT,
+    LAST_TXN_DATE,
+    MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT,
+    NEW_CLIENT_REPORT,
+    NEXT_TXN_DATE,
+    SQLITE_MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT,
+    SQLITE_NEW_CLIENT_REPORT,
+)
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+DIALECTS = ("mysql", "sqlite", "duckdb")
+
+# The report queries by name, as written for MySQL.
+MYSQL_QUERIES = {
+    "new_clients": NEW_CLIENT_REPORT,
+    "avg_assets": AVG_ASSETS_REPORT,
+    "high_transactions": HIGH_TRANSACTION_CLIENTS_REPORT,
+    "multi_period_high_transactions": MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT,
+    "first_txn_date": FIRST_TXN_DATE,
+    "next_txn_date": NEXT_TXN_DATE,
+    "last_txn_date": LAST_TXN_DATE,
+}
+
+
+def _qmark(query):
+    """
+    Rewrites the %s placeholders of a MySQL query to the ? style.
+    """
+    return query.replace("%s", "?")
+
+
+# SQLite and DuckDB both take ? placeholders. Each dialect overrides the
+# queries that use MySQL-only functions and shares the rest.
+DIALECT_QUERIES = {
+    "mysql": MYSQL_QUERIES,
+    "sqlite": {
+        **{name: _qmark(query) for name, query in MYSQL_QUERIES.items()},
+        "new_clients": SQLITE_NEW_CLIENT_REPORT,
+        "multi_period_high_transactions": (
+            SQLITE_MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT
+        ),
+    },
+    "duckdb": {
+        **{name: _qmark(query) for name, query in MYSQL_QUERIES.items()},
+        "new_clients": DUCKDB_NEW_CLIENT_REPORT,
+    },
+}
+
+# Lists the tables of the database, for the embedded engines.
+EXISTING_TABLES = {
+    "sqlite": "SELECT name FROM sqlite_master WHERE type = 'table'",
+    "duckdb": "SELECT table_name FROM information_schema.tables",
+}
+
+
+class Backend:
+    """
+    A database to run the reports on, with the queries in its dialect.
+    """
+
+    def __init__(self, dialect, connect):
+        """
+        Parameters:
+            - dialect: One of `DIALECTS`.
+            :type dialect: str
+
+            - connect: Called with no arguments to open a connection.
+            :type connect: callable
+        """
+        self.dialect = dialect
+        self.queries = DIALECT_QUERIES[dialect]
+        self._connect = connect
+
+    def connect(self):
+        """
+        Opens a DB-API connection to the database.
+
+        Returns:
+            - The connection.
+            :rtype: object
+        """
+        return self._connect()
+
+    def query(self, name):
+        """
+        Returns a report query written for this backend.
+
+        Parameters:
+            - name: The name of the query, e.g. "high_transactions".
+            :type name: str
+
+        Returns:
+            - The SQL text.
+            :rtype: str
+        """
+        return self.queries[name]
+
+    def placeholders(self, count):
+        """
+        Returns `count` comma separated parameter placeholders.
+        """
+        marker = "%s" if self.dialect == "mysql" else "?"
+        return ", ".join([marker] * count)
+
+    def existing_tables(self, cursor):
+        """
+        Returns the names of the tables in an embedded database.
+
+        Parameters:
+            - cursor: Cursor on a connection from `connect`.
+            :type cursor: object
+
+        Returns:
+            - The table names.
+            :rtype: set
+        """
+        cursor.execute(EXISTING_TABLES[self.dialect])
+        return {name for (name,) in cursor.fetchall()}
+
+
+def _connect_sqlite(path):
+    # Decimals are stored as numbers and dates as ISO text, the forms the
+    # SQLite dialect of the reports compares and sums
+    sqlite3.register_adapter(Decimal, str)
+    sqlite3.register_adapter(datetime.date, datetime.date.isoformat)
+    return sqlite3.connect(path)
+
+
+def _connect_duckdb(path):
+    try:
+        import duckdb
+    except ImportError:
+        raise ImportError(
+            "The DuckDB Backend Requires duckdb (pip install duckdb)."
+        ) from None
+    return duckdb.connect(path)
+
+
+def get_backend(dialect, path=None, database="willson_financial"):
+    """
+    Returns the backend for a dialect.
+
+    Parameters:
+        - dialect: One of `DIALECTS`.
+        :type dialect: str
+
+        - path: The snapshot file of an embedded backend.
+        :type path: str
+
+        - database: The MySQL database of the mysql backend.
+        :type database: str
+
+    Returns:
+        - The backend.
+        :rtype: Backend
+    """
+    if dialect == "mysql":
+        from shared.connection import get_connection
+
+        return Backend("mysql", lambda: get_connection(database))
+    if path is None:
+        raise ValueError(f"The {dialect} Backend Needs a Snapshot File")
+    if dialect == "sqlite":
+        return Backend("sqlite", lambda: _connect_sqlite(path))
+    if dialect == "duckdb":
+        return Backend("duckdb", lambda: _connect_duckdb(path))
+    raise ValueError(f"Unknown Backend '{dialect}'")
@@ -0,0 +1,90 @@
+"""
+    Title: cli.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Single entry point for the willson_financial report commands.
+
+    Only the module of the chosen command is imported, and the MySQL driver
+    and `.env` file are only loaded once that command needs a connection,
+    so short-lived scheduled runs do not pay for the other commands.
+
+    `--dry-run` runs a command up to the point where it would open its first
+    connection: arguments parsed, `.env` loaded and the driver imported.
+
+    Usage:
+        python cli.py display --periods 2025-01..2025-03
+        python cli.py snapshot sync --engine duckdb
+        python cli.py --dry-run rollup check
+        python cli.py <command> --help
+"""
+
+import importlib
+import os
+import sys
+
+# Command: (module, description)
+COMMANDS = {
+    "display": ("display_data", "Print the tables and reports."),
+    "async": ("async_reports", "Run the reports concurrently on asyncio."),
+    "snapshot": ("snapshot", "Sync or report from a local SQLite/DuckDB snapshot."),
+    "analytics": ("analytics", "Answer report variants from NumPy arrays."),
+    "rollup": ("rollup", "Maintain the monthly transaction count rollup."),
+    "totals": ("asset_totals", "Maintain and report the client asset totals."),
+    "migrate": ("migrations", "Create the report indexes or check query plans."),
+    "ingest": ("ingest", "Bulk load records from a CSV file."),
+    "serve": ("report_service", "Serve the reports from memory over HTTP."),
+    "scan": ("partitioned_scan", "Dump or aggregate a table in parallel partitions."),
+}
+
+
+def print_usage(out=None):
+    """
+    Prints the available commands.
+    """
+    print(
+        "Usage: python cli.py [--dry-run] <command> [options]\n\nCommands:", file=out
+    )
+    for command, (_, description) in COMMANDS.items():
+        print(f"    {command:<12} {description}", file=out)
+
+
+def main(argv=None):
+    """
+    Runs the command named by the first argument with the remaining ones.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    dry_run = bool(argv) and argv[0] == "--dry-run"
+    if dry_run:
+        argv = argv[1:]
+    if not argv or argv[0] in ("-h", "--help"):
+        print_usage()
+        return
+    command, *arguments = argv
+    if command not in COMMANDS:
+        print(f"Error: Unknown Command '{command}'\n", file=sys.stderr)
+        print_usage(sys.stderr)
+        sys.exit(2)
+
+    # The command modules import their siblings by name
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    if dry_run:
+        os.environ["DB_DRY_RUN"] = "1"
+    module = importlib.import_module(COMMANDS[command][0])
+
+    from shared.connection import DryRun
+
+    try:
+        result = module.main(arguments)
+        if command == "async":
+            import asyncio
+
+            asyncio.run(result)
+    except DryRun:
+        print(f"Dry Run: '{command}' Stopped Before Connecting.")
+        return
+    if dry_run:
+        print(f"Dry Run: '{command}' Finished Without Connecting.")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,34 @@
     Description: Contains constants for the willson_financial database.
 """
 
+# The number of rows fetched per round trip when streaming table data.
+# Large enough to amortize network latency, small enough to keep memory flat.
+DEFAULT_BATCH_SIZE = 1000
+
+# The columns shown as currency when the tables are displayed. The values are
+# formatted on the client while rendering, so they stay numeric on the wire.
+CURRENCY_COLUMNS = {
+    "assets": ["asset_value"],
+    "transactions": ["amount"],
+    "billings": ["bill_amount"],
+}
+
+# SQL Logic: This query reads the columns of every table in the current database in one
+# round trip, in the order they appear in each table.
+SCHEMA_COLUMNS = """
+SELECT
+    table_name,
+    column_name,
+    data_type
+FROM
+    information_schema.columns
+WHERE
+    table_schema = DATABASE()
+ORDER BY
+    table_name,
+    ordinal_position;
+"""
+
 # SQL Logic: This query counts clients, grouping them by the year and the month they were added.
 # It then filters the results to show only the last six months.
 # The query uses the client_id and date_added columns from the clients table.
@@ -25,13 +53,17 @@ ORDER BY
     MONTH(date_added);
 """
 
+# Seconds a cached NEW_CLIENT_REPORT result stays valid. New clients are added
+# a few times a day, so an hour old count is still accurate enough.
+NEW_CLIENT_REPORT_TTL = 60 * 60
+
 # SQL Logic: This query calculates the average total asset value per client.
 # It does this by first grouping the assets table by client_id and summing the asset_value for each.
-# Then it calculates the average of these totals.
+# Then it calculates the average of these totals, which is formatted as currency by the client.
 # The query uses the client_id and asset_value columns from the assets table.
 AVG_ASSETS_REPORT = """
 SELECT
-    CONCAT('$', FORMAT(AVG(total_assets_per_client), 2, 'en_US')) AS 'Avg Client Assets'
+    AVG(total_assets_per_client) AS 'Avg Client Assets'
 FROM (
     SELECT
         client_id,
@@ -43,11 +75,29 @@ FROM (
     ) AS client_asset_totals;
 """
 
+# Seconds a cached AVG_ASSETS_REPORT result stays valid. Asset values are
+# updated in bulk, so the average changes slowly.
+AVG_ASSETS_REPORT_TTL = 60 * 60
+
+# SQL Logic: This query is AVG_ASSETS_REPORT read from the client_asset_totals summary table
+# maintained by asset_totals.py instead of re-summing the raw assets table.
+# The summary holds one row per client with assets, so this reads one row per client.
+# Clients whose assets are all NULL are skipped, as AVG skips their NULL sum above.
+AVG_ASSETS_TOTALS_REPORT = """
+SELECT
+    AVG(asset_total) AS 'Avg Client Assets'
+FROM
+    client_asset_totals
+WHERE
+    valued_count > 0;
+"""
+
 # SQL Logic: This query generates a report of clients with more than 10 transactions in a
 # specific month and year.
 # It joins the transactions and clients tables on the client_id column.
-# It filters the results to show only the transactions from the specified year and month.
-# It groups the results by client name and counts the number of transactions for each client.
+# It filters the results to the half-open range [first day of the month, first day of the
+# next month), so the txn_date column is compared directly and an index on it can be used.
+# It groups the results by client and counts the number of transactions for each client.
 # The query uses the client_id, name, transaction_id, txn_date columns from the transactions
 # and clients tables.
 # It orders the results by the transaction count in descending order.
@@ -60,11 +110,211 @@ FROM
 JOIN
     clients AS c ON t.client_id = c.client_id
 WHERE
-    YEAR(t.txn_date) = %s AND MONTH(t.txn_date) = %s
+    t.txn_date >= %s AND t.txn_date < %s
+GROUP BY
+    c.client_id,
+    c.name
+HAVING
+    COUNT(t.transaction_id) > 10
+ORDER BY
+    COUNT(t.transaction_id) DESC;
+"""
+
+# SQL Logic: These queries find the months that have transactions without scanning the table.
+# Each one is a single seek on the txn_date index for the first transaction on or after a
+# date, so listing the available months costs one lookup per month instead of a full scan.
+FIRST_TXN_DATE = """
+SELECT
+    MIN(txn_date)
+FROM
+    transactions;
+"""
+
+NEXT_TXN_DATE = """
+SELECT
+    MIN(txn_date)
+FROM
+    transactions
+WHERE
+    txn_date >= %s;
+"""
+
+# SQL Logic: This query is HIGH_TRANSACTION_CLIENTS_REPORT read from the client_month_txn_counts
+# summary table maintained by rollup.py instead of the raw transactions table.
+# It reads one row per client for the selected month through the primary key of the summary.
+HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT = """
+SELECT
+    c.name AS 'Client',
+    r.txn_count AS 'Transaction Count'
+FROM
+    client_month_txn_counts r
+JOIN
+    clients AS c ON r.client_id = c.client_id
+WHERE
+    r.txn_year = %s AND r.txn_month = %s AND r.txn_count > 10
+ORDER BY
+    r.txn_count DESC;
+"""
+
+# SQL Logic: This query lists the months that have transactions from the summary table.
+# The year and month lead the primary key, so this is an index-only scan of a small table.
+AVAILABLE_DATES_ROLLUP = """
+SELECT DISTINCT
+    txn_year,
+    txn_month
+FROM
+    client_month_txn_counts
+ORDER BY
+    txn_year,
+    txn_month;
+"""
+
+# SQL Logic: This query is HIGH_TRANSACTION_CLIENTS_REPORT for several months in one round trip.
+# It filters the transactions to the half-open range spanning every requested month and groups
+# them by year, month and client, so each month's report can be split out of one result set.
+# It orders the results by month and then by the transaction count in descending order.
+MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT = """
+SELECT
+    YEAR(t.txn_date) AS 'Year',
+    MONTH(t.txn_date) AS 'Month',
+    c.name AS 'Client',
+    COUNT(t.transaction_id) AS 'Transaction Count'
+FROM
+    transactions t
+JOIN
+    clients AS c ON t.client_id = c.client_id
+WHERE
+    t.txn_date >= %s AND t.txn_date < %s
+GROUP BY
+    YEAR(t.txn_date),
+    MONTH(t.txn_date),
+    c.client_id,
+    c.name
+HAVING
+    COUNT(t.transaction_id) > 10
+ORDER BY
+    YEAR(t.txn_date),
+    MONTH(t.txn_date),
+    COUNT(t.transaction_id) DESC;
+"""
+
+# SQL Logic: This query is MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT read from the
+# client_month_txn_counts summary table. The months between the first and the last are spelled
+# out per column, because MySQL does not range-optimize inequalities on row constructors such
+# as (txn_year, txn_month) >= (y, m). Written this way the bounds are ranges on the leading
+# primary key columns of the summary. Parameters come from periods.rollup_period_bounds.
+MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT = """
+SELECT
+    r.txn_year AS 'Year',
+    r.txn_month AS 'Month',
+    c.name AS 'Client',
+    r.txn_count AS 'Transaction Count'
+FROM
+    client_month_txn_counts r
+JOIN
+    clients AS c ON r.client_id = c.client_id
+WHERE
+    (r.txn_year > %s OR (r.txn_year = %s AND r.txn_month >= %s))
+    AND (r.txn_year < %s OR (r.txn_year = %s AND r.txn_month <= %s))
+    AND r.txn_count > 10
+ORDER BY
+    r.txn_year,
+    r.txn_month,
+    r.txn_count DESC;
+"""
+
+# SQL Logic: This query returns the date of the latest transaction, a single seek on the
+# txn_date index. The snapshot reports default to the month it falls in.
+LAST_TXN_DATE = """
+SELECT
+    MAX(txn_date)
+FROM
+    transactions;
+"""
+
+# SQL Logic: This query reads the columns of one table with their full MySQL types and
+# whether they belong to the primary key, in table order. The snapshot sync uses it to
+# create a matching table in the embedded engine and to find the column it syncs by.
+SNAPSHOT_COLUMNS = """
+SELECT
+    column_name,
+    column_type,
+    column_key
+FROM
+    information_schema.columns
+WHERE
+    table_schema = DATABASE()
+    AND table_name = %s
+ORDER BY
+    ordinal_position;
+"""
+
+# The queries below are the reports in the dialects of the embedded engines used for
+# offline reporting (see backends.py). Queries that are the same in every dialect are
+# shared and only have their %s placeholders rewritten to ?.
+
+# SQL Logic: This query is NEW_CLIENT_REPORT for SQLite, which has no YEAR(), MONTH() or
+# DATE_SUB(). Dates are stored as ISO text, so strftime extracts the year and month and
+# date('now', '-6 months') gives the start of the window.
+SQLITE_NEW_CLIENT_REPORT = """
+SELECT
+    CAST(strftime('%m', date_added) AS INTEGER) AS 'Month',
+    CAST(strftime('%Y', date_added) AS INTEGER) AS 'Year',
+    COUNT(client_id) AS 'New Clients'
+FROM
+    clients
+WHERE
+    date_added >= date('now', '-6 months')
+GROUP BY
+    2,
+    1
+ORDER BY
+    2,
+    1;
+"""
+
+# SQL Logic: This query is NEW_CLIENT_REPORT for DuckDB, which has YEAR() and MONTH() but
+# subtracts an interval from CURRENT_DATE instead of calling DATE_SUB().
+DUCKDB_NEW_CLIENT_REPORT = """
+SELECT
+    MONTH(date_added) AS 'Month',
+    YEAR(date_added) AS 'Year',
+    COUNT(client_id) AS 'New Clients'
+FROM
+    clients
+WHERE
+    date_added >= CURRENT_DATE - INTERVAL 6 MONTH
+GROUP BY
+    YEAR(date_added),
+    MONTH(date_added)
+ORDER BY
+    Year,
+    MONTH(date_added);
+"""
+
+# SQL Logic: This query is MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT for SQLite, taking the
+# year and month from the ISO date text with strftime.
+SQLITE_MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT = """
+SELECT
+    CAST(strftime('%Y', t.txn_date) AS INTEGER) AS 'Year',
+    CAST(strftime('%m', t.txn_date) AS INTEGER) AS 'Month',
+    c.name AS 'Client',
+    COUNT(t.transaction_id) AS 'Transaction Count'
+FROM
+    transactions t
+JOIN
+    clients AS c ON t.client_id = c.client_id
+WHERE
+    t.txn_date >= ? AND t.txn_date < ?
 GROUP BY
+    1,
+    2,
+    c.client_id,
     c.name
 HAVING
-    COUNT(t.transaction_id) > 10 
+    COUNT(t.transaction_id) > 10
 ORDER BY
-    'Transaction Count' DESC;
+    1,
+    2,
+    COUNT(t.transaction_id) DESC;
 """
@@ -5,132 +5,297 @@
     Description: Displays data from the willson_financial database.
 """
 
+import argparse
+import functools
 import os
-import mysql.connector
+import sys
 from constants import (
+    DEFAULT_BATCH_SIZE,
     NEW_CLIENT_REPORT,
+    NEW_CLIENT_REPORT_TTL,
     AVG_ASSETS_REPORT,
+    AVG_ASSETS_REPORT_TTL,
+    AVG_ASSETS_TOTALS_REPORT,
+    AVAILABLE_DATES_ROLLUP,
+    FIRST_TXN_DATE,
     HIGH_TRANSACTION_CLIENTS_REPORT,
+    HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT,
+    MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT,
+    MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT,
+    NEXT_TXN_DATE,
 )
-from mysql.connector import errorcode
-from dotenv import load_dotenv
+from periods import month_bounds, parse_periods, rollup_period_bounds
+from report_cache import ReportCache
+from report_runner import DEFAULT_MAX_WORKERS, Report, run_reports
+from schema_cache import schema_cache
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import (
+    POOL_MAX_SIZE,
+    get_connection,
+    get_db_config,
+    get_pool,
+    has_credentials,
+)
+from shared.export import add_export_arguments, exporter_from_args
+from shared.keyset import add_browse_arguments, browse_table, pager_from_args
+from shared.lazy import lazy_import
+from shared.prepared import prepared_statements
+from shared.profiling import (
+    add_profile_arguments,
+    finish_profile,
+    profiler_from_args,
+)
+from shared.table_renderer import format_currency, render_cursor, render_rows
 
-load_dotenv()
+# The driver is loaded on first use, so --help and argument errors skip it
+mysql = lazy_import("mysql.connector")
 
 
-def show_table_data(cursor, table_name):
+def show_table_data(
+    cursor, table_name, batch_size=DEFAULT_BATCH_SIZE, out=None, exporter=None
+):
     """
     Function to display all data from a table with dynamic formatting.
 
+    Rows are streamed from the server in batches of `batch_size` with
+    `fetchmany`, so memory stays flat regardless of the table size and the
+    first rows are printed as soon as they arrive.
+
     Parameters:
-        - cursor: Database cursor object.
+        - cursor: Unbuffered database cursor object.
         :type cursor: mysql.connector.cursor.MySQLCursor
 
         - table_name: The name of the table to display data from.
         :type table_name: str
+
+        - batch_size: The number of rows to fetch per round trip.
+        :type batch_size: int
+
+        - out: The stream to write the report to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+
+        - exporter: Writes the report to a file instead of printing it.
+        :type exporter: shared.export.Exporter
     """
-    print(f"\n--- {table_name.upper()} ---")
+    print(f"\n--- {table_name.upper()} ---", file=out)
     try:
-        currency_columns = {
-            "assets": ["asset_value"],
-            "transactions": ["amount"],
-            "billings": ["bill_amount"],
+        if exporter is not None:
+            cursor.execute(f"SELECT * FROM {table_name}")
+            print_export(*exporter.export_cursor(cursor, table_name, batch_size), out)
+            return
+
+        # Currency columns are formatted while rendering rather than with
+        # FORMAT() in SQL, so MySQL sends the raw numbers
+        formatters = {
+            column: format_currency
+            for column in schema_cache.currency_columns(cursor, table_name)
         }
 
-        if table_name in currency_columns:
-            cols_to_format = currency_columns[table_name]
-            cursor.execute(f"SHOW COLUMNS FROM {table_name}")
-            all_columns = [col[0] for col in cursor.fetchall()]
-
-            select_expressions = []
-            for col in all_columns:
-                if col in cols_to_format:
-                    select_expressions.append(
-                        f"CONCAT('$', FORMAT({col}, 2, 'en_US')) AS {col}"
-                    )
-                else:
-                    select_expressions.append(col)
-
-            query = f"SELECT {', '.join(select_expressions)} FROM {table_name}"
-        else:
-            query = f"SELECT * FROM {table_name}"
+        cursor.execute(f"SELECT * FROM {table_name}")
+        if not render_cursor(cursor, batch_size, out=out, formatters=formatters):
+            print(f"No Data Found in {table_name}.", file=out)
 
-        cursor.execute(query)
-        rows = cursor.fetchall()
+    except mysql.connector.Error as err:
+        print(f"Error Fetching Data from {table_name}: {err}", file=out)
 
-        if not rows:
-            print(f"No Data Found in {table_name}.")
-            return
 
-        column_names = [i[0] for i in cursor.description]
+def fetch_report_rows(cursor, query, params=(), cache=None, ttl=0):
+    """
+    Runs a report query, or reads its result from the cache when one is given.
 
-        header = " | ".join(f"{name:<20}" for name in column_names)
-        print(header)
-        print("-" * len(header))
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
 
-        for row in rows:
-            row_data = " | ".join(f"{str(item):<20}" for item in row)
-            print(row_data)
+        - query: The report SQL.
+        :type query: str
+
+        - params: The query parameters.
+        :type params: tuple
+
+        - cache: The result cache to read from, optional.
+        :type cache: report_cache.ReportCache
+
+        - ttl: The number of seconds a cached result stays valid.
+        :type ttl: float
+
+    Returns:
+        - The column names, the rows and the cursor description of the
+          report.
+        :rtype: tuple
+    """
+    if cache is not None:
+        return cache.fetch(cursor, query, params, ttl)
+    cursor.execute(query, params)
+    rows = cursor.fetchall()
+    return [i[0] for i in cursor.description], rows, cursor.description
 
-    except mysql.connector.Error as err:
-        print(f"Error Fetching Data from {table_name}: {err}")
 
+def execute_report_query(cursor, query, params, statements=None):
+    """
+    Runs a parameterized report query, as a prepared statement if possible.
+
+    Parameters:
+        - cursor: Database cursor object, used when no registry is given.
+        :type cursor: mysql.connector.cursor.MySQLCursor
 
-def get_new_client_report(cursor):
+        - query: The report SQL.
+        :type query: str
+
+        - params: The query parameters.
+        :type params: tuple
+
+        - statements: The prepared statement registry of the connection.
+        :type statements: shared.prepared.PreparedStatements
+
+    Returns:
+        - The cursor holding the results.
+        :rtype: mysql.connector.cursor.MySQLCursor
+    """
+    if statements is None:
+        cursor.execute(query, params)
+        return cursor
+    return statements.execute(query, params)
+
+
+def print_export(path, count, out=None):
+    """
+    Prints where a report was exported to.
+
+    Parameters:
+        - path: The file the report was written to.
+        :type path: str
+
+        - count: The number of rows written.
+        :type count: int
+
+        - out: The stream to write to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+    """
+    print(f"Exported {count} Rows to {path}", file=out)
+
+
+def get_new_client_report(cursor, out=None, cache=None, exporter=None):
     """
     Generates a report on new clients per month for the last 6 months.
 
     Parameters:
         - cursor: Database cursor object.
         :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - out: The stream to write the report to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+
+        - cache: The result cache to read from, optional.
+        :type cache: report_cache.ReportCache
+
+        - exporter: Writes the report to a file instead of printing it.
+        :type exporter: shared.export.Exporter
     """
-    print("\n\n-- NEW CLIENT REPORT --")
+    print("\n\n-- NEW CLIENT REPORT --", file=out)
     try:
-        cursor.execute(NEW_CLIENT_REPORT)
-        rows = cursor.fetchall()
+        columns, rows, description = fetch_report_rows(
+            cursor, NEW_CLIENT_REPORT, cache=cache, ttl=NEW_CLIENT_REPORT_TTL
+        )
+        if exporter is not None:
+            print_export(
+                *exporter.export_rows("New Client Report", columns, rows, description),
+                out,
+            )
+            return
         for row in rows:
-            print(f"Month: {row[0]}, Year: {row[1]}, New Clients: {row[2]}")
+            print(f"Month: {row[0]}, Year: {row[1]}, New Clients: {row[2]}", file=out)
     except mysql.connector.Error as err:
-        print(f"Error Fetching New Client Report: {err}")
+        print(f"Error Fetching New Client Report: {err}", file=out)
 
 
-def get_avg_assets_report(cursor):
+def get_avg_assets_report(
+    cursor, out=None, cache=None, exporter=None, use_totals=False
+):
     """
     Generates a report on the average total asset value per client.
 
     Parameters:
         - cursor: Database cursor object.
         :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - out: The stream to write the report to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+
+        - cache: The result cache to read from, optional.
+        :type cache: report_cache.ReportCache
+
+        - exporter: Writes the report to a file instead of printing it.
+        :type exporter: shared.export.Exporter
+
+        - use_totals: Whether to read from the client_asset_totals summary
+          table, which is current without caching.
+        :type use_totals: bool
     """
-    print("\n\n-- AVERAGE ASSETS REPORT --")
+    print("\n\n-- AVERAGE ASSETS REPORT --", file=out)
     try:
-        cursor.execute(AVG_ASSETS_REPORT)
-        rows = cursor.fetchall()
+        if use_totals:
+            columns, rows, description = fetch_report_rows(
+                cursor, AVG_ASSETS_TOTALS_REPORT
+            )
+        else:
+            columns, rows, description = fetch_report_rows(
+                cursor, AVG_ASSETS_REPORT, cache=cache, ttl=AVG_ASSETS_REPORT_TTL
+            )
+        if exporter is not None:
+            print_export(
+                *exporter.export_rows(
+                    "Average Assets Report", columns, rows, description
+                ),
+                out,
+            )
+            return
         for row in rows:
-            print(f"Average Client Assets: {row[0]}")
+            print(f"Average Client Assets: {format_currency(row[0])}", file=out)
     except mysql.connector.Error as err:
-        print(f"Error Fetching Average Assets Report: {err}")
+        print(f"Error Fetching Average Assets Report: {err}", file=out)
 
 
-def get_available_dates(cursor):
+def get_available_dates(cursor, use_rollup=False, statements=None):
     """
     Fetches distinct years and months from the transactions table.
 
+    Rather than scanning every transaction, this skips from month to month
+    with one index seek per month that has data, or reads the months from
+    the client_month_txn_counts summary table.
+
     Parameters:
         - cursor: Database cursor object.
 
+        - use_rollup: Whether to read from the summary table.
+        :type use_rollup: bool
+
+        - statements: Runs the per-month seek as a prepared statement.
+        :type statements: shared.prepared.PreparedStatements
+
     Returns:
         A dictionary mapping years to a list of months.
     """
     try:
-        cursor.execute(
-            "SELECT DISTINCT YEAR(txn_date), MONTH(txn_date) FROM transactions ORDER BY 1, 2"
-        )
+        if use_rollup:
+            cursor.execute(AVAILABLE_DATES_ROLLUP)
+            dates = {}
+            for year, month in cursor.fetchall():
+                dates.setdefault(year, []).append(month)
+            return dates
+
+        cursor.execute(FIRST_TXN_DATE)
+        txn_date = cursor.fetchone()[0]
         dates = {}
-        for year, month in cursor.fetchall():
-            if year not in dates:
-                dates[year] = []
-            dates[year].append(month)
+        while txn_date is not None:
+            dates.setdefault(txn_date.year, []).append(txn_date.month)
+            next_month = month_bounds(txn_date.year, txn_date.month)[1]
+            results = execute_report_query(
+                cursor, NEXT_TXN_DATE, (next_month,), statements
+            )
+            txn_date = results.fetchall()[0][0]
         return dates
     except mysql.connector.Error as err:
         print(f"Error Fetching Available Dates: {err}")
@@ -184,7 +349,9 @@ def prompt_for_date(available_dates):
     return year, month
 
 
-def get_high_transaction_clients_report(cursor, year, month):
+def get_high_transaction_clients_report(
+    cursor, year, month, out=None, use_rollup=False, exporter=None, statements=None
+):
     """
     Generates a report on clients with the highest number of transactions.
 
@@ -197,77 +364,351 @@ def get_high_transaction_clients_report(cursor, year, month):
 
         - month: The month to filter the report by.
         :type month: int
+
+        - out: The stream to write the report to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+
+        - use_rollup: Whether to read from the client_month_txn_counts summary
+          table instead of counting the raw transactions.
+        :type use_rollup: bool
+
+        - exporter: Writes the report to a file instead of printing it.
+        :type exporter: shared.export.Exporter
+
+        - statements: Runs the report as a prepared statement.
+        :type statements: shared.prepared.PreparedStatements
     """
-    print(f"\n\n-- HIGH TRANSACTION CLIENTS REPORT FOR {year}-{month:02d} --")
+    print(f"\n\n-- HIGH TRANSACTION CLIENTS REPORT FOR {year}-{month:02d} --", file=out)
     try:
-        cursor.execute(HIGH_TRANSACTION_CLIENTS_REPORT, (year, month))
+        if use_rollup:
+            cursor = execute_report_query(
+                cursor,
+                HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT,
+                (year, month),
+                statements,
+            )
+        else:
+            cursor = execute_report_query(
+                cursor,
+                HIGH_TRANSACTION_CLIENTS_REPORT,
+                month_bounds(year, month),
+                statements,
+            )
+
+        if exporter is not None:
+            name = f"High Transaction Clients {year}-{month:02d}"
+            print_export(*exporter.export_cursor(cursor, name), out)
+            return
 
         result_found = False
         while True:
-            if rows := cursor.fetchall():
+            if render_cursor(cursor, out=out):
                 result_found = True
-                columns = [i[0] for i in cursor.description]
-                print(" | ".join(f"{col:<25}" for col in columns))
-                print("-" * (28 * len(columns)))
-                for row in rows:
-                    print(" | ".join(f"{str(item):<25}" for item in row))
-                print("\n")
-
-            if not cursor.nextset():
+                print("\n", file=out)
+
+            # A prepared statement returns a single result set
+            if statements is not None or not cursor.nextset():
                 break
 
         if not result_found:
             print(
-                f"No Clients Found with More than 10 Transactions in {year}-{month:02d}.\n"
+                f"No Clients Found with More than 10 Transactions in {year}-{month:02d}.\n",
+                file=out,
             )
 
     except mysql.connector.Error as err:
-        print(f"Error Fetching High Transaction Clients Report: {err}")
+        print(f"Error Fetching High Transaction Clients Report: {err}", file=out)
 
 
-def main():
+def get_high_transaction_clients_multi_report(
+    cursor, periods, out=None, use_rollup=False, exporter=None, statements=None
+):
+    """
+    Generates the high transaction clients report for several months at once.
+
+    Every month is computed by a single grouped query, and the rows are then
+    split into one report per month.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - periods: The (year, month) pairs to report on, in order.
+        :type periods: list
+
+        - out: The stream to write the report to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+
+        - use_rollup: Whether to read from the client_month_txn_counts summary
+          table instead of counting the raw transactions.
+        :type use_rollup: bool
+
+        - exporter: Writes the report to a file instead of printing it.
+        :type exporter: shared.export.Exporter
+
+        - statements: Runs the report as a prepared statement.
+        :type statements: shared.prepared.PreparedStatements
+    """
+    try:
+        if use_rollup:
+            cursor = execute_report_query(
+                cursor,
+                MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT,
+                rollup_period_bounds(periods[0], periods[-1]),
+                statements,
+            )
+        else:
+            cursor = execute_report_query(
+                cursor,
+                MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT,
+                (month_bounds(*periods[0])[0], month_bounds(*periods[-1])[1]),
+                statements,
+            )
+        description = cursor.description[2:]
+        columns = [i[0] for i in description]
+
+        rows_by_period = {}
+        for row in cursor.fetchall():
+            rows_by_period.setdefault((row[0], row[1]), []).append(row[2:])
+
+    except mysql.connector.Error as err:
+        print(f"Error Fetching High Transaction Clients Report: {err}", file=out)
+        return
+
+    for year, month in periods:
+        print(
+            f"\n\n-- HIGH TRANSACTION CLIENTS REPORT FOR {year}-{month:02d} --",
+            file=out,
+        )
+        rows = rows_by_period.get((year, month), [])
+        if exporter is not None:
+            name = f"High Transaction Clients {year}-{month:02d}"
+            print_export(
+                *exporter.export_rows(name, columns, rows, description), out
+            )
+        elif rows:
+            render_rows(columns, rows, out=out)
+            print("\n", file=out)
+        else:
+            print(
+                f"No Clients Found with More than 10 Transactions in {year}-{month:02d}.\n",
+                file=out,
+            )
+
+
+def parse_args(argv=None):
+    """
+    Parses the command line arguments.
+
+    Parameters:
+        - argv: The arguments to parse, defaults to `sys.argv[1:]`.
+        :type argv: list
+
+    Returns:
+        - The parsed arguments.
+        :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="Displays data from the willson_financial database."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows fetched per round trip when streaming tables (default: {DEFAULT_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Reports run concurrently, each on its own connection. "
+        f"Use 1 to run them one after another (default: {DEFAULT_MAX_WORKERS}).",
+    )
+    parser.add_argument(
+        "--cache-file",
+        default=os.getenv("REPORT_CACHE_FILE"),
+        help="SQLite file that keeps aggregate report results between runs "
+        "(default: $REPORT_CACHE_FILE, in memory only if unset). Results are "
+        "unpickled, so only use a file you created.",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Invalidate every cached report result before running.",
+    )
+    parser.add_argument(
+        "--rollup",
+        action="store_true",
+        help="Refresh the client_month_txn_counts summary table and read the "
+        "high transaction clients report from it.",
+    )
+    parser.add_argument(
+        "--asset-totals",
+        action="store_true",
+        help="Read the average assets report from the client_asset_totals "
+        "summary table kept by asset_totals.py.",
+    )
+    parser.add_argument(
+        "--periods",
+        help="Months for the high transaction clients report, e.g. "
+        "2025-01..2025-06 or 2025-01,2025-03. Skips the interactive month picker.",
+    )
+    add_export_arguments(parser)
+    add_profile_arguments(parser)
+    add_browse_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.periods:
+        try:
+            args.periods = parse_periods(args.periods)
+        except ValueError as err:
+            parser.error(str(err))
+    # One pool connection is kept for picking the report date
+    if not 1 <= args.max_workers < POOL_MAX_SIZE:
+        parser.error(f"--max-workers must be between 1 and {POOL_MAX_SIZE - 1}")
+    return args
+
+
+def main(argv=None):
     """
     Main Function to Connect to the Database and Display Table Data.
     """
+    args = parse_args(argv)
     db = None
     cursor = None
+    profiler = None
+    cache = ReportCache(path=args.cache_file)
+    if args.clear_cache:
+        cache.invalidate()
     try:
-        db_user = os.getenv("DB_USER")
-        db_password = os.getenv("DB_PASSWORD")
-        db_host = os.getenv("DB_HOST", "localhost")
+        config = get_db_config("willson_financial")
 
-        if not db_user or not db_password:
+        if not has_credentials(config):
             print(
                 "Error: Database Credentials (DB_USER, DB_PASSWORD) Not Found in .env File."
             )
             return
 
-        config = {
-            "user": db_user,
-            "password": db_password,
-            "host": db_host,
-            "database": "willson_financial",
-            "raise_on_warnings": True,
-        }
+        # None unless a --profile option was given, so nothing is wrapped
+        profiler = profiler_from_args(args)
 
-        db = mysql.connector.connect(**config)
-        cursor = db.cursor()
+        # One connection per worker plus the one used to pick the report date.
+        # The pool opens all of them when it is created.
+        if profiler is not None:
+            with profiler.phase("connect"):
+                get_pool("willson_financial", pool_size=args.max_workers + 1)
+                db = get_connection("willson_financial")
+            cursor = profiler.wrap_cursor(db.cursor())
+        else:
+            get_pool("willson_financial", pool_size=args.max_workers + 1)
+            db = get_connection("willson_financial")
+            cursor = db.cursor()
 
         print("Successfully Connected to the 'willson_financial' Database.")
 
-        tables_to_show = ["clients", "assets", "transactions", "billings"]
-        for table in tables_to_show:
-            show_table_data(cursor, table)
+        if args.browse:
+            # Pages are read by primary key, so any page costs the same
+            try:
+                pager = pager_from_args(cursor, args)
+            except ValueError as err:
+                print(f"Error: {err}")
+                return
+            formatters = {
+                column: format_currency
+                for column in schema_cache.currency_columns(cursor, args.browse)
+            }
+            browse_table(pager, functools.partial(render_rows, formatters=formatters))
+            return
+
+        if args.rollup:
+            from rollup import refresh_rollup
+
+            # Only transactions added since the last refresh are counted
+            refresh_rollup(db)
+
+        # The date is picked up front so every report can be started at once
+        if args.periods:
+            year, month = None, None
+        else:
+            # The month seek runs once per month, so it is prepared once
+            available_dates = get_available_dates(
+                cursor,
+                use_rollup=args.rollup,
+                statements=prepared_statements(
+                    db, profiler.wrap_cursor if profiler is not None else None
+                ),
+            )
+            year, month = prompt_for_date(available_dates)
 
-        get_new_client_report(cursor)
-        get_avg_assets_report(cursor)
+        # None prints text tables, otherwise every report is written to a file
+        exporter = exporter_from_args(args)
+
+        tables_to_show = ["clients", "assets", "transactions", "billings"]
+        reports = [
+            Report(
+                f"Table: {table}",
+                functools.partial(show_table_data, exporter=exporter),
+                table,
+                args.batch_size,
+            )
+            for table in tables_to_show
+        ]
+        reports.append(
+            Report(
+                "New Client Report",
+                functools.partial(
+                    get_new_client_report, cache=cache, exporter=exporter
+                ),
+            )
+        )
+        reports.append(
+            Report(
+                "Average Assets Report",
+                functools.partial(
+                    get_avg_assets_report,
+                    cache=cache,
+                    exporter=exporter,
+                    use_totals=args.asset_totals,
+                ),
+            )
+        )
+        if args.periods:
+            reports.append(
+                Report(
+                    "High Transaction Clients Report",
+                    functools.partial(
+                        get_high_transaction_clients_multi_report,
+                        use_rollup=args.rollup,
+                        exporter=exporter,
+                    ),
+                    args.periods,
+                    prepared=True,
+                )
+            )
+        elif year is not None:
+            reports.append(
+                Report(
+                    "High Transaction Clients Report",
+                    functools.partial(
+                        get_high_transaction_clients_report,
+                        use_rollup=args.rollup,
+                        exporter=exporter,
+                    ),
+                    year,
+                    month,
+                    prepared=True,
+                )
+            )
 
-        available_dates = get_available_dates(cursor)
-        year, month = prompt_for_date(available_dates)
+        run_reports(reports, "willson_financial", args.max_workers, profiler)
 
-        get_high_transaction_clients_report(cursor, year, month)
+        stats = cache.stats()
+        print(f"\nReport Cache: {stats['hits']} Hits, {stats['misses']} Misses")
 
     except mysql.connector.Error as err:
+        from mysql.connector import errorcode
+
         if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
             print("Something Is Wrong With Your User Name Or Password")
         elif err.errno == errorcode.ER_BAD_DB_ERROR:
@@ -275,6 +716,8 @@ def main():
         else:
             print(f"Error: {err}")
     finally:
+        cache.close()
+        finish_profile(profiler, args)
         if cursor:
             cursor.close()
         if db and db.is_connected():
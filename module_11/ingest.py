@@ -0,0 +1,114 @@
+"""
+    Title: ingest.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Bulk loads records into the willson_financial database.
+
+    The CSV header names the columns to fill, and each one must be a column
+    of the table. For assets, transactions and billings, a client_name
+    column may be given instead of client_id, and each distinct name is
+    resolved to its client_id once. A name shared by several clients is
+    rejected rather than loaded against one of them; use a client_id column
+    for those files, which takes precedence over client_name.
+
+    Usage:
+        python ingest.py transactions transactions.csv [--chunk-size 1000]
+"""
+
+import argparse
+import os
+import sys
+from itertools import chain
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.bulk_insert import (
+    DEFAULT_CHUNK_SIZE,
+    ForeignKeyLookup,
+    bulk_insert,
+    read_csv_rows,
+)
+from shared.connection import pooled_connection
+from shared.lazy import lazy_import
+
+mysql = lazy_import("mysql.connector")
+
+INGEST_TABLES = ["clients", "assets", "transactions", "billings"]
+
+
+def ingest_records(db, table_name, records, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Inserts records into one of the willson_financial tables.
+
+    Parameters:
+        - db: Database connection.
+        :type db: mysql.connector.connection.MySQLConnection
+
+        - table_name: The table to insert into.
+        :type table_name: str
+
+        - records: The records to insert, as dictionaries keyed by column.
+        :type records: iterable
+
+        - chunk_size: The number of records inserted and committed together.
+        :type chunk_size: int
+
+    Returns:
+        - The number of records inserted.
+        :rtype: int
+    """
+    if table_name not in INGEST_TABLES:
+        raise ValueError(f"Unknown Table '{table_name}'")
+
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return 0
+
+    columns = list(first)
+    lookups = {}
+    if table_name != "clients" and "client_name" in columns:
+        columns.remove("client_name")
+        # A client_id column wins, so it can be used where names are ambiguous
+        if "client_id" not in columns:
+            columns.append("client_id")
+            lookups["client_id"] = (
+                "client_name",
+                ForeignKeyLookup("clients", "client_id", "name"),
+            )
+
+    return bulk_insert(
+        db,
+        table_name,
+        columns,
+        chain([first], records),
+        lookups=lookups,
+        chunk_size=chunk_size,
+    )
+
+
+def main(argv=None):
+    """
+    Loads records from a CSV file into a willson_financial table.
+    """
+    parser = argparse.ArgumentParser(
+        description="Bulk loads willson_financial records from a CSV file."
+    )
+    parser.add_argument("table", choices=INGEST_TABLES)
+    parser.add_argument("csv_file")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    try:
+        with pooled_connection("willson_financial") as db:
+            count = ingest_records(
+                db, args.table, read_csv_rows(args.csv_file), args.chunk_size
+            )
+        print(f"Inserted {count} Rows Into {args.table}.")
+    except (mysql.connector.Error, ValueError) as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
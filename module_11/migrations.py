@@ -0,0 +1,212 @@
+"""
+    Title: migrations.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Creates the indexes the willson_financial reports rely on and
+        checks with EXPLAIN that the report queries use them.
+
+    Usage:
+        python migrations.py            # create any missing indexes
+        python migrations.py --check    # fail if a report query misses its index
+"""
+
+import argparse
+import datetime
+import os
+import sys
+
+from constants import (
+    FIRST_TXN_DATE,
+    HIGH_TRANSACTION_CLIENTS_REPORT,
+    MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT,
+    NEW_CLIENT_REPORT,
+    NEXT_TXN_DATE,
+)
+from periods import month_bounds
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import pooled_connection
+from shared.lazy import lazy_import
+
+mysql = lazy_import("mysql.connector")
+
+# Index name: (table, indexed columns)
+REPORT_INDEXES = {
+    # Range scans on txn_date for one month; client_id makes the index
+    # covering for the per-client transaction counts.
+    "idx_transactions_txn_date_client": ("transactions", "txn_date, client_id"),
+    # Range scan on date_added for the last six months of new clients.
+    "idx_clients_date_added": ("clients", "date_added"),
+}
+
+EXISTING_INDEXES = """
+SELECT DISTINCT
+    table_name,
+    index_name
+FROM
+    information_schema.statistics
+WHERE
+    table_schema = DATABASE();
+"""
+
+
+def create_indexes(cursor):
+    """
+    Creates the report indexes that do not exist yet.
+
+    Indexes are added online, so the tables stay readable and writable
+    while they are built.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+    Returns:
+        - The names of the indexes that were created.
+        :rtype: list
+    """
+    cursor.execute(EXISTING_INDEXES)
+    existing = {(table.lower(), index.lower()) for table, index in cursor.fetchall()}
+
+    created = []
+    for index_name, (table_name, columns) in REPORT_INDEXES.items():
+        if (table_name, index_name) in existing:
+            continue
+        cursor.execute(
+            f"ALTER TABLE {table_name} ADD INDEX {index_name} ({columns}), "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        created.append(index_name)
+    return created
+
+
+# Access types that read only the matching part of an index. An index scan
+# (`index`) reads all of it and is no better than a table scan here.
+INDEX_ACCESS_TYPES = ("range", "ref", "eq_ref", "const")
+
+
+def report_queries():
+    """
+    Returns the report queries to check, with sample parameters and the
+    index each one should read its filtered table through. The table is
+    named as EXPLAIN shows it, i.e. by its alias in the query.
+
+    Returns:
+        - Pairs of report name and (query, parameters, (table, index)).
+        :rtype: dict
+    """
+    today = datetime.date.today()
+    transactions_index = ("transactions", "idx_transactions_txn_date_client")
+    # The high transaction clients reports alias transactions as t
+    aliased_transactions_index = ("t", "idx_transactions_txn_date_client")
+    return {
+        "NEW_CLIENT_REPORT": (
+            NEW_CLIENT_REPORT,
+            (),
+            ("clients", "idx_clients_date_added"),
+        ),
+        "HIGH_TRANSACTION_CLIENTS_REPORT": (
+            HIGH_TRANSACTION_CLIENTS_REPORT,
+            month_bounds(today.year, today.month),
+            aliased_transactions_index,
+        ),
+        "MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT": (
+            MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT,
+            (
+                month_bounds(today.year, 1)[0],
+                month_bounds(today.year, today.month)[1],
+            ),
+            aliased_transactions_index,
+        ),
+        "FIRST_TXN_DATE": (FIRST_TXN_DATE, (), transactions_index),
+        "NEXT_TXN_DATE": (
+            NEXT_TXN_DATE,
+            (today.replace(day=1),),
+            transactions_index,
+        ),
+    }
+
+
+def check_query_plans(cursor):
+    """
+    Runs EXPLAIN on each report query and collects plans that miss an index.
+
+    The filtered table of each query must be read with a range or lookup on
+    its report index; MIN() queries may instead be answered from the index
+    alone ("Select tables optimized away"). Any other table read with
+    access type `ALL` is a full table scan. Note that on very small tables
+    the optimizer may prefer a scan even when the index exists, so run this
+    against realistic data.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+    Returns:
+        - One message per plan that misses its index, empty if every query
+          is index-driven.
+        :rtype: list
+    """
+    problems = []
+    for name, (query, params, (table, index)) in report_queries().items():
+        cursor.execute(f"EXPLAIN {query.strip().rstrip(';')}", params)
+        columns = [i[0] for i in cursor.description]
+        plans = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        optimized_away = False
+        table_found = False
+        for plan in plans:
+            access_type = plan.get("type")
+            print(
+                f"{name:<45} {str(plan.get('table')):<15} "
+                f"{str(access_type):<8} {plan.get('key')}"
+            )
+            if "optimized away" in str(plan.get("Extra") or ""):
+                optimized_away = True
+            if plan.get("table") == table:
+                table_found = True
+                if access_type not in INDEX_ACCESS_TYPES or plan.get("key") != index:
+                    problems.append(
+                        f"{name}: {table} read with {access_type} on "
+                        f"{plan.get('key')}, expected range or ref on {index}"
+                    )
+            elif access_type == "ALL":
+                problems.append(f"{name}: full table scan of {plan.get('table')}")
+        if not table_found and not optimized_away:
+            problems.append(f"{name}: {table} not found in the plan")
+    return problems
+
+
+def main(argv=None):
+    """
+    Creates the report indexes, or checks the report query plans.
+    """
+    parser = argparse.ArgumentParser(description="Report index migrations.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if a report query does not read its table through its index.",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        with pooled_connection("willson_financial") as db:
+            cursor = db.cursor()
+            if args.check:
+                problems = check_query_plans(cursor)
+                for problem in problems:
+                    print(f"***{problem}")
+                if problems:
+                    sys.exit(1)
+                print("\nEvery Report Query Uses an Index.")
+            else:
+                created = create_indexes(cursor)
+                print(f"Created Indexes: {', '.join(created) or 'None'}")
+            cursor.close()
+    except mysql.connector.Error as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,558 @@
+"""
+    Title: partitioned_scan.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Scans a table in partitions on a pool of processes.
+
+    A single Python process decodes rows on one core, so a full-table read
+    is bound by that core long before MySQL is. Here the table is split into
+    primary key ranges, or into the months found by `get_available_dates`,
+    and each partition is read on its own connection in its own process.
+
+    - Dumps: every worker writes its partition to a part file and the parts
+      are concatenated in partition order, so no rows pass through the
+      parent process. With key ranges the output is in primary key order.
+    - Aggregates: every worker returns the count, sum, minimum and maximum
+      of its partition, which are combined into the table totals. The
+      average client assets are combined from per-partition sums and client
+      counts, with partitions on client_id so no client is split.
+
+    Throughput grows with --processes until the server or the network is
+    saturated. Each process keeps one connection, so the server must allow
+    that many.
+
+    Usage:
+        python partitioned_scan.py dump transactions --by month --processes 8 \
+            --output transactions.csv
+        python partitioned_scan.py aggregate transactions amount --partitions 32
+        python partitioned_scan.py avg-assets --processes 4
+"""
+
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+from constants import DEFAULT_BATCH_SIZE
+from periods import month_bounds
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import (
+    get_db_config,
+    get_pool,
+    has_credentials,
+    pooled_connection,
+    reset_pools,
+)
+from shared.export import WRITERS
+from shared.lazy import lazy_import
+from shared.table_renderer import format_currency
+
+mysql = lazy_import("mysql.connector")
+
+DATABASE = "willson_financial"
+
+DEFAULT_PROCESSES = os.cpu_count() or 4
+
+# Partitions per process for key ranges, so a slow partition does not leave
+# the other processes idle at the end of the scan.
+PARTITIONS_PER_PROCESS = 4
+
+# The formats whose part files can be joined by concatenation.
+DUMP_FORMATS = ("csv", "jsonl")
+
+# The date column used to split a table by month. The months are those of
+# the transactions, so only that table can be split this way.
+DATE_COLUMNS = {"transactions": "txn_date"}
+
+PRIMARY_KEY_RANGE = "SELECT MIN({key}), MAX({key}) FROM {table}"
+
+PRIMARY_KEY_COLUMN = """
+SELECT
+    column_name
+FROM
+    information_schema.statistics
+WHERE
+    table_schema = DATABASE()
+    AND table_name = %s
+    AND index_name = 'PRIMARY'
+ORDER BY
+    seq_in_index;
+"""
+
+PARTIAL_AGGREGATE = (
+    "SELECT COUNT({column}), SUM({column}), MIN({column}), MAX({column}) "
+    "FROM {table} WHERE {condition}"
+)
+
+# AVG_ASSETS_REPORT averages the per-client totals, which is the sum of every
+# asset over the number of clients whose total is not NULL.
+PARTIAL_AVG_ASSETS = (
+    "SELECT SUM(asset_value), "
+    "COUNT(DISTINCT CASE WHEN asset_value IS NOT NULL THEN client_id END) "
+    "FROM assets WHERE {condition}"
+)
+
+_IDENTIFIER = re.compile(r"^\w+$")
+
+
+def _check_identifier(name):
+    """
+    Makes sure a table or column name can be put into SQL as is.
+    """
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid Name '{name}'.")
+    return name
+
+
+class Partition:
+    """
+    One range of a table, as a WHERE condition and its parameters.
+    """
+
+    __slots__ = ("label", "condition", "params")
+
+    def __init__(self, label, condition, params):
+        self.label = label
+        self.condition = condition
+        self.params = params
+
+
+def primary_key(cursor, table):
+    """
+    Returns the single-column primary key of a table.
+
+    Raises:
+        - ValueError: If the table has no primary key or a composite one.
+    """
+    cursor.execute(PRIMARY_KEY_COLUMN, (table,))
+    columns = [row[0] for row in cursor.fetchall()]
+    if len(columns) != 1:
+        raise ValueError(f"Table '{table}' Needs a Single-Column Primary Key.")
+    return columns[0]
+
+
+def key_partitions(cursor, table, count, key=None):
+    """
+    Splits a table into equal-width ranges of an integer key.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - table: The table to split.
+        :type table: str
+
+        - count: The number of partitions.
+        :type count: int
+
+        - key: The integer column to split on, defaults to the primary key.
+        :type key: str
+
+    Returns:
+        - The partitions in key order; empty for an empty table.
+        :rtype: list
+    """
+    key = _check_identifier(key or primary_key(cursor, table))
+    cursor.execute(PRIMARY_KEY_RANGE.format(key=key, table=_check_identifier(table)))
+    low, high = cursor.fetchall()[0]
+    if low is None:
+        return []
+    if not isinstance(low, int):
+        raise ValueError(f"Column '{key}' of {table} Is Not an Integer Key.")
+    width = max(1, -(-(high - low + 1) // count))
+    partitions = []
+    for start in range(low, high + 1, width):
+        end = min(start + width, high + 1)
+        partitions.append(
+            Partition(
+                f"{key} {start}..{end - 1}",
+                f"{key} >= %s AND {key} < %s",
+                (start, end),
+            )
+        )
+    return partitions
+
+
+def month_partitions(cursor, table):
+    """
+    Splits a table into the months that have transactions.
+
+    The months are found with the per-month index seeks of
+    `display_data.get_available_dates`.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - table: The table to split, one of DATE_COLUMNS. Rows with a NULL
+          date are in no partition.
+        :type table: str
+
+    Returns:
+        - One partition per month, in order.
+        :rtype: list
+    """
+    from display_data import get_available_dates
+
+    if table not in DATE_COLUMNS:
+        raise ValueError(f"Table '{table}' Has No Date Column to Split by Month.")
+    column = DATE_COLUMNS[table]
+    dates = get_available_dates(cursor)
+    return [
+        Partition(
+            f"{year}-{month:02d}",
+            f"{column} >= %s AND {column} < %s",
+            month_bounds(year, month),
+        )
+        for year in sorted(dates)
+        for month in sorted(dates[year])
+    ]
+
+
+def _init_worker(database):
+    """
+    Creates the connection pool of a worker process, with one connection.
+    """
+    # A forked worker must not share the connections of the parent's pool
+    reset_pools()
+    get_pool(database, pool_size=1)
+
+
+def _dump_partition(
+    database, table, partition, order, path, export_format, batch_size
+):
+    """
+    Writes one partition to a part file, in a worker process.
+
+    Returns:
+        - The number of rows written.
+        :rtype: int
+    """
+    with pooled_connection(database) as db:
+        cursor = db.cursor()
+        try:
+            query = f"SELECT * FROM {table} WHERE {partition.condition}"
+            if order:
+                query += f" ORDER BY {order}"
+            cursor.execute(query, partition.params)
+            writer = WRITERS[export_format](path, [i[0] for i in cursor.description])
+            count = 0
+            try:
+                while rows := cursor.fetchmany(batch_size):
+                    writer.write_batch(rows)
+                    count += len(rows)
+            finally:
+                writer.close()
+        finally:
+            cursor.close()
+    return count
+
+
+def _aggregate_partition(database, query, params):
+    """
+    Runs a partial aggregate of one partition, in a worker process.
+
+    Returns:
+        - The single row of the aggregate.
+        :rtype: tuple
+    """
+    with pooled_connection(database) as db:
+        cursor = db.cursor()
+        try:
+            cursor.execute(query, params)
+            return tuple(cursor.fetchall()[0])
+        finally:
+            cursor.close()
+
+
+def _concatenate(part_paths, path, export_format):
+    """
+    Joins the part files in order, keeping only the first CSV header.
+    """
+    with open(path, "wb") as output:
+        for index, part_path in enumerate(part_paths):
+            with open(part_path, "rb") as part:
+                if export_format == "csv" and index > 0:
+                    part.readline()
+                shutil.copyfileobj(part, output)
+
+
+def scan_dump(
+    table,
+    partitions,
+    path,
+    export_format="csv",
+    processes=DEFAULT_PROCESSES,
+    batch_size=DEFAULT_BATCH_SIZE,
+    order=None,
+    database=DATABASE,
+):
+    """
+    Dumps a table to one file, reading its partitions in parallel.
+
+    Parameters:
+        - table: The table to dump.
+        :type table: str
+
+        - partitions: The partitions, in output order.
+        :type partitions: list
+
+        - path: The file to write.
+        :type path: str
+
+        - export_format: "csv" or "jsonl".
+        :type export_format: str
+
+        - processes: The number of worker processes.
+        :type processes: int
+
+        - batch_size: The number of rows fetched per round trip.
+        :type batch_size: int
+
+        - order: The ORDER BY of each partition, so the concatenated output
+          is ordered as well.
+        :type order: str
+
+        - database: The database to read from.
+        :type database: str
+
+    Returns:
+        - The number of rows written.
+        :rtype: int
+    """
+    if export_format not in DUMP_FORMATS:
+        raise ValueError(f"Partitioned Dumps Support {', '.join(DUMP_FORMATS)}.")
+    _check_identifier(table)
+    if order:
+        _check_identifier(order)
+    # Next to the output, so the parts are on the same disk
+    part_dir = tempfile.mkdtemp(
+        prefix=f"{table}-parts-", dir=os.path.dirname(path) or "."
+    )
+    part_paths = [
+        os.path.join(part_dir, f"part-{index:05d}.{export_format}")
+        for index in range(len(partitions))
+    ]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=_init_worker, initargs=(database,)
+        ) as executor:
+            counts = executor.map(
+                _dump_partition,
+                [database] * len(partitions),
+                [table] * len(partitions),
+                partitions,
+                [order] * len(partitions),
+                part_paths,
+                [export_format] * len(partitions),
+                [batch_size] * len(partitions),
+            )
+            total = sum(counts)
+        _concatenate(part_paths, path, export_format)
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+    return total
+
+
+def _map_partial(query, partitions, processes, database):
+    """
+    Runs a partial aggregate query on every partition in parallel.
+    """
+    with ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker, initargs=(database,)
+    ) as executor:
+        return list(
+            executor.map(
+                _aggregate_partition,
+                [database] * len(partitions),
+                [query.format(condition=p.condition) for p in partitions],
+                [p.params for p in partitions],
+            )
+        )
+
+
+def scan_aggregate(
+    table, column, partitions, processes=DEFAULT_PROCESSES, database=DATABASE
+):
+    """
+    Computes the count, sum, average, minimum and maximum of a column.
+
+    Parameters:
+        - table: The table to scan.
+        :type table: str
+
+        - column: The numeric column to aggregate.
+        :type column: str
+
+        - partitions: The partitions covering the table.
+        :type partitions: list
+
+        - processes: The number of worker processes.
+        :type processes: int
+
+        - database: The database to read from.
+        :type database: str
+
+    Returns:
+        - The combined aggregates, with None for those of no rows.
+        :rtype: dict
+    """
+    query = PARTIAL_AGGREGATE.format(
+        column=_check_identifier(column),
+        table=_check_identifier(table),
+        condition="{condition}",
+    )
+    partials = _map_partial(query, partitions, processes, database)
+    count = sum(partial[0] for partial in partials)
+    sums = [partial[1] for partial in partials if partial[1] is not None]
+    minimums = [partial[2] for partial in partials if partial[2] is not None]
+    maximums = [partial[3] for partial in partials if partial[3] is not None]
+    total = sum(sums) if sums else None
+    return {
+        "count": count,
+        "sum": total,
+        "avg": total / count if count else None,
+        "min": min(minimums) if minimums else None,
+        "max": max(maximums) if maximums else None,
+    }
+
+
+def scan_avg_assets(partitions, processes=DEFAULT_PROCESSES, database=DATABASE):
+    """
+    Computes AVG_ASSETS_REPORT from partial sums and client counts.
+
+    Parameters:
+        - partitions: Partitions of the assets table on client_id, so every
+          client falls in exactly one of them.
+        :type partitions: list
+
+    Returns:
+        - The average total assets per client, or None without assets.
+        :rtype: decimal.Decimal
+    """
+    partials = _map_partial(PARTIAL_AVG_ASSETS, partitions, processes, database)
+    clients = sum(partial[1] for partial in partials)
+    total = sum(
+        (partial[0] for partial in partials if partial[0] is not None), Decimal(0)
+    )
+    return total / clients if clients else None
+
+
+def main(argv=None):
+    """
+    Runs a partitioned dump or aggregate.
+    """
+    # Accepted after any command
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--processes", type=int, default=DEFAULT_PROCESSES)
+    common.add_argument(
+        "--partitions",
+        type=int,
+        help="Number of key ranges (default: "
+        f"{PARTITIONS_PER_PROCESS} per process). Ignored with --by month.",
+    )
+    common.add_argument(
+        "--by",
+        choices=["key", "month"],
+        default="key",
+        help="Split on primary key ranges or on the months of the transactions.",
+    )
+
+    parser = argparse.ArgumentParser(
+        description="Scans a willson_financial table in partitions on several "
+        "processes."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    dump = commands.add_parser(
+        "dump", parents=[common], help="Write a table to one file."
+    )
+    dump.add_argument("table")
+    dump.add_argument("--output", required=True)
+    dump.add_argument("--format", choices=DUMP_FORMATS, default="csv")
+    dump.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    aggregate = commands.add_parser(
+        "aggregate",
+        parents=[common],
+        help="Count, sum, average, min and max of a column.",
+    )
+    aggregate.add_argument("table")
+    aggregate.add_argument("column")
+
+    commands.add_parser(
+        "avg-assets",
+        parents=[common],
+        help="The Average Assets Report, on client_id ranges.",
+    )
+    args = parser.parse_args(argv)
+    if args.processes < 1:
+        parser.error("--processes must be at least 1")
+    partition_count = args.partitions or args.processes * PARTITIONS_PER_PROCESS
+
+    if not has_credentials(get_db_config(DATABASE)):
+        print(
+            "Error: Database Credentials (DB_USER, DB_PASSWORD) Not Found in .env File."
+        )
+        sys.exit(1)
+
+    table = "assets" if args.command == "avg-assets" else args.table
+    try:
+        with pooled_connection(DATABASE) as db:
+            cursor = db.cursor()
+            try:
+                if args.command == "avg-assets":
+                    # Whole clients per partition, so their totals are not split
+                    partitions = key_partitions(
+                        cursor, "assets", partition_count, "client_id"
+                    )
+                elif args.by == "month":
+                    partitions = month_partitions(cursor, table)
+                else:
+                    partitions = key_partitions(cursor, table, partition_count)
+                order = primary_key(cursor, table) if args.command == "dump" else None
+            finally:
+                cursor.close()
+
+        start = time.perf_counter()
+        if args.command == "dump":
+            rows = scan_dump(
+                table,
+                partitions,
+                args.output,
+                args.format,
+                args.processes,
+                args.batch_size,
+                order,
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"Wrote {rows:,} Rows of {table} to {args.output} in {elapsed:.2f}s "
+                f"({rows / elapsed if elapsed else 0:,.0f} Rows/s, "
+                f"{len(partitions)} Partitions, {args.processes} Processes)."
+            )
+        elif args.command == "aggregate":
+            result = scan_aggregate(table, args.column, partitions, args.processes)
+            for name, value in result.items():
+                print(f"{name:<6} {value}")
+            elapsed = time.perf_counter() - start
+            print(f"\n{len(partitions)} Partitions in {elapsed:.2f}s")
+        else:
+            average = scan_avg_assets(partitions, args.processes)
+            print(f"Average Client Assets: {format_currency(average)}")
+            elapsed = time.perf_counter() - start
+            print(f"\n{len(partitions)} Partitions in {elapsed:.2f}s")
+    except (mysql.connector.Error, ValueError) as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
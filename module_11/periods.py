@@ -0,0 +1,112 @@
+"""
+    Title: periods.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Helpers for turning report months into date ranges.
+"""
+
+import datetime
+
+# The years a month may fall in; the month after the last must still be a
+# valid date for month_bounds.
+MIN_YEAR = 1
+MAX_YEAR = 9998
+
+
+def month_bounds(year, month):
+    """
+    Returns the half-open date range covering a month.
+
+    Filtering with `txn_date >= start AND txn_date < end` lets MySQL use an
+    index on the date column, which `YEAR(txn_date) = ...` does not.
+
+    Parameters:
+        - year: The year of the month.
+        :type year: int
+
+        - month: The month, from 1 to 12.
+        :type month: int
+
+    Returns:
+        - The first day of the month and the first day of the next month.
+        :rtype: tuple
+    """
+    start = datetime.date(year, month, 1)
+    if month == 12:
+        return start, datetime.date(year + 1, 1, 1)
+    return start, datetime.date(year, month + 1, 1)
+
+
+def rollup_period_bounds(first, last):
+    """
+    Returns the parameters of the rollup query covering two months.
+
+    Parameters:
+        - first: The (year, month) of the first month.
+        :type first: tuple
+
+        - last: The (year, month) of the last month.
+        :type last: tuple
+
+    Returns:
+        - The lower bound as year, year, month followed by the upper bound
+          the same way, for MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT.
+        :rtype: tuple
+    """
+    (first_year, first_month), (last_year, last_month) = first, last
+    return (first_year, first_year, first_month, last_year, last_year, last_month)
+
+
+def _parse_month(text):
+    """
+    Parses a `YYYY-MM` month.
+
+    Parameters:
+        - text: The month to parse.
+        :type text: str
+
+    Returns:
+        - The year and the month.
+        :rtype: tuple
+    """
+    try:
+        year, month = (int(part) for part in text.strip().split("-"))
+    except ValueError:
+        raise ValueError(f"Invalid Month '{text}', Expected YYYY-MM.") from None
+    if not 1 <= month <= 12:
+        raise ValueError(f"Invalid Month '{text}', Expected YYYY-MM.")
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise ValueError(
+            f"Invalid Month '{text}', the Year Must Be {MIN_YEAR} to {MAX_YEAR}."
+        )
+    return year, month
+
+
+def parse_periods(text):
+    """
+    Parses a list of report months.
+
+    Accepts comma-separated months and inclusive ranges, for example
+    `2025-01..2025-06` or `2024-12,2025-02..2025-03`.
+
+    Parameters:
+        - text: The periods to parse.
+        :type text: str
+
+    Returns:
+        - The distinct (year, month) pairs in chronological order.
+        :rtype: list
+    """
+    periods = set()
+    for part in text.split(","):
+        if ".." in part:
+            first, last = (_parse_month(month) for month in part.split("..", 1))
+            if first > last:
+                raise ValueError(f"Invalid Range '{part}', Start Is After End.")
+            year, month = first
+            while (year, month) <= last:
+                periods.add((year, month))
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        else:
+            periods.add(_parse_month(part))
+    return sorted(periods)
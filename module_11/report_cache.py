@@ -0,0 +1,244 @@
+"""
+    Title: report_cache.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: TTL result cache for the willson_financial reports.
+
+    Results are keyed on the query text and its parameters. Entries live in
+    an in-memory LRU and, when a file is given, in a local SQLite database so
+    that repeated runs of the script within the TTL skip MySQL entirely.
+
+    Rows are stored column-wise (see shared/columnar.py), so a cached result
+    takes a fraction of the memory of the fetched tuples.
+
+    The cache file holds pickled results and is unpickled when read, which
+    can run arbitrary code. Only point it at a file this user created, never
+    at one from an untrusted or shared location.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.columnar import ColumnarRows
+
+DEFAULT_MAX_ENTRIES = 128
+
+# Part of every key, so results stored in another layout by an older
+# version are never read back.
+CACHE_FORMAT = 2
+
+
+class ReportCache:
+    """
+    Least-recently-used cache of query results with a per-entry TTL.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, path=None):
+        """
+        Parameters:
+            - max_entries: The number of results kept in memory.
+            :type max_entries: int
+
+            - path: The SQLite file backing the cache, optional. Its results
+              are unpickled, so it must not come from an untrusted location.
+            :type path: str
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = None
+        if path:
+            self._store = sqlite3.connect(path, check_same_thread=False)
+            self._store.execute(
+                "CREATE TABLE IF NOT EXISTS report_cache ("
+                "cache_key TEXT PRIMARY KEY, expires_at REAL, result BLOB)"
+            )
+            self._store.commit()
+
+    @staticmethod
+    def make_key(query, params=()):
+        """
+        Builds the cache key for a query and its parameters.
+
+        Parameters:
+            - query: The SQL text.
+            :type query: str
+
+            - params: The query parameters.
+            :type params: tuple
+
+        Returns:
+            - The cache key.
+            :rtype: str
+        """
+        key = repr((CACHE_FORMAT, query, tuple(params)))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key):
+        """
+        Returns a cached result, or None if it is missing or expired.
+
+        Parameters:
+            - key: The cache key.
+            :type key: str
+
+        Returns:
+            - The cached result.
+            :rtype: object
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._store is not None:
+                row = self._store.execute(
+                    "SELECT expires_at, result FROM report_cache WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], pickle.loads(row[1]))
+                    self._remember(key, entry)
+
+            if entry is not None and entry[0] <= now:
+                # Dropped so a long-running process does not keep stale results
+                del self._entries[key]
+                if self._store is not None:
+                    self._store.execute(
+                        "DELETE FROM report_cache WHERE cache_key = ?", (key,)
+                    )
+                    self._store.commit()
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, result, ttl):
+        """
+        Stores a result for `ttl` seconds.
+
+        Parameters:
+            - key: The cache key.
+            :type key: str
+
+            - result: The result to store.
+            :type result: object
+
+            - ttl: The number of seconds the result stays valid.
+            :type ttl: float
+        """
+        entry = (time.time() + ttl, result)
+        with self._lock:
+            self._remember(key, entry)
+            if self._store is not None:
+                self._store.execute(
+                    "DELETE FROM report_cache WHERE expires_at <= ?", (time.time(),)
+                )
+                self._store.execute(
+                    "REPLACE INTO report_cache VALUES (?, ?, ?)",
+                    (key, entry[0], pickle.dumps(result)),
+                )
+                self._store.commit()
+
+    def _remember(self, key, entry):
+        """
+        Adds an entry to the in-memory LRU, evicting the oldest if full.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, query=None, params=()):
+        """
+        Drops the cached result of one query, or every result.
+
+        Parameters:
+            - query: The SQL text to invalidate, all queries if omitted.
+            :type query: str
+
+            - params: The query parameters.
+            :type params: tuple
+        """
+        with self._lock:
+            if query is None:
+                self._entries.clear()
+                if self._store is not None:
+                    self._store.execute("DELETE FROM report_cache")
+            else:
+                key = self.make_key(query, params)
+                self._entries.pop(key, None)
+                if self._store is not None:
+                    self._store.execute(
+                        "DELETE FROM report_cache WHERE cache_key = ?", (key,)
+                    )
+            if self._store is not None:
+                self._store.commit()
+
+    def fetch(self, cursor, query, params=(), ttl=0):
+        """
+        Returns the result of a query, running it only on a cache miss.
+
+        Parameters:
+            - cursor: Database cursor object.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+            - query: The SQL text.
+            :type query: str
+
+            - params: The query parameters.
+            :type params: tuple
+
+            - ttl: The number of seconds a fresh result stays valid.
+            :type ttl: float
+
+        Returns:
+            - The column names, the rows and the cursor description of the
+              result. The rows are a ColumnarRows, which iterates and indexes
+              like a list of tuples.
+            :rtype: tuple
+        """
+        key = self.make_key(query, params)
+        result = self.get(key)
+        if result is None:
+            cursor.execute(query, params)
+            description = [tuple(column) for column in cursor.description]
+            rows = ColumnarRows.from_cursor(cursor)
+            result = (rows.column_names, rows, description)
+            self.set(key, result, ttl)
+        return result
+
+    def stats(self):
+        """
+        Returns the hit and miss counters.
+
+        Returns:
+            - The number of hits, misses and results held in memory.
+            :rtype: dict
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def close(self):
+        """
+        Closes the on-disk store, if any.
+        """
+        if self._store is not None:
+            self._store.close()
+            self._store = None
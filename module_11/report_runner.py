@@ -0,0 +1,269 @@
+"""
+    Title: report_runner.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Runs independent willson_financial reports on a thread pool.
+
+    Each report gets its own pooled connection. The report first in the output
+    order streams straight to stdout; the ones after it write into buffers
+    that are printed when their turn comes, after which they stream too. A
+    buffer larger than SPOOL_SIZE moves to a temporary file, so a large table
+    dump queued behind another one is not held in memory either. The output
+    is the same as a sequential run while the total wall time approaches the
+    slowest single report.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import pooled_connection
+from shared.prepared import prepared_statements
+
+DEFAULT_MAX_WORKERS = 4
+
+# The characters of output a waiting report keeps in memory before its
+# buffer moves to a temporary file.
+SPOOL_SIZE = 1024 * 1024
+
+
+class Report:
+    """
+    A report function together with the arguments it is called with.
+
+    The function is called as `function(cursor, *args, out=stream)`. A
+    prepared report is also given `statements=`, the prepared statement
+    registry of its connection.
+    """
+
+    def __init__(self, name, function, *args, prepared=False):
+        """
+        Parameters:
+            - name: The name shown in the timing summary.
+            :type name: str
+
+            - function: The report function.
+            :type function: callable
+
+            - args: The arguments passed after the cursor.
+            :type args: tuple
+
+            - prepared: Whether to pass the prepared statement registry.
+            :type prepared: bool
+        """
+        self.name = name
+        self.function = function
+        self.args = args
+        self.prepared = prepared
+
+
+def _run_report(report, database, out, profiler=None):
+    """
+    Runs one report on its own pooled connection.
+
+    With a profiler the connection checkout, the cursor and the output stream
+    are timed as well; without one nothing is wrapped.
+
+    Parameters:
+        - report: The report to run.
+        :type report: Report
+
+        - database: The database to connect to.
+        :type database: str
+
+        - out: The stream the report writes to.
+        :type out: io.TextIOBase
+
+        - profiler: Records the phases of the report, if given.
+        :type profiler: shared.profiling.Profiler
+
+    Returns:
+        - The wall time of the report in seconds.
+        :rtype: float
+    """
+    start = time.perf_counter()
+    with pooled_connection(database) as db:
+        wrap_cursor = None
+        if profiler is not None:
+            profiler.record("connect", time.perf_counter() - start)
+            out = profiler.wrap_stream(out if out is not None else sys.stdout)
+            wrap_cursor = profiler.wrap_cursor
+            cursor = wrap_cursor(db.cursor())
+        else:
+            cursor = db.cursor()
+        kwargs = {}
+        if report.prepared:
+            kwargs["statements"] = prepared_statements(db, wrap_cursor)
+        try:
+            report.function(cursor, *report.args, out=out, **kwargs)
+        finally:
+            cursor.close()
+    elapsed = time.perf_counter() - start
+    if profiler is not None:
+        profiler.record("report", elapsed)
+    return elapsed
+
+
+class _OrderedOutput:
+    """
+    Keeps the output of concurrent reports in the order they were given.
+
+    The report at the head of the order writes through to the target. The
+    others write into buffers that spill to a temporary file past
+    SPOOL_SIZE; when the head finishes, the next report's buffer is printed
+    and it becomes the head.
+    """
+
+    def __init__(self, count, target):
+        self._target = target
+        self._lock = threading.Lock()
+        self._buffers = [
+            tempfile.SpooledTemporaryFile(SPOOL_SIZE, mode="w+", encoding="utf-8")
+            for _ in range(count)
+        ]
+        self._done = [False] * count
+        self._head = 0
+
+    def stream(self, index):
+        """
+        Returns the stream report `index` writes to.
+        """
+        return _OrderedStream(self, index)
+
+    def write(self, index, text):
+        with self._lock:
+            if index == self._head:
+                self._target.write(text)
+            else:
+                self._buffers[index].write(text)
+        return len(text)
+
+    def flush(self, index):
+        with self._lock:
+            if index == self._head:
+                self._target.flush()
+
+    def finish(self, index):
+        """
+        Marks a report as done and moves the head past every finished report.
+        """
+        with self._lock:
+            self._done[index] = True
+            while self._head < len(self._done) and self._done[self._head]:
+                self._close_buffer(self._head)
+                self._head += 1
+                if self._head < len(self._buffers):
+                    buffer = self._buffers[self._head]
+                    buffer.seek(0)
+                    shutil.copyfileobj(buffer, self._target)
+                    # From here on the new head writes through
+                    self._close_buffer(self._head)
+
+    def _close_buffer(self, index):
+        if self._buffers[index] is not None:
+            self._buffers[index].close()
+            self._buffers[index] = None
+
+
+class _OrderedStream:
+    """
+    The text stream of one report in an _OrderedOutput.
+    """
+
+    def __init__(self, output, index):
+        self._output = output
+        self._index = index
+
+    def write(self, text):
+        return self._output.write(self._index, text)
+
+    def flush(self):
+        self._output.flush(self._index)
+
+
+def _ordered_report(report, database, output, index, profiler=None):
+    """
+    Runs one report into its stream of an _OrderedOutput.
+
+    Returns:
+        - The wall time of the report in seconds.
+        :rtype: float
+    """
+    try:
+        return _run_report(report, database, output.stream(index), profiler)
+    finally:
+        output.finish(index)
+
+
+def print_timings(timings, wall_time):
+    """
+    Prints the wall time of each report and of the whole run.
+
+    Parameters:
+        - timings: Pairs of report name and wall time in seconds.
+        :type timings: list
+
+        - wall_time: The wall time of the whole run in seconds.
+        :type wall_time: float
+    """
+    print("\n\n-- REPORT TIMINGS --")
+    for name, elapsed in timings:
+        print(f"{name:<35} {elapsed:>9.3f}s")
+    print(f"{'Total Wall Time':<35} {wall_time:>9.3f}s")
+
+
+def run_reports(reports, database, max_workers=DEFAULT_MAX_WORKERS, profiler=None):
+    """
+    Runs reports and prints their output in the order they were given.
+
+    With a single worker the reports run one after another and stream
+    straight to stdout. With more workers they run concurrently; the first
+    unfinished report streams to stdout and the later ones are buffered
+    until every report before them has finished.
+
+    The connection pool must hold at least `max_workers` connections.
+
+    Parameters:
+        - reports: The reports to run.
+        :type reports: list
+
+        - database: The database to connect to.
+        :type database: str
+
+        - max_workers: The number of reports run at the same time.
+        :type max_workers: int
+
+        - profiler: Records the phases of every report, if given. Concurrent
+          reports overlap, so phase totals can exceed the wall time.
+        :type profiler: shared.profiling.Profiler
+
+    Returns:
+        - Pairs of report name and wall time in seconds.
+        :rtype: list
+    """
+    start = time.perf_counter()
+    timings = []
+
+    if max_workers <= 1:
+        for report in reports:
+            timings.append((report.name, _run_report(report, database, None, profiler)))
+    else:
+        output = _OrderedOutput(len(reports), sys.stdout)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _ordered_report, report, database, output, index, profiler
+                )
+                for index, report in enumerate(reports)
+            ]
+            for report, future in zip(reports, futures):
+                timings.append((report.name, future.result()))
+
+    print_timings(timings, time.perf_counter() - start)
+    return timings
@@ -0,0 +1,585 @@
+"""
+    Title: report_service.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Resident service that serves the willson_financial reports
+        from memory over HTTP or a Unix socket.
+
+    The reports are refreshed on a schedule from a warm connection pool and
+    kept as snapshots, so answering a request does not touch the database
+    and takes the same time however busy it is. Months outside the refreshed
+    window are computed on first request, and the most recently requested
+    of them are kept until the next refresh.
+    Identical requests that arrive while a report is being computed wait for
+    that one computation instead of starting their own (single-flight).
+
+    When a refresh fails, for any reason, the previous snapshots keep being
+    served, the error is printed and reported by /health, and the next
+    scheduled refresh runs as usual.
+
+    Endpoints (GET):
+        - /reports/new-clients
+        - /reports/avg-assets
+        - /reports/high-transactions?period=YYYY-MM
+        - /reports: the available reports and when they were refreshed
+        - /health
+
+    Usage:
+        python report_service.py --port 8310 --refresh-interval 300
+        python report_service.py --socket /run/willson/reports.sock
+"""
+
+import argparse
+import datetime
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Future
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from constants import (
+    AVG_ASSETS_REPORT,
+    FIRST_TXN_DATE,
+    HIGH_TRANSACTION_CLIENTS_REPORT,
+    HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT,
+    LAST_TXN_DATE,
+    MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT,
+    MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT,
+    NEW_CLIENT_REPORT,
+)
+from periods import month_bounds, parse_periods, rollup_period_bounds
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import (
+    get_db_config,
+    get_pool,
+    has_credentials,
+    pooled_connection,
+)
+from shared.lazy import lazy_import
+from shared.prepared import prepared_statements
+
+mysql = lazy_import("mysql.connector")
+
+DATABASE = "willson_financial"
+
+DEFAULT_PORT = 8310
+DEFAULT_REFRESH_INTERVAL = 300
+
+# The number of most recent months kept as high transaction snapshots.
+DEFAULT_MONTHS = 12
+
+# Connections for the refresh plus on-demand months computed at the same time.
+DEFAULT_POOL_SIZE = 4
+
+# The number of on-demand months kept; the least recently requested goes first.
+MAX_ON_DEMAND = 64
+
+
+class ReportUnavailable(Exception):
+    """
+    Raised when a report has no snapshot and cannot be computed.
+    """
+
+
+class SingleFlight:
+    """
+    Runs a function once per key for all callers that ask at the same time.
+
+    The first caller of a key runs the function; callers arriving before it
+    finishes wait and get the same result or exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function):
+        """
+        Runs `function()` unless a call for the same key is in progress.
+
+        Parameters:
+            - key: Identifies identical calls.
+            :type key: hashable
+
+            - function: Computes the result.
+            :type function: callable
+
+        Returns:
+            - The result of the function.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            future.set_result(function())
+        except BaseException as err:
+            future.set_exception(err)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
+
+
+class Snapshot:
+    """
+    The result of one report at the time it was computed.
+    """
+
+    __slots__ = ("name", "columns", "rows", "refreshed_at", "payload")
+
+    def __init__(self, name, columns, rows):
+        """
+        Parameters:
+            - name: The report name, with its period if it has one.
+            :type name: str
+
+            - columns: The column names.
+            :type columns: list
+
+            - rows: The report rows.
+            :type rows: list
+        """
+        self.name = name
+        self.columns = columns
+        self.rows = rows
+        self.refreshed_at = datetime.datetime.now(datetime.timezone.utc)
+        # Encoded once, so a request only writes bytes. Decimals and dates
+        # are written as strings, so amounts keep their exact value.
+        self.payload = json.dumps(
+            {
+                "report": name,
+                "refreshed_at": self.refreshed_at.isoformat(timespec="seconds"),
+                "columns": columns,
+                "rows": [list(row) for row in rows],
+            },
+            default=str,
+        ).encode("utf-8")
+
+
+def _month_key(year, month):
+    return f"{year}-{month:02d}"
+
+
+def _months_between(first, last):
+    """
+    Returns every (year, month) from `first` to `last`, inclusive.
+    """
+    months = []
+    year, month = first
+    while (year, month) <= last:
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+class ReportService:
+    """
+    Refreshes the report snapshots and answers requests from them.
+    """
+
+    def __init__(self, refresh_interval, months=DEFAULT_MONTHS, use_rollup=False):
+        """
+        Parameters:
+            - refresh_interval: The number of seconds between refreshes.
+            :type refresh_interval: float
+
+            - months: The number of recent months refreshed on the schedule.
+            :type months: int
+
+            - use_rollup: Whether to refresh and read the
+              client_month_txn_counts summary table.
+            :type use_rollup: bool
+        """
+        self.refresh_interval = refresh_interval
+        self.months = months
+        self.use_rollup = use_rollup
+        self._flight = SingleFlight()
+        # Replaced as a whole by each refresh, so readers never see a mix
+        self._snapshots = {}
+        self._on_demand = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.last_refresh = None
+        self.last_error = None
+        self.last_duration = None
+
+    def _high_transaction_query(self, first, last):
+        """
+        Returns the multi-period query and parameters covering two months.
+        """
+        if self.use_rollup:
+            return (
+                MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT,
+                rollup_period_bounds(first, last),
+            )
+        return MULTI_PERIOD_HIGH_TRANSACTION_CLIENTS_REPORT, (
+            month_bounds(*first)[0],
+            month_bounds(*last)[1],
+        )
+
+    def _compute_snapshots(self):
+        """
+        Computes every scheduled report on one pooled connection.
+
+        Returns:
+            - The snapshots keyed by report path and period.
+            :rtype: dict
+        """
+        snapshots = {}
+        with pooled_connection(DATABASE) as db:
+            if self.use_rollup:
+                from rollup import refresh_rollup
+
+                refresh_rollup(db)
+            cursor = db.cursor()
+            try:
+                for name, query in (
+                    ("new-clients", NEW_CLIENT_REPORT),
+                    ("avg-assets", AVG_ASSETS_REPORT),
+                ):
+                    cursor.execute(query)
+                    columns = [i[0] for i in cursor.description]
+                    snapshots[name] = Snapshot(name, columns, cursor.fetchall())
+
+                cursor.execute(FIRST_TXN_DATE)
+                first_date = cursor.fetchall()[0][0]
+                cursor.execute(LAST_TXN_DATE)
+                last_date = cursor.fetchall()[0][0]
+                if last_date is None:
+                    return snapshots
+
+                last = (last_date.year, last_date.month)
+                periods = _months_between(
+                    (first_date.year, first_date.month), last
+                )[-self.months:]
+                query, params = self._high_transaction_query(periods[0], last)
+                cursor.execute(query, params)
+                columns = [i[0] for i in cursor.description][2:]
+                rows_by_period = {period: [] for period in periods}
+                for row in cursor.fetchall():
+                    rows_by_period[(row[0], row[1])].append(row[2:])
+            finally:
+                cursor.close()
+
+        for (year, month), rows in rows_by_period.items():
+            key = ("high-transactions", _month_key(year, month))
+            snapshots[key] = Snapshot(
+                f"high-transactions {_month_key(year, month)}", columns, rows
+            )
+        return snapshots
+
+    def refresh(self):
+        """
+        Recomputes the scheduled snapshots and swaps them in.
+
+        Requests keep being served from the previous snapshots while the
+        refresh runs, and if it fails.
+        """
+        start = time.perf_counter()
+        try:
+            snapshots = self._flight.do("refresh", self._compute_snapshots)
+        except mysql.connector.Error as err:
+            self.last_error = str(err)
+            print(f"Error Refreshing Reports: {err}", file=sys.stderr)
+            return
+        except Exception as err:
+            # Anything else would end the refresh thread and leave the
+            # service serving stale snapshots for good
+            self.last_error = f"{type(err).__name__}: {err}"
+            print("Error Refreshing Reports:", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+            return
+        with self._lock:
+            self._snapshots = snapshots
+            self._on_demand = OrderedDict()
+        self.last_error = None
+        self.last_refresh = datetime.datetime.now(datetime.timezone.utc)
+        self.last_duration = time.perf_counter() - start
+
+    def _compute_month(self, year, month):
+        """
+        Computes the high transaction clients report of one month.
+        """
+        if self.use_rollup:
+            query, params = HIGH_TRANSACTION_CLIENTS_ROLLUP_REPORT, (year, month)
+        else:
+            query, params = HIGH_TRANSACTION_CLIENTS_REPORT, month_bounds(year, month)
+        with pooled_connection(DATABASE) as db:
+            cursor = prepared_statements(db).execute(query, params)
+            columns = [i[0] for i in cursor.description]
+            rows = cursor.fetchall()
+        snapshot = Snapshot(
+            f"high-transactions {_month_key(year, month)}", columns, rows
+        )
+        with self._lock:
+            self._on_demand[("high-transactions", _month_key(year, month))] = snapshot
+            while len(self._on_demand) > MAX_ON_DEMAND:
+                self._on_demand.popitem(last=False)
+        return snapshot
+
+    def get(self, name, period=None):
+        """
+        Returns the snapshot of a report.
+
+        Parameters:
+            - name: "new-clients", "avg-assets" or "high-transactions".
+            :type name: str
+
+            - period: The `YYYY-MM` month of the high transaction report.
+            :type period: str
+
+        Returns:
+            - The snapshot.
+            :rtype: Snapshot
+
+        Raises:
+            - KeyError: If the report does not exist.
+            - ValueError: If the period is missing or invalid.
+            - ReportUnavailable: If no refresh has succeeded yet.
+        """
+        if name == "high-transactions":
+            if not period:
+                raise ValueError(
+                    "The period Parameter Is Required, e.g. ?period=2025-01."
+                )
+            periods = parse_periods(period)
+            if len(periods) != 1:
+                raise ValueError("Give a Single Month, e.g. ?period=2025-01.")
+            year, month = periods[0]
+            key = (name, _month_key(year, month))
+        elif name in ("new-clients", "avg-assets"):
+            key = name
+        else:
+            raise KeyError(name)
+
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None and key in self._on_demand:
+                self._on_demand.move_to_end(key)
+                snapshot = self._on_demand[key]
+        if snapshot is not None:
+            return snapshot
+        if name != "high-transactions":
+            # Only when no refresh has succeeded yet, so try again now
+            self.refresh()
+            with self._lock:
+                snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                raise ReportUnavailable(f"Reports Not Refreshed Yet: {self.last_error}")
+            return snapshot
+        return self._flight.do(key, lambda: self._compute_month(year, month))
+
+    def status(self):
+        """
+        Returns the refresh state and the snapshots held, for /health.
+        """
+        with self._lock:
+            names = sorted(
+                key if isinstance(key, str) else f"{key[0]}?period={key[1]}"
+                for key in (*self._snapshots, *self._on_demand)
+            )
+        return {
+            "status": "ok" if self.last_error is None else "stale",
+            "last_refresh": self.last_refresh
+            and self.last_refresh.isoformat(timespec="seconds"),
+            "last_refresh_seconds": self.last_duration,
+            "last_error": self.last_error,
+            "refresh_interval": self.refresh_interval,
+            "reports": names,
+        }
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+    def start(self):
+        """
+        Runs the first refresh, then keeps refreshing in the background.
+        """
+        self.refresh()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name="report-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background refresh.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class ReportRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET requests from the service of the server.
+    """
+
+    server_version = "WillsonReports/1.0"
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def _send_json(self, status, payload):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status, message):
+        self._send_json(status, json.dumps({"error": message}).encode("utf-8"))
+
+    def do_GET(self):
+        service = self.server.service
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/")
+        if path == "/health":
+            self._send_json(HTTPStatus.OK, json.dumps(service.status()).encode("utf-8"))
+            return
+        if path == "/reports":
+            reports = service.status()["reports"]
+            self._send_json(HTTPStatus.OK, json.dumps(reports).encode("utf-8"))
+            return
+        if not path.startswith("/reports/"):
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown Path '{url.path}'")
+            return
+
+        name = path[len("/reports/"):]
+        period = parse_qs(url.query).get("period", [None])[0]
+        try:
+            snapshot = service.get(name, period)
+        except KeyError:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown Report '{name}'")
+        except ValueError as err:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(err))
+        except (ReportUnavailable, mysql.connector.Error) as err:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, str(err))
+        else:
+            self._send_json(HTTPStatus.OK, snapshot.payload)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    """
+    HTTP server listening on a Unix socket, one thread per request.
+    """
+
+    daemon_threads = True
+
+
+def make_server(service, host="127.0.0.1", port=DEFAULT_PORT, socket_path=None):
+    """
+    Creates the HTTP server of a service.
+
+    Parameters:
+        - service: The service answering the requests.
+        :type service: ReportService
+
+        - host: The address to listen on, when no socket is given.
+        :type host: str
+
+        - port: The port to listen on, when no socket is given.
+        :type port: int
+
+        - socket_path: The Unix socket to listen on instead of TCP.
+        :type socket_path: str
+
+    Returns:
+        - The server, not yet serving.
+        :rtype: socketserver.BaseServer
+    """
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, ReportRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), ReportRequestHandler)
+    server.service = service
+    return server
+
+
+def parse_args(argv=None):
+    """
+    Parses the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serves the willson_financial reports from memory."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--socket", help="Listen on this Unix socket instead of --host/--port."
+    )
+    parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=DEFAULT_REFRESH_INTERVAL,
+        help=f"Seconds between refreshes (default: {DEFAULT_REFRESH_INTERVAL}).",
+    )
+    parser.add_argument(
+        "--months",
+        type=int,
+        default=DEFAULT_MONTHS,
+        help="Most recent months of the high transaction clients report kept "
+        f"refreshed (default: {DEFAULT_MONTHS}). Older months are computed on request.",
+    )
+    parser.add_argument(
+        "--rollup",
+        action="store_true",
+        help="Refresh the client_month_txn_counts summary table and read from it.",
+    )
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE)
+    args = parser.parse_args(argv)
+    if args.refresh_interval <= 0:
+        parser.error("--refresh-interval must be positive")
+    if args.months < 1:
+        parser.error("--months must be at least 1")
+    return args
+
+
+def main(argv=None):
+    """
+    Starts the service and serves until interrupted.
+    """
+    args = parse_args(argv)
+    if not has_credentials(get_db_config(DATABASE)):
+        print(
+            "Error: Database Credentials (DB_USER, DB_PASSWORD) Not Found in .env File."
+        )
+        sys.exit(1)
+
+    get_pool(DATABASE, pool_size=args.pool_size)
+    service = ReportService(args.refresh_interval, args.months, args.rollup)
+    service.start()
+    server = make_server(service, args.host, args.port, args.socket)
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"Serving Reports on {where}, Refreshed Every {args.refresh_interval:g}s.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
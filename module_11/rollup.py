@@ -0,0 +1,383 @@
+"""
+    Title: rollup.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Maintains the client_month_txn_counts summary table.
+
+    The table holds one row per client per month with the number of
+    transactions, so the high transaction clients report and the list of
+    available months read a table that grows with the number of clients
+    instead of the number of transactions.
+
+    The refresh is incremental. Transactions above the last recorded
+    high-water mark are counted and added to the summary. AUTO_INCREMENT ids
+    are handed out when a row is inserted, not when it commits, so a
+    transaction with a lower id can become visible after a higher one was
+    counted. Each refresh therefore also re-scans SAFETY_WINDOW ids below
+    the mark and counts the ones missing from rollup_recent_transactions,
+    which records the ids counted in that window.
+
+    This assumes transactions are only ever inserted. After bulk updates or
+    deletes of transactions, or a commit delayed by more than the window,
+    run a full rebuild.
+
+    Usage:
+        python rollup.py rebuild    # recount every transaction
+        python rollup.py refresh    # add transactions since the last refresh
+        python rollup.py check      # compare the summary with the raw table
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import pooled_connection
+from shared.lazy import lazy_import
+
+mysql = lazy_import("mysql.connector")
+
+ROLLUP_NAME = "client_month_txn_counts"
+
+CREATE_ROLLUP_TABLE = """
+CREATE TABLE client_month_txn_counts (
+    txn_year SMALLINT NOT NULL,
+    txn_month TINYINT NOT NULL,
+    client_id INT NOT NULL,
+    txn_count INT NOT NULL,
+    PRIMARY KEY (txn_year, txn_month, client_id)
+);
+"""
+
+# The number of ids below the high-water mark re-scanned by every refresh
+# for transactions that committed after a higher id was counted.
+SAFETY_WINDOW = 10000
+
+CREATE_STATE_TABLE = """
+CREATE TABLE rollup_state (
+    rollup_name VARCHAR(64) NOT NULL PRIMARY KEY,
+    last_transaction_id BIGINT NOT NULL
+);
+"""
+
+# The ids counted within SAFETY_WINDOW of the high-water mark. `pending`
+# marks the ids being added by the refresh in progress.
+CREATE_RECENT_TABLE = """
+CREATE TABLE rollup_recent_transactions (
+    transaction_id BIGINT NOT NULL PRIMARY KEY,
+    pending BOOLEAN NOT NULL
+);
+"""
+
+EXISTING_TABLES = """
+SELECT
+    table_name
+FROM
+    information_schema.tables
+WHERE
+    table_schema = DATABASE()
+    AND table_name IN (
+        'client_month_txn_counts', 'rollup_state', 'rollup_recent_transactions'
+    );
+"""
+
+# Creates the state row up front, so the first refreshes lock an existing
+# row; SELECT ... FOR UPDATE on a missing row would let two of them run at
+# once and count the same transactions.
+CREATE_STATE_ROW = """
+INSERT INTO rollup_state (rollup_name, last_transaction_id)
+VALUES (%s, 0)
+ON DUPLICATE KEY UPDATE rollup_name = rollup_name;
+"""
+
+HIGH_WATER_MARK = """
+SELECT
+    last_transaction_id
+FROM
+    rollup_state
+WHERE
+    rollup_name = %s
+"""
+
+# Locks the state row so two refreshes cannot count the same transactions.
+SELECT_HIGH_WATER_MARK = HIGH_WATER_MARK + "FOR UPDATE;"
+
+SAVE_HIGH_WATER_MARK = """
+UPDATE rollup_state
+SET
+    last_transaction_id = %s
+WHERE
+    rollup_name = %s;
+"""
+
+MAX_TRANSACTION_ID = "SELECT COALESCE(MAX(transaction_id), 0) FROM transactions;"
+
+# Records the ids in (low, high] that have not been counted yet. The range
+# seeks on the primary key, so the cost is proportional to the number of
+# new transactions plus the safety window.
+RECORD_NEW_TRANSACTIONS = """
+INSERT INTO rollup_recent_transactions (transaction_id, pending)
+SELECT
+    t.transaction_id,
+    TRUE
+FROM
+    transactions t
+LEFT JOIN
+    rollup_recent_transactions r ON r.transaction_id = t.transaction_id
+WHERE
+    t.transaction_id > %s AND t.transaction_id <= %s
+    AND r.transaction_id IS NULL;
+"""
+
+# Adds the counts of the recorded ids to the summary. Counting the recorded
+# ids rather than re-reading the range keeps the two in step when a
+# transaction commits between the statements. The derived table lets the
+# update refer to the new count without the deprecated VALUES() function.
+ADD_TRANSACTION_COUNTS = """
+INSERT INTO client_month_txn_counts (txn_year, txn_month, client_id, txn_count)
+SELECT * FROM (
+    SELECT
+        YEAR(t.txn_date) AS new_year,
+        MONTH(t.txn_date) AS new_month,
+        t.client_id AS new_client_id,
+        COUNT(*) AS new_count
+    FROM
+        rollup_recent_transactions r
+    JOIN
+        transactions t ON t.transaction_id = r.transaction_id
+    WHERE
+        r.pending
+    GROUP BY
+        YEAR(t.txn_date),
+        MONTH(t.txn_date),
+        t.client_id
+) AS new_counts
+ON DUPLICATE KEY UPDATE txn_count = txn_count + new_count;
+"""
+
+# Records the ids a rebuild counted within the safety window, so the next
+# refresh only adds the ones that commit later.
+SEED_RECENT_TRANSACTIONS = """
+INSERT INTO rollup_recent_transactions (transaction_id, pending)
+SELECT
+    transaction_id,
+    FALSE
+FROM
+    transactions
+WHERE
+    transaction_id > %s AND transaction_id <= %s;
+"""
+
+CLEAR_PENDING = "UPDATE rollup_recent_transactions SET pending = FALSE WHERE pending;"
+
+# Forgets the ids that have left the safety window.
+PRUNE_RECENT_TRANSACTIONS = """
+DELETE FROM rollup_recent_transactions
+WHERE
+    transaction_id <= %s;
+"""
+
+RAW_TRANSACTION_COUNTS = """
+SELECT
+    YEAR(txn_date),
+    MONTH(txn_date),
+    client_id,
+    COUNT(*)
+FROM
+    transactions
+WHERE
+    transaction_id <= %s
+GROUP BY
+    YEAR(txn_date),
+    MONTH(txn_date),
+    client_id;
+"""
+
+ROLLUP_TRANSACTION_COUNTS = """
+SELECT
+    txn_year,
+    txn_month,
+    client_id,
+    txn_count
+FROM
+    client_month_txn_counts;
+"""
+
+# Counts every transaction up to the high-water mark straight into the
+# emptied summary, for a rebuild.
+REBUILD_TRANSACTION_COUNTS = (
+    "INSERT INTO client_month_txn_counts (txn_year, txn_month, client_id, txn_count)"
+    + RAW_TRANSACTION_COUNTS
+)
+
+
+def create_rollup_tables(cursor):
+    """
+    Creates the summary and state tables and the state row if they do not
+    exist.
+
+    The tables are looked up first because `CREATE TABLE IF NOT EXISTS` on
+    an existing table raises a note, which fails with `raise_on_warnings`.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+    """
+    cursor.execute(EXISTING_TABLES)
+    existing = {row[0].lower() for row in cursor.fetchall()}
+    if "client_month_txn_counts" not in existing:
+        cursor.execute(CREATE_ROLLUP_TABLE)
+    if "rollup_state" not in existing:
+        cursor.execute(CREATE_STATE_TABLE)
+    if "rollup_recent_transactions" not in existing:
+        cursor.execute(CREATE_RECENT_TABLE)
+    cursor.execute(CREATE_STATE_ROW, (ROLLUP_NAME,))
+
+
+def _add_counts_since_high_water_mark(cursor, rebuild):
+    """
+    Counts the transactions above the high-water mark, and the ones within
+    SAFETY_WINDOW below it that were not counted yet, and moves the mark.
+
+    A rebuild counts every transaction up to the current maximum id in one
+    statement and records only the ids within SAFETY_WINDOW of it.
+
+    Parameters:
+        - cursor: Database cursor object inside an open transaction.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - rebuild: Whether to discard the summary and count from the start.
+        :type rebuild: bool
+
+    Returns:
+        - The previous and the new high-water mark.
+        :rtype: tuple
+    """
+    cursor.execute(SELECT_HIGH_WATER_MARK, (ROLLUP_NAME,))
+    # Read even when rebuilding, the unbuffered cursor needs the result
+    # consumed before the next statement
+    row = cursor.fetchone()
+    low = 0 if rebuild else row[0]
+
+    # Capping at the current maximum keeps transactions inserted during the
+    # refresh for the next one
+    cursor.execute(MAX_TRANSACTION_ID)
+    high = max(cursor.fetchone()[0], low)
+
+    if rebuild:
+        # DELETE rather than TRUNCATE so the rebuild stays in one transaction.
+        # Counting straight from transactions and seeding only the window
+        # keeps every id out of rollup_recent_transactions and its undo log.
+        cursor.execute("DELETE FROM client_month_txn_counts")
+        cursor.execute("DELETE FROM rollup_recent_transactions")
+        cursor.execute(REBUILD_TRANSACTION_COUNTS, (high,))
+        cursor.execute(SEED_RECENT_TRANSACTIONS, (high - SAFETY_WINDOW, high))
+        cursor.execute(SAVE_HIGH_WATER_MARK, (high, ROLLUP_NAME))
+        return low, high
+
+    cursor.execute(RECORD_NEW_TRANSACTIONS, (max(low - SAFETY_WINDOW, 0), high))
+    if cursor.rowcount:
+        cursor.execute(ADD_TRANSACTION_COUNTS)
+        cursor.execute(CLEAR_PENDING)
+    cursor.execute(PRUNE_RECENT_TRANSACTIONS, (high - SAFETY_WINDOW,))
+    cursor.execute(SAVE_HIGH_WATER_MARK, (high, ROLLUP_NAME))
+    return low, high
+
+
+def refresh_rollup(db, rebuild=False):
+    """
+    Brings the summary table up to date in a single transaction.
+
+    Parameters:
+        - db: Database connection.
+        :type db: mysql.connector.connection.MySQLConnection
+
+        - rebuild: Whether to discard the summary and count from the start.
+        :type rebuild: bool
+
+    Returns:
+        - The previous and the new high-water mark.
+        :rtype: tuple
+    """
+    cursor = db.cursor()
+    try:
+        create_rollup_tables(cursor)
+        marks = _add_counts_since_high_water_mark(cursor, rebuild)
+        db.commit()
+        return marks
+    except mysql.connector.Error:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def check_rollup(cursor):
+    """
+    Compares the summary table against counts taken from the raw table.
+
+    Only transactions up to the high-water mark are compared, so newer
+    transactions that have not been refreshed yet are not reported. A
+    transaction below the mark that committed after the last refresh is
+    reported until the next refresh counts it.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+    Returns:
+        - One message per (year, month, client) whose counts differ.
+        :rtype: list
+    """
+    cursor.execute(HIGH_WATER_MARK, (ROLLUP_NAME,))
+    row = cursor.fetchone()
+    high = 0 if row is None else row[0]
+
+    cursor.execute(RAW_TRANSACTION_COUNTS, (high,))
+    expected = {tuple(row[:3]): row[3] for row in cursor.fetchall()}
+    cursor.execute(ROLLUP_TRANSACTION_COUNTS)
+    actual = {tuple(row[:3]): row[3] for row in cursor.fetchall()}
+
+    problems = []
+    for key in sorted(expected.keys() | actual.keys()):
+        if expected.get(key, 0) != actual.get(key, 0):
+            year, month, client_id = key
+            problems.append(
+                f"{year}-{month:02d} client {client_id}: "
+                f"expected {expected.get(key, 0)}, found {actual.get(key, 0)}"
+            )
+    return problems
+
+
+def main(argv=None):
+    """
+    Runs a rollup maintenance command.
+    """
+    parser = argparse.ArgumentParser(
+        description="Maintains the client_month_txn_counts summary table."
+    )
+    parser.add_argument("command", choices=["rebuild", "refresh", "check"])
+    args = parser.parse_args(argv)
+
+    try:
+        with pooled_connection("willson_financial") as db:
+            if args.command == "check":
+                cursor = db.cursor()
+                problems = check_rollup(cursor)
+                cursor.close()
+                for problem in problems:
+                    print(f"***{problem}")
+                if problems:
+                    sys.exit(1)
+                print("Rollup Matches the Transactions Table.")
+            else:
+                low, high = refresh_rollup(db, rebuild=args.command == "rebuild")
+                print(f"Rollup Refreshed: transaction_id {low} -> {high}")
+    except mysql.connector.Error as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
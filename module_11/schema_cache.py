@@ -0,0 +1,118 @@
+"""
+    Title: schema_cache.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Caches the column metadata of the willson_financial tables.
+
+    The columns of every table are read from information_schema in a single
+    query the first time they are needed and kept for `ttl` seconds, instead
+    of running `SHOW COLUMNS` before every table dump.
+"""
+
+import threading
+import time
+
+from constants import CURRENCY_COLUMNS, SCHEMA_COLUMNS
+
+# Seconds the cached metadata stays valid. The schema only changes with a
+# migration, so a long-running process only needs to reload occasionally.
+DEFAULT_SCHEMA_TTL = 60 * 60
+
+
+class ColumnInfo:
+    """
+    The name, type and currency flag of one table column.
+    """
+
+    __slots__ = ("name", "data_type", "is_currency")
+
+    def __init__(self, name, data_type, is_currency):
+        self.name = name
+        self.data_type = data_type
+        self.is_currency = is_currency
+
+
+class SchemaCache:
+    """
+    Column metadata of every table in the current database.
+    """
+
+    def __init__(self, ttl=DEFAULT_SCHEMA_TTL):
+        """
+        Parameters:
+            - ttl: The number of seconds the metadata stays valid.
+            :type ttl: float
+        """
+        self.ttl = ttl
+        self._tables = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self, cursor):
+        """
+        Reads the columns of every table with one information_schema query.
+        """
+        cursor.execute(SCHEMA_COLUMNS)
+        tables = {}
+        for table_name, column_name, data_type in cursor.fetchall():
+            tables.setdefault(table_name, []).append(
+                ColumnInfo(
+                    column_name,
+                    data_type,
+                    column_name in CURRENCY_COLUMNS.get(table_name, ()),
+                )
+            )
+        self._tables = tables
+        self._expires_at = time.monotonic() + self.ttl
+
+    def columns(self, cursor, table_name):
+        """
+        Returns the columns of a table, loading the metadata if needed.
+
+        Parameters:
+            - cursor: Database cursor object, only used on a reload.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+            - table_name: The name of the table.
+            :type table_name: str
+
+        Returns:
+            - The columns of the table in ordinal order.
+            :rtype: list
+        """
+        with self._lock:
+            if self._tables is None or time.monotonic() >= self._expires_at:
+                self._load(cursor)
+            return self._tables.get(table_name, [])
+
+    def currency_columns(self, cursor, table_name):
+        """
+        Returns the names of the currency columns of a table.
+
+        Parameters:
+            - cursor: Database cursor object, only used on a reload.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+            - table_name: The name of the table.
+            :type table_name: str
+
+        Returns:
+            - The names of the columns to format as currency.
+            :rtype: list
+        """
+        return [
+            column.name
+            for column in self.columns(cursor, table_name)
+            if column.is_currency
+        ]
+
+    def invalidate(self):
+        """
+        Forces the metadata to be reloaded on next use.
+        """
+        with self._lock:
+            self._tables = None
+
+
+# Shared by every report in the process
+schema_cache = SchemaCache()
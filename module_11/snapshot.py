@@ -0,0 +1,339 @@
+"""
+    Title: snapshot.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Keeps a local SQLite or DuckDB snapshot of the willson_financial
+        tables and runs the reports on it.
+
+    The first sync copies every table. Later syncs only pull the rows whose
+    primary key is above the largest one already in the snapshot, which
+    suits the append-only transactions table. Updated or deleted rows are
+    not seen by an incremental sync, so use --full to recopy a table after
+    such changes (or after a schema change).
+
+    Usage:
+        python snapshot.py sync --engine duckdb --path willson_financial.duckdb
+        python snapshot.py report --engine duckdb --path willson_financial.duckdb \
+            --periods 2025-01..2025-06
+"""
+
+import argparse
+import datetime
+import os
+import re
+import sys
+import time
+from itertools import groupby
+
+from backends import get_backend
+from constants import CURRENCY_COLUMNS, DEFAULT_BATCH_SIZE, SNAPSHOT_COLUMNS
+from periods import month_bounds, parse_periods
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.table_renderer import format_currency, render_cursor, render_rows
+
+SNAPSHOT_TABLES = ["clients", "assets", "transactions", "billings"]
+
+# Embedded column types for MySQL types, matched on the start of COLUMN_TYPE.
+# Integer widths and unsigned flags are dropped; decimals keep their scale.
+TYPE_MAP = [
+    (r"(tiny|small|medium|big)?int", {"sqlite": "INTEGER", "duckdb": "BIGINT"}),
+    (r"(decimal|numeric)", {"sqlite": "NUMERIC", "duckdb": None}),
+    (r"(float|double|real)", {"sqlite": "REAL", "duckdb": "DOUBLE"}),
+    (r"date$", {"sqlite": "DATE", "duckdb": "DATE"}),
+    (r"(datetime|timestamp)", {"sqlite": "TIMESTAMP", "duckdb": "TIMESTAMP"}),
+]
+
+
+def snapshot_type(column_type, dialect):
+    """
+    Returns the embedded column type for a MySQL column type.
+
+    Parameters:
+        - column_type: The MySQL COLUMN_TYPE, e.g. "decimal(15,2)".
+        :type column_type: str
+
+        - dialect: "sqlite" or "duckdb".
+        :type dialect: str
+
+    Returns:
+        - The column type to create in the snapshot.
+        :rtype: str
+    """
+    column_type = column_type.lower()
+    for pattern, types in TYPE_MAP:
+        if re.match(pattern, column_type):
+            # DuckDB has DECIMAL with the same precision and scale as MySQL
+            return types[dialect] or column_type.upper()
+    return "TEXT" if dialect == "sqlite" else "VARCHAR"
+
+
+def sync_table(
+    source, target, backend, table_name, full=False, batch_size=DEFAULT_BATCH_SIZE
+):
+    """
+    Copies the new rows of one MySQL table into the snapshot.
+
+    Parameters:
+        - source: Connection to the MySQL database.
+        :type source: mysql.connector.connection.MySQLConnection
+
+        - target: Connection to the snapshot.
+        :type target: object
+
+        - backend: The backend of the snapshot.
+        :type backend: backends.Backend
+
+        - table_name: The table to sync.
+        :type table_name: str
+
+        - full: Recopy the whole table instead of only the new rows.
+        :type full: bool
+
+        - batch_size: The number of rows read and inserted at a time.
+        :type batch_size: int
+
+    Returns:
+        - The number of rows copied.
+        :rtype: int
+    """
+    cursor = source.cursor()
+    try:
+        cursor.execute(SNAPSHOT_COLUMNS, (table_name,))
+        columns = cursor.fetchall()
+    finally:
+        cursor.close()
+    if not columns:
+        raise ValueError(f"Table '{table_name}' Not Found in the Source Database")
+
+    names = [name for name, _, _ in columns]
+    keys = [name for name, _, key in columns if key == "PRI"]
+    # Only a single column key can be compared against a high-water mark
+    key = keys[0] if len(keys) == 1 else None
+
+    target_cursor = target.cursor()
+    exists = table_name in backend.existing_tables(target_cursor)
+    high_water_mark = None
+    if full or key is None or not exists:
+        if exists:
+            target_cursor.execute(f"DROP TABLE {table_name}")
+        definitions = ", ".join(
+            f"{name} {snapshot_type(column_type, backend.dialect)}"
+            for name, column_type, _ in columns
+        )
+        if key is not None:
+            definitions += f", PRIMARY KEY ({key})"
+        target_cursor.execute(f"CREATE TABLE {table_name} ({definitions})")
+    else:
+        target_cursor.execute(f"SELECT MAX({key}) FROM {table_name}")
+        (high_water_mark,) = target_cursor.fetchone()
+
+    select = f"SELECT {', '.join(names)} FROM {table_name}"
+    params = ()
+    if high_water_mark is not None:
+        select += f" WHERE {key} > %s"
+        params = (high_water_mark,)
+    if key is not None:
+        select += f" ORDER BY {key}"
+    insert = (
+        f"INSERT INTO {table_name} ({', '.join(names)}) "
+        f"VALUES ({backend.placeholders(len(names))})"
+    )
+
+    copied = 0
+    cursor = source.cursor()
+    try:
+        # The source rows are streamed, so one batch is held at a time
+        cursor.execute(select, params)
+        while rows := cursor.fetchmany(batch_size):
+            target_cursor.executemany(insert, rows)
+            copied += len(rows)
+        target.commit()
+    finally:
+        cursor.close()
+        target_cursor.close()
+    return copied
+
+
+def sync_snapshot(
+    backend, tables=SNAPSHOT_TABLES, full=False, batch_size=DEFAULT_BATCH_SIZE
+):
+    """
+    Syncs tables from MySQL into a snapshot and prints what was copied.
+
+    Parameters:
+        - backend: The backend of the snapshot.
+        :type backend: backends.Backend
+
+        - tables: The tables to sync.
+        :type tables: list
+
+        - full: Recopy the tables instead of only their new rows.
+        :type full: bool
+
+        - batch_size: The number of rows read and inserted at a time.
+        :type batch_size: int
+
+    Returns:
+        - The number of rows copied per table.
+        :rtype: dict
+    """
+    from shared.connection import pooled_connection
+
+    copied = {}
+    target = backend.connect()
+    try:
+        with pooled_connection("willson_financial") as source:
+            for table_name in tables:
+                start = time.perf_counter()
+                copied[table_name] = sync_table(
+                    source, target, backend, table_name, full, batch_size
+                )
+                print(
+                    f"{table_name:<15} {copied[table_name]:>12,} Rows Copied "
+                    f"in {time.perf_counter() - start:.3f}s"
+                )
+    finally:
+        target.close()
+    return copied
+
+
+def _to_date(value):
+    """
+    Returns a date from a DATE value, which SQLite returns as ISO text.
+    """
+    if value is None or isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+def print_reports(backend, periods=None, out=None):
+    """
+    Prints the willson_financial reports from a snapshot.
+
+    Parameters:
+        - backend: The backend of the snapshot.
+        :type backend: backends.Backend
+
+        - periods: The (year, month) pairs of the high transaction clients
+          report, defaults to the month of the latest transaction.
+        :type periods: list
+
+        - out: The stream to write the reports to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+    """
+    connection = backend.connect()
+    cursor = connection.cursor()
+    try:
+        print("\n\n-- NEW CLIENT REPORT --", file=out)
+        cursor.execute(backend.query("new_clients"))
+        for row in cursor.fetchall():
+            print(f"Month: {row[0]}, Year: {row[1]}, New Clients: {row[2]}", file=out)
+
+        print("\n\n-- AVERAGE ASSETS REPORT --", file=out)
+        cursor.execute(backend.query("avg_assets"))
+        row = cursor.fetchone()
+        if row and row[0] is not None:
+            print(f"Average Total Assets Per Client: {format_currency(row[0])}", file=out)
+        else:
+            print("No Asset Data Found.", file=out)
+
+        if not periods:
+            cursor.execute(backend.query("last_txn_date"))
+            last = _to_date(cursor.fetchone()[0])
+            periods = [(last.year, last.month)] if last else []
+        if not periods:
+            print("\nNo Transactions Found.", file=out)
+            return
+
+        start = month_bounds(*periods[0])[0]
+        end = month_bounds(*periods[-1])[1]
+        cursor.execute(backend.query("multi_period_high_transactions"), (start, end))
+        column_names = [i[0] for i in cursor.description]
+        by_month = {
+            month: [row[2:] for row in rows]
+            for month, rows in groupby(cursor.fetchall(), key=lambda row: row[:2])
+        }
+        for year, month in periods:
+            print(
+                f"\n\n-- HIGH TRANSACTION CLIENTS REPORT FOR {year}-{month:02d} --",
+                file=out,
+            )
+            rows = by_month.get((year, month))
+            if rows:
+                render_rows(column_names[2:], rows, out=out)
+            else:
+                print("No Clients With More Than 10 Transactions.", file=out)
+    finally:
+        cursor.close()
+        connection.close()
+
+
+def main(argv=None):
+    """
+    Syncs a snapshot or prints the reports from it.
+    """
+    parser = argparse.ArgumentParser(
+        description="Maintains and reports from a local willson_financial snapshot."
+    )
+    parser.add_argument("command", choices=["sync", "report", "dump"])
+    parser.add_argument("--engine", choices=["sqlite", "duckdb"], default="duckdb")
+    parser.add_argument(
+        "--path",
+        default="willson_financial.duckdb",
+        help="The snapshot file (default: willson_financial.duckdb).",
+    )
+    parser.add_argument(
+        "--tables",
+        nargs="+",
+        choices=SNAPSHOT_TABLES,
+        default=SNAPSHOT_TABLES,
+        help="Tables to sync or dump (default: all).",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Recopy the tables instead of only new rows."
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--periods",
+        help="Months for the high transaction clients report, e.g. 2025-01..2025-06.",
+    )
+    args = parser.parse_args(argv)
+
+    backend = get_backend(args.engine, args.path)
+    try:
+        if args.command == "sync":
+            import mysql.connector
+
+            try:
+                sync_snapshot(backend, args.tables, args.full, args.batch_size)
+            except mysql.connector.Error as err:
+                print(f"Error: {err}")
+                sys.exit(1)
+        elif args.command == "report":
+            print_reports(backend, parse_periods(args.periods) if args.periods else None)
+        else:
+            connection = backend.connect()
+            cursor = connection.cursor()
+            try:
+                for table_name in args.tables:
+                    print(f"\n--- {table_name.upper()} ---")
+                    cursor.execute(f"SELECT * FROM {table_name}")
+                    formatters = dict.fromkeys(
+                        CURRENCY_COLUMNS.get(table_name, ()), format_currency
+                    )
+                    if not render_cursor(
+                        cursor, args.batch_size, formatters=formatters
+                    ):
+                        print(f"No Data Found in {table_name}.")
+            finally:
+                cursor.close()
+                connection.close()
+    except (ImportError, ValueError) as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+    Title: test_asset_totals.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Checks the in-memory asset totals and the summary table
+        check against AVG_ASSETS_REPORT, including assets without a value.
+
+    Usage:
+        python -m unittest discover module_11/tests
+"""
+
+import os
+import random
+import sys
+import unittest
+from decimal import Decimal
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from asset_totals import (
+    RAW_ASSET_TOTALS,
+    SUMMARY_ASSET_TOTALS,
+    AssetTotals,
+    check_totals,
+)
+
+
+def expected_average(assets):
+    """
+    Averages (client_id, asset_value) pairs as AVG_ASSETS_REPORT does: SUM
+    of all NULLs is NULL, and AVG skips NULL sums.
+    """
+    sums = {}
+    for client_id, value in assets:
+        if value is not None:
+            sums[client_id] = (sums.get(client_id) or 0) + value
+        else:
+            sums.setdefault(client_id, None)
+    valued = [total for total in sums.values() if total is not None]
+    return sum(valued) / len(valued) if valued else None
+
+
+class FakeCursor:
+    def __init__(self, results):
+        self._results = results
+        self._rows = []
+
+    def execute(self, query, params=None):
+        self._rows = self._results[query]
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, results):
+        self._results = results
+
+    def start_transaction(self, **kwargs):
+        pass
+
+    def cursor(self):
+        return FakeCursor(self._results)
+
+    def rollback(self):
+        pass
+
+
+class AssetTotalsTest(unittest.TestCase):
+    def test_clients_without_valued_assets_are_skipped(self):
+        assets = [
+            (1, Decimal("100.00")),
+            (1, None),
+            (2, None),
+            (3, Decimal("50.00")),
+        ]
+        totals = AssetTotals()
+        for client_id, value in assets:
+            totals.add(client_id, value)
+
+        self.assertEqual(len(totals), 2)
+        self.assertEqual(totals.average(), expected_average(assets))
+        self.assertEqual(totals.totals(), {1: Decimal("100.00"), 3: Decimal("50.00")})
+        self.assertEqual(totals.top(5), [(1, Decimal("100.00")), (3, Decimal("50.00"))])
+        self.assertEqual(
+            totals.percentiles([1, 100]), {1: Decimal("50.00"), 100: Decimal("100.00")}
+        )
+
+        # Client 1 is left with only its NULL asset
+        totals.remove(1, Decimal("100.00"))
+        self.assertEqual(len(totals), 1)
+        self.assertEqual(totals.average(), Decimal("50.00"))
+
+    def test_all_null_assets_have_no_average(self):
+        totals = AssetTotals()
+        totals.add(1, None)
+        self.assertEqual(len(totals), 0)
+        self.assertIsNone(totals.average())
+        self.assertEqual(totals.percentiles([50]), {50: None})
+
+    def test_from_cursor_reads_the_valued_count(self):
+        cursor = FakeCursor(
+            {SUMMARY_ASSET_TOTALS: [(1, Decimal("10.00"), 2, 1), (2, 0, 1, 0)]}
+        )
+        totals = AssetTotals.from_cursor(cursor)
+        self.assertEqual(len(totals), 1)
+        self.assertEqual(totals.average(), Decimal("10.00"))
+
+    def test_random_changes_match_the_assets_table(self):
+        rng = random.Random(25)
+        totals = AssetTotals()
+        assets = []
+        for _ in range(2000):
+            if assets and rng.random() < 0.4:
+                client_id, value = assets.pop(rng.randrange(len(assets)))
+                totals.remove(client_id, value)
+            else:
+                value = None if rng.random() < 0.3 else Decimal(rng.randint(0, 10**6))
+                assets.append((rng.randint(1, 20), value))
+                totals.add(*assets[-1])
+            self.assertEqual(totals.average(), expected_average(assets))
+
+    def test_check_reports_a_different_valued_count(self):
+        db = FakeConnection(
+            {
+                RAW_ASSET_TOTALS: [(1, Decimal("5.00"), 2, 1), (2, 0, 1, 0)],
+                SUMMARY_ASSET_TOTALS: [(1, Decimal("5.00"), 2, 2), (2, 0, 1, 0)],
+            }
+        )
+        problems = check_totals(db)
+        self.assertEqual(len(problems), 1)
+        self.assertIn("client 1", problems[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
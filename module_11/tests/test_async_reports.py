@@ -0,0 +1,239 @@
+"""
+    Title: test_async_reports.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Tests the asyncio reports against an in-process stand-in for
+        an aiomysql pool.
+
+    The fake pool answers each query from a handler and yields to the event
+    loop on every call, so reports started together really do interleave.
+
+    Usage:
+        python -m unittest discover module_11/tests
+"""
+
+import asyncio
+import datetime
+import io
+import os
+import sys
+import unittest
+import unittest.mock
+from decimal import Decimal
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import async_reports
+from constants import (
+    AVG_ASSETS_REPORT,
+    FIRST_TXN_DATE,
+    HIGH_TRANSACTION_CLIENTS_REPORT,
+    NEW_CLIENT_REPORT,
+    NEXT_TXN_DATE,
+)
+from periods import month_bounds
+
+
+class FakeCursor:
+    """
+    An aiomysql cursor whose results come from the pool's handler.
+    """
+
+    def __init__(self, pool, cursor_class):
+        self._pool = pool
+        self.cursor_class = cursor_class
+        self.description = None
+        self._rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, query, params=None):
+        self._pool.executed.append((query, params, self.cursor_class))
+        columns, rows = self._pool.handler(query, params)
+        self.description = [(name,) for name in columns]
+        self._rows = list(rows)
+        await asyncio.sleep(0)
+
+    async def fetchone(self):
+        await asyncio.sleep(0)
+        return self._rows.pop(0) if self._rows else None
+
+    async def fetchmany(self, size):
+        await asyncio.sleep(0)
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    async def fetchall(self):
+        await asyncio.sleep(0)
+        rows, self._rows = self._rows, []
+        return rows
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self._pool = pool
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor(self._pool, cursor_class)
+
+
+class FakePool:
+    """
+    An aiomysql pool that hands out fake connections and counts how many are
+    in use at the same time.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.executed = []
+        self.active = 0
+        self.max_active = 0
+
+    def acquire(self):
+        pool = self
+
+        class Acquire:
+            async def __aenter__(self):
+                pool.active += 1
+                pool.max_active = max(pool.max_active, pool.active)
+                await asyncio.sleep(0)
+                return FakeConnection(pool)
+
+            async def __aexit__(self, *exc_info):
+                pool.active -= 1
+                return False
+
+        return Acquire()
+
+
+TRANSACTION_DATES = [
+    datetime.date(2025, 1, 5),
+    datetime.date(2025, 2, 10),
+    datetime.date(2025, 4, 1),
+]
+
+TABLES = {
+    "clients": (["client_id", "name"], [(1, "Ada"), (2, "Grace"), (3, "Linus")]),
+    "assets": (
+        ["asset_id", "client_id", "asset_value"],
+        [(1, 1, Decimal("1234.565")), (2, 2, Decimal("10.00"))],
+    ),
+    "billings": (["billing_id", "bill_amount"], []),
+}
+
+
+def willson_financial(query, params):
+    """
+    Answers the report queries with fixed results.
+    """
+    if query == NEW_CLIENT_REPORT:
+        return ["Month", "Year", "New Clients"], [(1, 2025, 3), (2, 2025, 1)]
+    if query == AVG_ASSETS_REPORT:
+        return ["Avg Client Assets"], [(Decimal("622.2825"),)]
+    if query == HIGH_TRANSACTION_CLIENTS_REPORT:
+        start, _ = params
+        return ["Client", "Transaction Count"], [(f"Client {start:%Y-%m}", 11)]
+    if query == FIRST_TXN_DATE:
+        return ["MIN(txn_date)"], [(TRANSACTION_DATES[0],)]
+    if query == NEXT_TXN_DATE:
+        (after,) = params
+        later = [date for date in TRANSACTION_DATES if date >= after]
+        return ["MIN(txn_date)"], [(later[0] if later else None,)]
+    for table_name, result in TABLES.items():
+        if query == f"SELECT * FROM {table_name}":
+            return result
+    raise AssertionError(f"Unexpected query: {query}")
+
+
+class AsyncReportsTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.pool = FakePool(willson_financial)
+        # iter_table_batches asks for the server-side cursor class by name
+        patcher = unittest.mock.patch.object(
+            async_reports, "aiomysql", SimpleNamespace(SSCursor="SSCursor")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_new_client_report(self):
+        columns, rows = await async_reports.get_new_client_report(self.pool)
+        self.assertEqual(columns, ["Month", "Year", "New Clients"])
+        self.assertEqual(rows, [(1, 2025, 3), (2, 2025, 1)])
+
+    async def test_avg_assets_report(self):
+        columns, rows = await async_reports.get_avg_assets_report(self.pool)
+        self.assertEqual(columns, ["Avg Client Assets"])
+        self.assertEqual(rows, [(Decimal("622.2825"),)])
+
+    async def test_high_transaction_clients_report_uses_month_bounds(self):
+        columns, rows = await async_reports.get_high_transaction_clients_report(
+            self.pool, 2025, 12
+        )
+        self.assertEqual(columns, ["Client", "Transaction Count"])
+        self.assertEqual(rows, [("Client 2025-12", 11)])
+        self.assertEqual(self.pool.executed[-1][1], month_bounds(2025, 12))
+
+    async def test_available_dates_skip_months_without_transactions(self):
+        dates = await async_reports.get_available_dates(self.pool)
+        self.assertEqual(dates, {2025: [1, 2, 4]})
+        # One seek for the first month, then one per month found
+        self.assertEqual(len(self.pool.executed), len(TRANSACTION_DATES) + 1)
+
+    async def test_run_reports_concurrently_on_one_loop(self):
+        periods = [(2025, 1), (2025, 2), (2025, 4)]
+        results = await async_reports.run_reports(self.pool, periods)
+        self.assertEqual(
+            list(results),
+            [
+                "New Client Report",
+                "Average Assets Report",
+                "High Transaction Clients Report For 2025-01",
+                "High Transaction Clients Report For 2025-02",
+                "High Transaction Clients Report For 2025-04",
+            ],
+        )
+        self.assertEqual(
+            results["High Transaction Clients Report For 2025-02"][1],
+            [("Client 2025-02", 11)],
+        )
+        # Every report held a connection at the same time
+        self.assertEqual(self.pool.max_active, 2 + len(periods))
+
+    async def test_show_table_data_streams_batches_with_currency(self):
+        out = io.StringIO()
+        count = await async_reports.show_table_data(
+            self.pool, "assets", batch_size=1, out=out
+        )
+        self.assertEqual(count, 2)
+        text = out.getvalue()
+        self.assertIn("--- ASSETS ---", text)
+        self.assertIn("$1,234.57", text)
+        self.assertIn("$10.00", text)
+        self.assertEqual(self.pool.executed[-1][2], "SSCursor")
+
+    async def test_show_table_data_on_an_empty_table(self):
+        out = io.StringIO()
+        count = await async_reports.show_table_data(self.pool, "billings", out=out)
+        self.assertEqual(count, 0)
+        self.assertIn("No Data Found in billings.", out.getvalue())
+
+    async def test_show_tables_concurrently(self):
+        outputs = {table_name: io.StringIO() for table_name in TABLES}
+        counts = await asyncio.gather(
+            *(
+                async_reports.show_table_data(self.pool, table_name, 1, out)
+                for table_name, out in outputs.items()
+            )
+        )
+        self.assertEqual(counts, [3, 2, 0])
+        self.assertIn("Grace", outputs["clients"].getvalue())
+        self.assertEqual(self.pool.max_active, len(TABLES))
+
+
+if __name__ == "__main__":
+    unittest.main()
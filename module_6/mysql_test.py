@@ -9,31 +9,23 @@ Imports:
     - os: Used to interact with the operating system.
     - mysql.connector: Used to connect to MySQL database.
     - errorcode: Used to handle MySQL errors.
-    - load_dotenv: Used to interact with the `.env` file.
+    - get_connection: Used to check out a pooled connection configured from the `.env` file.
 """
 
 import os
-from dotenv import load_dotenv
+import sys
 
-load_dotenv()
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import mysql.connector
 from mysql.connector import errorcode
 
-if __name__ == "__main__":
-    config = {
-        "user": os.getenv("DB_USER"),
-        "password": os.getenv("DB_PASS"),
-        "host": os.getenv("DB_HOST"),
-        "database": os.getenv("DB_NAME"),
-        "port": os.getenv("DB_PORT"),
-        "raise_on_warnings": True,
-        "auth_plugin": "caching_sha2_password",
-    }
+from shared.connection import get_connection
 
+if __name__ == "__main__":
     db = None
     try:
-        db = mysql.connector.connect(**config)
+        db = get_connection()
         print(f"\nUser {os.getenv("DB_USER")} Connected")
         print(f"Host {os.getenv("DB_HOST")}")
         print(f"Database {os.getenv("DB_NAME")}")
@@ -9,57 +9,99 @@ Imports:
     - os: Used to interact with the operating system.
     - mysql.connector: Used to connect to MySQL database.
     - errorcode: Used to handle MySQL errors.
-    - load_dotenv: Used to interact with the `.env` file.
+    - argparse: Used to read the --format, --output and --profile options.
+    - get_connection: Used to check out a pooled connection configured from the `.env` file.
 """
 
+import argparse
 import os
+import sys
 import mysql.connector
 from mysql.connector import errorcode
-from dotenv import load_dotenv
 
-load_dotenv()
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import get_connection
+from shared.export import add_export_arguments, exporter_from_args
+from shared.profiling import add_profile_arguments, finish_profile, profiler_from_args
+
+parser = argparse.ArgumentParser(description="Queries the movies database.")
+add_export_arguments(parser)
+add_profile_arguments(parser)
+args = parser.parse_args()
+exporter = exporter_from_args(args)
+profiler = profiler_from_args(args)
+
+
+def export_query(cursor, name):
+    """
+    Writes the result of the last query to a file.
+
+    Parameters:
+        - cursor: Database cursor object with a pending result set.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - name: The name of the query, used for the file name.
+        :type name: str
+    """
+    path, count = exporter.export_cursor(cursor, name)
+    print(f"Exported {count} Rows to {path}\n")
+
 
 try:
-    # Establish database connection using os.getenv() to retrieve variables
-    db = mysql.connector.connect(
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASS"),
-        host=os.getenv("DB_HOST"),
-        database=os.getenv("DB_NAME"),
-    )
-    cursor = db.cursor()
+    # Check out a pooled connection configured from the .env variables
+    if profiler is not None:
+        with profiler.phase("connect"):
+            db = get_connection()
+        cursor = profiler.wrap_cursor(db.cursor())
+        sys.stdout = profiler.wrap_stream(sys.stdout)
+    else:
+        db = get_connection()
+        cursor = db.cursor()
 
     # Query 1: Select all from the studio table
     print("\n-- STUDIO TABLE --")
     cursor.execute("SELECT studio_id, studio_name FROM studio")
-    for row in cursor.fetchall():
-        print(f"Studio ID: {row[0]}\nStudio Name: {row[1]}\n")
+    if exporter is not None:
+        export_query(cursor, "studio")
+    else:
+        for row in cursor.fetchall():
+            print(f"Studio ID: {row[0]}\nStudio Name: {row[1]}\n")
     print("\n")  # Add space for readability
 
     # Query 2: Select all from the genre table
     print("-- GENRE TABLE --")
     cursor.execute("SELECT genre_id, genre_name FROM genre")
-    for row in cursor.fetchall():
-        print(f"Genre ID: {row[0]}\nGenre Name: {row[1]}\n")
+    if exporter is not None:
+        export_query(cursor, "genre")
+    else:
+        for row in cursor.fetchall():
+            print(f"Genre ID: {row[0]}\nGenre Name: {row[1]}\n")
     print("\n")
 
     # Query 3: Select movies with runtime < 120 minutes
     print("-- FILMS WITH RUNTIME LESS THAN 2 HOURS --")
     cursor.execute("SELECT film_name FROM film WHERE film_runtime < 120")
-    for row in cursor.fetchall():
-        print(f"Film Name: {row[0]}\n")
+    if exporter is not None:
+        export_query(cursor, "films_under_2_hours")
+    else:
+        for row in cursor.fetchall():
+            print(f"Film Name: {row[0]}\n")
     print("\n")
 
     # Query 4: Group films by director
     print("-- FILMS GROUPED BY DIRECTOR --")
     cursor.execute("SELECT film_director, film_name FROM film ORDER BY film_director")
 
-    current_director = ""
-    for director, film_name in cursor.fetchall():
-        if director != current_director:
-            current_director = director
-            print(f"Director: {current_director}")
-        print(f"  - {film_name}")
+    if exporter is not None:
+        export_query(cursor, "films_by_director")
+    else:
+        current_director = ""
+        for director, film_name in cursor.fetchall():
+            if director != current_director:
+                current_director = director
+                print(f"Director: {current_director}")
+            print(f"  - {film_name}")
 
 except mysql.connector.Error as err:
     print(f"Error: {err}")
@@ -71,3 +113,5 @@ finally:
     if "db" in locals() and db.is_connected():
         db.close()
         print("\nDatabase connection closed.")
+    sys.stdout = sys.__stdout__
+    finish_profile(profiler, args)
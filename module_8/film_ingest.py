@@ -0,0 +1,102 @@
+"""
+    Title: film_ingest.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Bulk loads films into the movies database.
+
+    The CSV header must contain film_name, film_releaseDate, film_runtime,
+    film_director, studio_name and genre_name. Studio and genre names are
+    resolved to ids once per distinct name.
+
+    Usage:
+        python film_ingest.py films.csv [--chunk-size 1000]
+"""
+
+import argparse
+import os
+import sys
+
+import mysql.connector
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.bulk_insert import (
+    DEFAULT_CHUNK_SIZE,
+    ForeignKeyLookup,
+    bulk_insert,
+    read_csv_rows,
+)
+from shared.connection import pooled_connection
+
+FILM_COLUMNS = [
+    "film_name",
+    "film_releaseDate",
+    "film_runtime",
+    "film_director",
+    "studio_id",
+    "genre_id",
+]
+
+
+def ingest_films(db, films, chunk_size=DEFAULT_CHUNK_SIZE, inserted_ids=None):
+    """
+    Inserts films, resolving their studio and genre names to ids.
+
+    Parameters:
+        - db: Database connection.
+        :type db: mysql.connector.connection.MySQLConnection
+
+        - films: The films to insert, as dictionaries with studio_name and
+          genre_name in place of the ids.
+        :type films: iterable
+
+        - chunk_size: The number of films inserted and committed together.
+        :type chunk_size: int
+
+        - inserted_ids: A list the film_id of each new film is appended to.
+        :type inserted_ids: list
+
+    Returns:
+        - The number of films inserted.
+        :rtype: int
+    """
+    return bulk_insert(
+        db,
+        "film",
+        FILM_COLUMNS,
+        films,
+        lookups={
+            "studio_id": (
+                "studio_name",
+                ForeignKeyLookup("studio", "studio_id", "studio_name"),
+            ),
+            "genre_id": (
+                "genre_name",
+                ForeignKeyLookup("genre", "genre_id", "genre_name"),
+            ),
+        },
+        chunk_size=chunk_size,
+        inserted_ids=inserted_ids,
+    )
+
+
+def main(argv=None):
+    """
+    Loads films from a CSV file.
+    """
+    parser = argparse.ArgumentParser(description="Bulk loads films from a CSV file.")
+    parser.add_argument("csv_file")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    try:
+        with pooled_connection() as db:
+            count = ingest_films(db, read_csv_rows(args.csv_file), args.chunk_size)
+        print(f"Inserted {count} Films.")
+    except (mysql.connector.Error, ValueError) as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+    Title: film_view.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: In-memory copy of the film/genre/studio join that is patched
+        with the rows each change touches instead of being queried again.
+
+    The view is loaded with one full join and keyed by film_id. After an
+    INSERT, UPDATE or DELETE the caller passes the ids it touched (from
+    `lastrowid` or a `SELECT ... FOR UPDATE` of the keys) and the new values,
+    so redisplaying the films costs nothing on the server. `verify` compares
+    the view against a full re-query.
+"""
+
+FILM_VIEW_COLUMNS = ["Name", "Director", "Genre", "Studio Name"]
+
+FILM_VIEW_QUERY = (
+    "SELECT film.film_id, film_name, film_director, genre_name, studio_name "
+    "FROM film "
+    "INNER JOIN genre ON film.genre_id = genre.genre_id "
+    "INNER JOIN studio ON film.studio_id = studio.studio_id"
+)
+
+
+class FilmView:
+    """
+    The joined film rows keyed by film_id.
+    """
+
+    columns = FILM_VIEW_COLUMNS
+
+    def __init__(self):
+        self._rows = {}
+        # The cursor description of the columns, for typed exports
+        self.description = None
+
+    def _query(self, cursor, film_ids=None):
+        """
+        Runs the join, for every film or only for the given ids.
+
+        Returns:
+            - The rows keyed by film_id.
+            :rtype: dict
+        """
+        if film_ids is None:
+            cursor.execute(FILM_VIEW_QUERY)
+        else:
+            placeholders = ", ".join(["%s"] * len(film_ids))
+            cursor.execute(
+                f"{FILM_VIEW_QUERY} WHERE film.film_id IN ({placeholders})",
+                list(film_ids),
+            )
+        self.description = cursor.description[1:]
+        return {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+
+    def load(self, cursor):
+        """
+        Reads every film with the full join.
+        """
+        self._rows = self._query(cursor)
+
+    def rows(self):
+        """
+        Returns the rows in film_id order.
+        """
+        return [self._rows[film_id] for film_id in sorted(self._rows)]
+
+    def insert(self, film_id, name, director, genre, studio):
+        """
+        Adds a film that was just inserted.
+        """
+        self._rows[film_id] = (name, director, genre, studio)
+
+    def delete(self, film_ids):
+        """
+        Removes the films that were just deleted.
+        """
+        for film_id in film_ids:
+            self._rows.pop(film_id, None)
+
+    def refresh(self, cursor, film_ids):
+        """
+        Re-reads only the given films, for changes whose result is unknown.
+
+        A film missing from the join, e.g. one that was deleted or whose
+        genre no longer exists, is removed from the view.
+
+        Parameters:
+            - cursor: Database cursor object.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+            - film_ids: The ids of the touched films.
+            :type film_ids: list
+        """
+        if not film_ids:
+            return
+        found = self._query(cursor, film_ids)
+        for film_id in film_ids:
+            if film_id in found:
+                self._rows[film_id] = found[film_id]
+            else:
+                self._rows.pop(film_id, None)
+
+    def verify(self, cursor):
+        """
+        Compares the view against a full re-query.
+
+        Parameters:
+            - cursor: Database cursor object.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+        Returns:
+            - One message per film that differs.
+            :rtype: list
+        """
+        expected = self._query(cursor)
+        problems = []
+        for film_id in sorted(expected.keys() | self._rows.keys()):
+            if expected.get(film_id) != self._rows.get(film_id):
+                problems.append(
+                    f"film_id {film_id}: expected {expected.get(film_id)}, "
+                    f"view has {self._rows.get(film_id)}"
+                )
+        return problems
@@ -1,22 +1,87 @@
 import mysql.connector
 from mysql.connector import errorcode
-from dotenv import load_dotenv
+import argparse
 import os
-
-load_dotenv()
-
-config = {
-    "user": os.getenv("DB_USER"),
-    "password": os.getenv("DB_PASS"),
-    "host": os.getenv("DB_HOST"),
-    "database": os.getenv("DB_NAME"),
-    "raise_on_warnings": True,
-}
-
-
-def show_films(cursor, title):
+import sys
+from film_ingest import ingest_films
+from film_view import FilmView
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from shared.connection import get_connection
+from shared.export import add_export_arguments, exporter_from_args
+from shared.prepared import prepared_statements
+from shared.profiling import add_profile_arguments, finish_profile, profiler_from_args
+from shared.sql_script import print_script_timings, run_script
+from shared.table_renderer import render_cursor, render_rows
+
+
+UPDATE_FILM_GENRE = (
+    "UPDATE film SET genre_id = (SELECT genre_id FROM genre WHERE genre_name = %s) "
+    "WHERE film_name = %s;"
+)
+
+DELETE_FILM = "DELETE FROM film WHERE film_name = %s;"
+
+# Locks the rows an UPDATE or DELETE by name is about to touch and returns
+# their keys, so the in-memory view can be patched afterwards.
+FILM_IDS_BY_NAME = "SELECT film_id FROM film WHERE film_name = %s FOR UPDATE;"
+
+NEW_FILMS = [
+    {
+        "film_name": "Inception",
+        "film_releaseDate": "2010",
+        "film_runtime": 148,
+        "film_director": "Christopher Nolan",
+        "studio_name": "Warner Bros",
+        "genre_name": "SciFi",
+    }
+]
+
+parser = argparse.ArgumentParser(description="Updates and deletes movies.")
+parser.add_argument(
+    "--incremental",
+    action="store_true",
+    help="Query the films once and patch the displayed rows with the rows each "
+    "change touches, instead of re-running the join after every change.",
+)
+parser.add_argument(
+    "--verify",
+    action="store_true",
+    help="With --incremental, compare the patched rows against a full re-query "
+    "after every change.",
+)
+add_export_arguments(parser)
+add_profile_arguments(parser)
+args = parser.parse_args()
+if args.verify:
+    args.incremental = True
+exporter = exporter_from_args(args)
+profiler = profiler_from_args(args)
+verify_failures = []
+
+
+def show_films(cursor, title, view=None):
     """Function to display films with joined genre and studio info."""
     print(f"\n\n-- {title} --")
+    if view is not None:
+        rows = view.rows()
+        if exporter is not None:
+            path, count = exporter.export_rows(
+                title, view.columns, rows, view.description
+            )
+            print(f"Exported {count} rows to {path}")
+        else:
+            render_rows(view.columns, rows)
+        if args.verify:
+            problems = view.verify(cursor)
+            for problem in problems:
+                print(f"***View Differs: {problem}")
+            if not problems:
+                print("View Matches a Full Re-Query.")
+            verify_failures.extend(problems)
+        return
+
     query = (
         "SELECT film_name AS Name, film_director AS Director, genre_name AS Genre, studio_name AS 'Studio Name' "
         "FROM film "
@@ -24,19 +89,35 @@ def show_films(cursor, title):
         "INNER JOIN studio ON film.studio_id = studio.studio_id;"
     )
     cursor.execute(query)
-    rows = cursor.fetchall()
-    print(f"{'-' * 70}")
-    print(
-        "{:<20} {:<20} {:<10} {:<20}".format("Name", "Director", "Genre", "Studio Name")
-    )
-    print(f"{'-' * 70}")
-    for row in rows:
-        print("{:<20} {:<20} {:<10} {:<20}".format(*row))
+    if exporter is not None:
+        path, count = exporter.export_cursor(cursor, title)
+        print(f"Exported {count} rows to {path}")
+    else:
+        render_cursor(cursor)
+
+
+def touched_film_ids(film_name):
+    """Locks the films with a name and returns their ids."""
+    results = prepared.execute(FILM_IDS_BY_NAME, (film_name,))
+    return [row[0] for row in results.fetchall()]
 
 
+db = None
+cursor = None
 try:
-    db = mysql.connector.connect(**config)
-    cursor = db.cursor()
+    if profiler is not None:
+        with profiler.phase("connect"):
+            db = get_connection()
+        cursor = profiler.wrap_cursor(db.cursor())
+        sys.stdout = profiler.wrap_stream(sys.stdout)
+    else:
+        db = get_connection()
+        cursor = db.cursor()
+    # Parameters go through the binary protocol instead of being quoted into the SQL
+    prepared = prepared_statements(
+        db, profiler.wrap_cursor if profiler is not None else None
+    )
+    view = FilmView() if args.incremental else None
 
     # Re-initialize the database by executing the SQL script
     print("\nRe-initializing database...")
@@ -45,65 +126,66 @@ try:
     with open(sql_file_path, "r") as sql_file:
         sql_script = sql_file.read()
 
-    # Split the script into individual statements and execute them
-    sql_commands = sql_script.split(";")
-    for command in sql_commands:
-        if command.strip() != "":
-            cursor.execute(command)
+    # Run the script in batches of statements inside a single transaction.
+    # It runs every time: the insert, update and delete below change the
+    # tables, so they never still hold what the script loaded.
+    statements, round_trips = run_script(db, sql_script)
     print("\nDatabase re-initialized successfully.")
-    db.commit()
+    print_script_timings(statements, round_trips)
 
     # 1. Display films before insertion
-    show_films(cursor, "DISPLAYING FILMS")
-
-    # First, get the studio_id for Warner Bros
-    cursor.execute(
-        "SELECT studio_id FROM studio WHERE studio_name = %s", ("Warner Bros",)
-    )
-    studio_result = cursor.fetchone()
-    if studio_result is None:
-        print("Warner Bros studio not found in database")
-        exit(1)
-    studio_id = studio_result[0]
-
-    # Next, get the genre_id for SciFi
-    cursor.execute("SELECT genre_id FROM genre WHERE genre_name = %s", ("SciFi",))
-    genre_result = cursor.fetchone()
-    if genre_result is None:
-        print("SciFi genre not found in database")
+    if view is not None:
+        # The only full join of an incremental run
+        view.load(cursor)
+    show_films(cursor, "DISPLAYING FILMS", view)
+
+    # Insert the film, resolving the studio and genre names to their ids
+    inserted_ids = []
+    try:
+        ingest_films(db, NEW_FILMS, inserted_ids=inserted_ids)
+    except ValueError as err:
+        print(err)
         exit(1)
-    genre_id = genre_result[0]
-
-    # Now insert the film with the obtained IDs
-    insert_film = (
-        "INSERT INTO film (film_name, film_releaseDate, film_runtime, film_director, studio_id, genre_id) "
-        "VALUES (%s, %s, %s, %s, %s, %s)"
-    )
-    cursor.execute(
-        insert_film,
-        ("Inception", "2010", 148, "Christopher Nolan", studio_id, genre_id),
-    )
-    db.commit()
+    if view is not None:
+        if len(inserted_ids) == len(NEW_FILMS):
+            for film_id, film in zip(inserted_ids, NEW_FILMS):
+                view.insert(
+                    film_id,
+                    film["film_name"],
+                    film["film_director"],
+                    film["genre_name"],
+                    film["studio_name"],
+                )
+        else:
+            # No AUTO_INCREMENT ids came back, so the new rows are unknown
+            view.load(cursor)
 
     # 2. Display films after insertion
-    show_films(cursor, "DISPLAYING FILMS AFTER INSERT")
+    show_films(cursor, "DISPLAYING FILMS AFTER INSERT", view)
 
-    update_query = (
-        "UPDATE film SET genre_id = (SELECT genre_id FROM genre WHERE genre_name = 'Horror') "
-        "WHERE film_name = 'Alien';"
-    )
-    cursor.execute(update_query)
+    film_ids = touched_film_ids("Alien") if view is not None else []
+    prepared.execute(UPDATE_FILM_GENRE, ("Horror", "Alien"))
     db.commit()
+    if view is not None:
+        # Re-read rather than set the genre name, since a missing genre sets
+        # genre_id to NULL and drops the film from the join
+        view.refresh(cursor, film_ids)
 
     # 3. Display films after update
-    show_films(cursor, "DISPLAYING FILMS AFTER UPDATE - Changed Alien to Horror")
+    show_films(cursor, "DISPLAYING FILMS AFTER UPDATE - Changed Alien to Horror", view)
 
     # 4. Delete 'Gladiator'
-    cursor.execute("DELETE FROM film WHERE film_name = 'Gladiator';")
+    film_ids = touched_film_ids("Gladiator") if view is not None else []
+    deleted = prepared.execute(DELETE_FILM, ("Gladiator",)).rowcount
     db.commit()
+    if view is not None:
+        if deleted == len(film_ids):
+            view.delete(film_ids)
+        else:
+            view.refresh(cursor, film_ids)
 
     # 5. Display films after deletion
-    show_films(cursor, "DISPLAYING FILMS AFTER DELETE")
+    show_films(cursor, "DISPLAYING FILMS AFTER DELETE", view)
 
 except mysql.connector.Error as err:
     if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
@@ -113,5 +195,12 @@ except mysql.connector.Error as err:
     else:
         print(err)
 finally:
-    cursor.close()
-    db.close()
+    if cursor:
+        cursor.close()
+    if db and db.is_connected():
+        db.close()
+    sys.stdout = sys.__stdout__
+    finish_profile(profiler, args)
+
+if verify_failures:
+    sys.exit(1)
@@ -0,0 +1,6 @@
+"""
+    Title: shared
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Helpers shared by the module scripts in this repository.
+"""
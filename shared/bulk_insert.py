@@ -0,0 +1,203 @@
+"""
+    Title: bulk_insert.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Bulk inserts rows with `executemany` in committed chunks.
+
+    Rows are read from any iterable of dictionaries, such as a CSV file.
+    Columns that hold names of related records (a studio name, a client
+    name) are swapped for their ids with one lookup query per chunk for the
+    names not seen before. Each chunk is inserted with `executemany`, which
+    MySQL Connector/Python sends as a single multi-row INSERT, and committed
+    once.
+
+    The columns, which may come from a CSV header, are checked against
+    information_schema before they are put into the INSERT.
+"""
+
+import csv
+from itertools import islice
+
+from shared.keyset import TABLE_COLUMNS
+
+# The number of rows inserted and committed together.
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class ForeignKeyLookup:
+    """
+    Resolves names to ids and remembers every name it has resolved.
+    """
+
+    def __init__(self, table, id_column, name_column):
+        """
+        Parameters:
+            - table: The table holding the referenced records.
+            :type table: str
+
+            - id_column: The id column of that table.
+            :type id_column: str
+
+            - name_column: The name column of that table.
+            :type name_column: str
+        """
+        self.table = table
+        self.id_column = id_column
+        self.name_column = name_column
+        self._ids = {}
+
+    def resolve(self, cursor, names):
+        """
+        Looks up the ids of the names that have not been resolved yet.
+
+        Parameters:
+            - cursor: Database cursor object.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+            - names: The names used by the next chunk of rows.
+            :type names: set
+
+        Raises:
+            - ValueError: If a name does not exist in the table, or belongs
+              to more than one record and so does not say which one is meant.
+        """
+        missing = [name for name in names if name not in self._ids]
+        if not missing:
+            return
+        # Each name comes back as given, so names the column's collation
+        # treats as equal, e.g. in another case, resolve to the right id
+        wanted = " UNION ALL ".join(["SELECT %s AS name"] * len(missing))
+        cursor.execute(
+            f"SELECT wanted.name, t.{self.id_column} FROM ({wanted}) AS wanted "
+            f"JOIN {self.table} t ON t.{self.name_column} = wanted.name",
+            missing,
+        )
+        found = {}
+        for name, record_id in cursor.fetchall():
+            if name in found and found[name] != record_id:
+                raise ValueError(
+                    f"{self.table} '{name}' Is Ambiguous, Give "
+                    f"{self.id_column} Instead"
+                )
+            found[name] = record_id
+        self._ids.update(found)
+        for name in missing:
+            if name not in self._ids:
+                raise ValueError(f"{self.table} '{name}' Not Found in Database")
+
+    def __getitem__(self, name):
+        return self._ids[name]
+
+
+def read_csv_rows(path):
+    """
+    Yields the rows of a CSV file as dictionaries keyed by the header.
+
+    Parameters:
+        - path: The CSV file to read.
+        :type path: str
+
+    Yields:
+        - One dictionary per row, with empty values as None.
+        :rtype: dict
+    """
+    with open(path, newline="", encoding="utf-8") as csv_file:
+        for row in csv.DictReader(csv_file):
+            yield {key: value if value != "" else None for key, value in row.items()}
+
+
+def bulk_insert(
+    db,
+    table,
+    columns,
+    rows,
+    lookups=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    inserted_ids=None,
+):
+    """
+    Inserts rows into a table in chunks, committing once per chunk.
+
+    Parameters:
+        - db: Database connection.
+        :type db: mysql.connector.connection.MySQLConnection
+
+        - table: The table to insert into.
+        :type table: str
+
+        - columns: The table columns to fill, read from the row keys of the
+          same name.
+        :type columns: list
+
+        - rows: The rows to insert, as dictionaries.
+        :type rows: iterable
+
+        - lookups: Maps a table column to the row key holding the referenced
+          name and the lookup that resolves it, e.g.
+          `{"studio_id": ("studio_name", studio_lookup)}`.
+        :type lookups: dict
+
+        - chunk_size: The number of rows inserted and committed together.
+        :type chunk_size: int
+
+        - inserted_ids: A list the AUTO_INCREMENT ids of the new rows are
+          appended to. MySQL gives the rows of a multi-row INSERT ... VALUES
+          consecutive ids in every innodb_autoinc_lock_mode, starting at
+          `lastrowid`.
+        :type inserted_ids: list
+
+    Returns:
+        - The number of rows inserted.
+        :rtype: int
+
+    Raises:
+        - ValueError: If the table does not exist or a column is not one of
+          its columns.
+    """
+    lookups = lookups or {}
+    cursor = db.cursor()
+    try:
+        cursor.execute(TABLE_COLUMNS, (table,))
+        table_columns = {row[0] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+    if not table_columns:
+        raise ValueError(f"Table '{table}' Not Found.")
+    for column in columns:
+        if column not in table_columns:
+            raise ValueError(f"Unknown Column '{column}' in {table}.")
+
+    insert = (
+        f"INSERT INTO `{table}` ({', '.join(f'`{column}`' for column in columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))})"
+    )
+    getters = []
+    for column in columns:
+        if column in lookups:
+            key, lookup = lookups[column]
+            getters.append(lambda row, key=key, lookup=lookup: lookup[row[key]])
+        else:
+            getters.append(lambda row, column=column: row[column])
+
+    inserted = 0
+    cursor = db.cursor()
+    try:
+        rows = iter(rows)
+        while chunk := list(islice(rows, chunk_size)):
+            for key, lookup in lookups.values():
+                lookup.resolve(cursor, {row[key] for row in chunk})
+            cursor.executemany(
+                insert, [tuple(get(row) for get in getters) for row in chunk]
+            )
+            if inserted_ids is not None and cursor.lastrowid:
+                inserted_ids.extend(
+                    range(cursor.lastrowid, cursor.lastrowid + len(chunk))
+                )
+            db.commit()
+            inserted += len(chunk)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+    return inserted
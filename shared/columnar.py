@@ -0,0 +1,350 @@
+"""
+    Title: columnar.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Compact column-wise storage for fetched result sets.
+
+    A list of fetched rows holds a tuple per row and a boxed object per
+    value; a `Decimal` alone takes over 100 bytes. ColumnarRows keeps each
+    column in a typed `array` instead:
+        - int: 8 byte integers.
+        - float: 8 byte floats.
+        - decimal.Decimal: 8 byte integers scaled by the column's scale.
+        - datetime.date: 4 byte day ordinals.
+        - anything else: a list, with repeated strings shared.
+
+    Rows are rebuilt as tuples on access, so a ColumnarRows can be iterated,
+    indexed, sliced and measured with `len` like the list it replaces.
+    Decimals come back with the column's scale, e.g. `Decimal("5.00")` for a
+    stored `Decimal("5")`, which compares equal.
+"""
+
+import datetime
+from array import array
+from decimal import Decimal
+
+# Repeated strings are shared until a column has this many distinct values,
+# after which the column is assumed to be mostly unique and sharing stops.
+MAX_SHARED_STRINGS = 4096
+
+# Scaled decimals must fit in a signed 64 bit integer.
+MAX_SCALED = 2**63 - 1
+
+_date_from_ordinal = datetime.date.fromordinal
+
+
+class _Column:
+    """
+    One column of a ColumnarRows. The storage kind is picked from the first
+    non-NULL value and falls back to a list if a later value does not fit.
+    """
+
+    __slots__ = ("kind", "values", "scale", "nulls", "_shared")
+
+    def __init__(self):
+        self.kind = None
+        self.values = []
+        self.scale = 0
+        self.nulls = None
+        self._shared = {}
+
+    def _to_objects(self, size):
+        """
+        Switches the column to a plain list, e.g. when types are mixed.
+        """
+        values = [self.get(index) for index in range(size)]
+        self.kind = "object"
+        self.values = values
+        self.nulls = None
+        self._shared = None
+
+    def append(self, value, index):
+        """
+        Appends the value of row `index` to the column.
+        """
+        kind = self.kind
+        if value is None and kind != "object":
+            if self.nulls is None:
+                self.nulls = bytearray(index)
+            self.nulls.append(1)
+            self.values.append(0 if kind is not None else None)
+            return
+        if self.nulls is not None:
+            self.nulls.append(0)
+
+        if kind is None:
+            kind = self._start(value, index)
+
+        value_type = type(value)
+        if kind == "int" and value_type is int:
+            if -MAX_SCALED <= value <= MAX_SCALED:
+                self.values.append(value)
+                return
+        elif kind == "float" and value_type is float:
+            self.values.append(value)
+            return
+        elif kind == "date" and value_type is datetime.date:
+            self.values.append(value.toordinal())
+            return
+        elif kind == "decimal" and value_type is Decimal and value.is_finite():
+            scale = -value.as_tuple().exponent
+            if scale > self.scale:
+                self._rescale(scale, index)
+            scaled = int(value.scaleb(self.scale))
+            if self.kind == "decimal" and -MAX_SCALED <= scaled <= MAX_SCALED:
+                self.values.append(scaled)
+                return
+        elif kind == "object":
+            if value_type is str and self._shared is not None:
+                value = self._shared.setdefault(value, value)
+                if len(self._shared) > MAX_SHARED_STRINGS:
+                    self._shared = None
+            self.values.append(value)
+            return
+
+        # The value does not fit the typed storage
+        if self.nulls is not None:
+            self.nulls.pop()
+        self._to_objects(index)
+        self.append(value, index)
+
+    def extend(self, values, start):
+        """
+        Appends the values of rows `start` onwards, converting the whole batch
+        at once when every value has the column's type.
+        """
+        kind = self.kind
+        if self.nulls is None and kind in _TYPES and set(map(type, values)) == {
+            _TYPES[kind]
+        }:
+            try:
+                converted = _CONVERTERS[kind](self, values)
+            except OverflowError:
+                converted = None
+            if converted is not None:
+                self.values.extend(converted)
+                return
+        elif kind == "object" and self._shared is None:
+            self.values.extend(values)
+            return
+        for offset, value in enumerate(values):
+            self.append(value, start + offset)
+
+    def _start(self, value, index):
+        """
+        Picks the storage kind from the first non-NULL value.
+        """
+        value_type = type(value)
+        if value_type is int:
+            kind, typecode = "int", "q"
+        elif value_type is float:
+            kind, typecode = "float", "d"
+        elif value_type is Decimal:
+            kind, typecode = "decimal", "q"
+        elif value_type is datetime.date:
+            kind, typecode = "date", "i"
+        else:
+            kind, typecode = "object", None
+        self.kind = kind
+        if typecode is not None:
+            # The NULLs seen so far become zeros in the typed storage
+            self.values = array(typecode, [0] * index)
+        return kind
+
+    def _rescale(self, scale, size):
+        """
+        Raises the scale of a decimal column, rescaling the stored values.
+        """
+        factor = 10 ** (scale - self.scale)
+        if any(abs(value) > MAX_SCALED // factor for value in self.values):
+            self._to_objects(size)
+            return
+        self.values = array("q", [value * factor for value in self.values])
+        self.scale = scale
+
+    def get(self, index):
+        """
+        Returns the value of row `index` as it was fetched.
+        """
+        if self.nulls is not None and self.nulls[index]:
+            return None
+        value = self.values[index]
+        kind = self.kind
+        if kind == "decimal":
+            return Decimal(value).scaleb(-self.scale)
+        if kind == "date":
+            return _date_from_ordinal(value)
+        return value
+
+    def decode(self, start, stop):
+        """
+        Returns the values of rows `start` to `stop` as a list.
+        """
+        kind = self.kind
+        values = self.values[start:stop]
+        if kind == "decimal":
+            scale = -self.scale
+
+            def convert(value):
+                return Decimal(value).scaleb(scale)
+
+        elif kind == "date":
+            convert = _date_from_ordinal
+        else:
+            convert = None
+
+        if self.nulls is None:
+            return list(values) if convert is None else list(map(convert, values))
+        # NULLs are stored as 0, which is not a valid date ordinal, so the
+        # mask is applied before converting
+        nulls = self.nulls[start:stop]
+        if convert is None:
+            return [None if null else value for value, null in zip(values, nulls)]
+        return [None if null else convert(value) for value, null in zip(values, nulls)]
+
+    def __getstate__(self):
+        # The shared string table is only needed while appending
+        return self.kind, self.values, self.scale, self.nulls
+
+    def __setstate__(self, state):
+        self.kind, self.values, self.scale, self.nulls = state
+        self._shared = None
+
+    @property
+    def nbytes(self):
+        """
+        The size of the column buffers; list entries count as pointers only.
+        """
+        if isinstance(self.values, array):
+            size = self.values.itemsize * len(self.values)
+        else:
+            size = 8 * len(self.values)
+        return size + (len(self.nulls) if self.nulls is not None else 0)
+
+
+def _convert_decimals(column, values):
+    scaled = [value.scaleb(column.scale) for value in values]
+    integers = list(map(int, scaled))
+    # Values with more decimal places than the column take the slow path
+    if integers != scaled:
+        return None
+    return array("q", integers)
+
+
+_TYPES = {
+    "int": int,
+    "float": float,
+    "decimal": Decimal,
+    "date": datetime.date,
+}
+
+_CONVERTERS = {
+    "int": lambda column, values: array("q", values),
+    "float": lambda column, values: array("d", values),
+    "decimal": _convert_decimals,
+    "date": lambda column, values: array(
+        "i", map(datetime.date.toordinal, values)
+    ),
+}
+
+
+class ColumnarRows:
+    """
+    A result set stored column-wise, read back as tuples.
+    """
+
+    __slots__ = ("column_names", "_columns", "_length")
+
+    def __init__(self, column_names, rows=()):
+        """
+        Parameters:
+            - column_names: The column names of the result set.
+            :type column_names: list
+
+            - rows: The first rows to store.
+            :type rows: iterable
+        """
+        self.column_names = list(column_names)
+        self._columns = [_Column() for _ in self.column_names]
+        self._length = 0
+        self.extend(rows)
+
+    @classmethod
+    def from_cursor(cls, cursor, batch_size=1000):
+        """
+        Fetches the current result set of a cursor in batches.
+
+        Parameters:
+            - cursor: Database cursor object with a pending result set.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+            - batch_size: The number of rows fetched at a time.
+            :type batch_size: int
+
+        Returns:
+            - The stored result set.
+            :rtype: ColumnarRows
+        """
+        result = cls([i[0] for i in cursor.description])
+        while rows := cursor.fetchmany(batch_size):
+            result.extend(rows)
+        return result
+
+    def extend(self, rows):
+        """
+        Appends rows to the result set.
+
+        Parameters:
+            - rows: Tuples with one value per column.
+            :type rows: iterable
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        for column, values in zip(self._columns, zip(*rows)):
+            column.extend(values, self._length)
+        self._length += len(rows)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        # Rows are rebuilt a slice at a time to keep the decoding vectorized
+        step = 1024
+        for start in range(0, self._length, step):
+            stop = min(start + step, self._length)
+            yield from zip(*[column.decode(start, stop) for column in self._columns])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return list(
+                zip(*[column.decode(start, stop) for column in self._columns])
+            )
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnarRows index out of range")
+        return tuple(column.get(index) for column in self._columns)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"<ColumnarRows {len(self)} rows x {len(self.column_names)} columns>"
+
+    def __getstate__(self):
+        return self.column_names, self._columns, self._length
+
+    def __setstate__(self, state):
+        self.column_names, self._columns, self._length = state
+
+    @property
+    def nbytes(self):
+        """
+        The size of the column buffers, not counting the objects held by
+        object columns.
+        """
+        return sum(column.nbytes for column in self._columns)
@@ -0,0 +1,231 @@
+"""
+    Title: connection.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Shared connection factory backed by a MySQL connection pool.
+
+    Every script reads the same environment variables and checks connections
+    out of one pool per database, so the TCP and authentication handshake is
+    paid once per process rather than once per report.
+
+    The pool opens all of its connections when it is created, so it holds
+    one connection unless the caller asks for more. Scripts that run
+    reports in parallel size the pool with `get_pool` before connecting.
+
+    Environment Variables:
+        - DB_USER: The database user.
+        - DB_PASSWORD: The database password (`DB_PASS` is also accepted).
+        - DB_HOST: The database host, defaults to `localhost`.
+        - DB_PORT: The database port, optional.
+        - DB_NAME: The default database, used when none is given.
+        - DB_AUTH_PLUGIN: The authentication plugin, optional.
+        - DB_POOL_SIZE: The number of pooled connections when the caller
+          does not give one, defaults to 1.
+        - DB_ENV_FILE: The `.env` file to load, optional. Skips searching the
+          parent directories for one.
+        - DB_USE_PURE: Set to 1 to use the pure Python driver even when the
+          C extension is installed.
+        - DB_DRY_RUN: Set to 1 to stop with DryRun right before the first
+          pool is created, after the settings are resolved and the driver is
+          loaded. Used to time how long a command takes to get ready.
+
+    The `.env` file is read and the settings are resolved once per process,
+    on first use, and the MySQL driver is only loaded when a connection is
+    made, so importing this module costs next to nothing.
+"""
+
+import functools
+import os
+import threading
+from contextlib import contextmanager
+
+from shared.lazy import lazy_import
+
+mysql = lazy_import("mysql.connector")
+
+# Most scripts use one connection at a time, and every pooled connection
+# is a handshake paid up front.
+DEFAULT_POOL_SIZE = 1
+
+# The largest pool mysql.connector allows (pooling.CNX_POOL_MAXSIZE), kept
+# here so checking a pool size does not load the driver.
+POOL_MAX_SIZE = 32
+
+_pools = {}
+_pools_lock = threading.Lock()
+# Pools inherited from the parent of a forked process, see reset_pools()
+_inherited_pools = []
+
+
+class DryRun(SystemExit):
+    """
+    Raised instead of connecting when DB_DRY_RUN is set. It exits with
+    status 0 unless a caller catches it.
+    """
+
+
+@functools.cache
+def load_environment():
+    """
+    Loads the `.env` file into the environment, once per process.
+
+    Variables already set in the environment are not overridden.
+    """
+    from dotenv import load_dotenv
+
+    env_file = os.getenv("DB_ENV_FILE")
+    if env_file:
+        load_dotenv(env_file)
+    else:
+        load_dotenv()
+
+
+def get_db_config(database=None):
+    """
+    Builds the connection settings from environment variables.
+
+    Parameters:
+        - database: The database to connect to, defaults to `DB_NAME`.
+        :type database: str
+
+    Returns:
+        - The keyword arguments for `mysql.connector.connect`. The caller
+          gets its own copy and may change it.
+        :rtype: dict
+    """
+    return dict(_resolve_config(database))
+
+
+@functools.cache
+def _resolve_config(database):
+    """
+    Resolves the connection settings of a database, once per process.
+    """
+    load_environment()
+    config = {
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD") or os.getenv("DB_PASS"),
+        "host": os.getenv("DB_HOST", "localhost"),
+        "database": database or os.getenv("DB_NAME"),
+        "raise_on_warnings": True,
+    }
+    if port := os.getenv("DB_PORT"):
+        config["port"] = int(port)
+    if auth_plugin := os.getenv("DB_AUTH_PLUGIN"):
+        config["auth_plugin"] = auth_plugin
+    return config
+
+
+def has_credentials(config):
+    """
+    Checks whether a configuration has both a user name and a password.
+
+    Parameters:
+        - config: The connection settings.
+        :type config: dict
+
+    Returns:
+        - True if the user name and password are set.
+        :rtype: bool
+    """
+    return bool(config["user"] and config["password"])
+
+
+def get_pool(database=None, pool_size=None):
+    """
+    Returns the connection pool for a database, creating it on first use.
+
+    Parameters:
+        - database: The database to connect to, defaults to `DB_NAME`.
+        :type database: str
+
+        - pool_size: The number of pooled connections. Only used when the
+          pool is created, defaults to `DB_POOL_SIZE`.
+        :type pool_size: int
+
+    Returns:
+        - The connection pool.
+        :rtype: mysql.connector.pooling.MySQLConnectionPool
+    """
+    from mysql.connector import pooling
+
+    from shared.prepared import c_extension_available
+
+    config = get_db_config(database)
+    key = config["database"]
+    if os.getenv("DB_DRY_RUN") == "1" and key not in _pools:
+        c_extension_available()
+        raise DryRun(0)
+    with _pools_lock:
+        if key not in _pools:
+            # Rows are decoded in C when the extension is installed
+            config["use_pure"] = not c_extension_available()
+            _pools[key] = pooling.MySQLConnectionPool(
+                pool_name=f"{key or 'default'}_pool"[:pooling.CNX_POOL_MAXNAMESIZE],
+                pool_size=pool_size
+                or int(os.getenv("DB_POOL_SIZE", DEFAULT_POOL_SIZE)),
+                pool_reset_session=True,
+                **config,
+            )
+        return _pools[key]
+
+
+def reset_pools():
+    """
+    Forgets every pool without closing its connections.
+
+    A process forked from one that has pools inherits them, and with them
+    the sockets of the parent's connections. The child calls this before
+    connecting so it opens connections of its own.
+    """
+    global _pools_lock
+    # Kept referenced, so collecting them cannot close the parent's sockets
+    _inherited_pools.extend(_pools.values())
+    _pools.clear()
+    # The lock may have been held by another thread at the time of the fork
+    _pools_lock = threading.Lock()
+
+
+def get_connection(database=None):
+    """
+    Checks a connection out of the pool after making sure it is still alive.
+
+    Calling `close()` on the connection returns it to the pool.
+
+    Parameters:
+        - database: The database to connect to, defaults to `DB_NAME`.
+        :type database: str
+
+    Returns:
+        - A pooled connection.
+        :rtype: mysql.connector.pooling.PooledMySQLConnection
+    """
+    connection = get_pool(database).get_connection()
+    try:
+        # Health check: a connection dropped by the server while idle in the
+        # pool is re-established here instead of failing the first query
+        connection.ping(reconnect=True, attempts=2, delay=0)
+    except mysql.connector.Error:
+        connection.close()
+        raise
+    return connection
+
+
+@contextmanager
+def pooled_connection(database=None):
+    """
+    Context manager that checks out a connection and returns it to the pool.
+
+    Parameters:
+        - database: The database to connect to, defaults to `DB_NAME`.
+        :type database: str
+
+    Yields:
+        - A pooled connection.
+        :rtype: mysql.connector.pooling.PooledMySQLConnection
+    """
+    connection = get_connection(database)
+    try:
+        yield connection
+    finally:
+        connection.close()
@@ -0,0 +1,347 @@
+"""
+    Title: export.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Streams query results to CSV, JSON Lines or Parquet files.
+
+    Writers consume the cursor batch by batch, so an export holds one batch
+    in memory no matter how large the table is. Values are written as they
+    come back from MySQL, e.g. amounts stay numeric instead of being
+    formatted as currency.
+
+    Parquet export needs the optional `pyarrow` package.
+"""
+
+import csv
+import json
+import os
+import re
+
+# The number of rows fetched and written at a time.
+DEFAULT_BATCH_SIZE = 1000
+
+# "table" keeps the text output; the others write one file per report.
+EXPORT_FORMATS = ("table", "csv", "jsonl", "parquet")
+
+# MySQL protocol type codes, as in mysql.connector.FieldType, grouped by the
+# Arrow type their values are written as.
+INTEGER_TYPE_CODES = {1, 2, 3, 8, 9, 13, 16}  # TINY..LONGLONG, INT24, YEAR, BIT
+FLOAT_TYPE_CODES = {4, 5}  # FLOAT, DOUBLE
+DECIMAL_TYPE_CODES = {0, 246}  # DECIMAL, NEWDECIMAL
+DATE_TYPE_CODES = {10, 14}  # DATE, NEWDATE
+DATETIME_TYPE_CODES = {7, 12}  # TIMESTAMP, DATETIME
+TIME_TYPE_CODE = 11
+BLOB_TYPE_CODES = {249, 250, 251, 252}  # TINY_BLOB..BLOB, also used for TEXT
+BINARY_CHARSET = 63
+
+# MySQL Connector/Python leaves precision and scale out of the description,
+# so DECIMAL columns are written with the widest Arrow precision and a
+# scale that holds every DECIMAL(p, 2) value and the scale-6 averages of
+# them. Values with more decimal places fail the export instead of being
+# rounded.
+DEFAULT_DECIMAL_PRECISION = 38
+DEFAULT_DECIMAL_SCALE = 10
+
+
+class CsvWriter:
+    """
+    Writes batches of rows to a CSV file with a header row.
+    """
+
+    extension = "csv"
+
+    def __init__(self, path, column_names, description=None):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(column_names)
+
+    def write_batch(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class JsonLinesWriter:
+    """
+    Writes batches of rows to a JSON Lines file, one object per row.
+
+    Dates and decimals are written as strings.
+    """
+
+    extension = "jsonl"
+
+    def __init__(self, path, column_names, description=None):
+        self._file = open(path, "w", encoding="utf-8")
+        self._column_names = list(column_names)
+        self._encode = json.JSONEncoder(default=str).encode
+
+    def write_batch(self, rows):
+        names = self._column_names
+        encode = self._encode
+        self._file.write(
+            "".join([encode(dict(zip(names, row))) + "\n" for row in rows])
+        )
+
+    def close(self):
+        self._file.close()
+
+
+def _arrow_type(pyarrow, column):
+    """
+    Returns the Arrow type of a column of a MySQL cursor description.
+
+    Returns:
+        - The type, or None when the description does not say.
+        :rtype: pyarrow.DataType
+    """
+    type_code = column[1]
+    if not isinstance(type_code, int):
+        return None
+    if type_code in INTEGER_TYPE_CODES:
+        return pyarrow.int64()
+    if type_code in FLOAT_TYPE_CODES:
+        return pyarrow.float64()
+    if type_code in DECIMAL_TYPE_CODES:
+        precision, scale = column[4:6] if len(column) >= 6 else (None, None)
+        if precision is None or scale is None:
+            precision, scale = DEFAULT_DECIMAL_PRECISION, DEFAULT_DECIMAL_SCALE
+        return pyarrow.decimal128(min(precision, DEFAULT_DECIMAL_PRECISION), scale)
+    if type_code in DATE_TYPE_CODES:
+        return pyarrow.date32()
+    if type_code in DATETIME_TYPE_CODES:
+        return pyarrow.timestamp("us")
+    if type_code == TIME_TYPE_CODE:
+        return pyarrow.duration("us")
+    if type_code in BLOB_TYPE_CODES and len(column) > 8:
+        if column[8] == BINARY_CHARSET:
+            return pyarrow.binary()
+    return pyarrow.string()
+
+
+def arrow_schema(pyarrow, column_names, description):
+    """
+    Builds the Arrow schema of a result set from its cursor description.
+
+    Parameters:
+        - pyarrow: The pyarrow module.
+        :type pyarrow: module
+
+        - column_names: The names of the fields.
+        :type column_names: list
+
+        - description: The cursor description, MySQL type codes in the
+          second position.
+        :type description: list
+
+    Returns:
+        - The schema, or None if a column has no known type, e.g. from an
+          SQLite cursor.
+        :rtype: pyarrow.Schema
+    """
+    types = [_arrow_type(pyarrow, column) for column in description]
+    if any(arrow_type is None for arrow_type in types):
+        return None
+    return pyarrow.schema(
+        [pyarrow.field(name, type_) for name, type_ in zip(column_names, types)]
+    )
+
+
+class ParquetWriter:
+    """
+    Writes batches of rows to a Parquet file, one row group per batch.
+
+    The schema is built from the cursor description before the first batch,
+    so a large amount or the first non-NULL value in a later batch fits the
+    column type. Without a description it is taken from the first batch,
+    which is only safe for rows written in a single batch.
+    """
+
+    extension = "parquet"
+
+    def __init__(self, path, column_names, description=None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(
+                "Parquet Export Requires pyarrow (pip install pyarrow)."
+            ) from None
+        self._pyarrow = pyarrow
+        self._parquet = pyarrow.parquet
+        self._path = path
+        self._column_names = list(column_names)
+        self._writer = None
+        schema = None
+        if description is not None:
+            schema = arrow_schema(pyarrow, self._column_names, description)
+        if schema is not None:
+            # Opened up front so an empty result still gets a typed file
+            self._writer = self._parquet.ParquetWriter(path, schema)
+
+    def write_batch(self, rows):
+        # Transposing to columns lets Arrow convert each column in one call
+        columns = list(zip(*rows))
+        if self._writer is None:
+            table = self._pyarrow.Table.from_arrays(
+                [self._pyarrow.array(column) for column in columns],
+                names=self._column_names,
+            )
+            self._writer = self._parquet.ParquetWriter(self._path, table.schema)
+        else:
+            schema = self._writer.schema
+            table = self._pyarrow.Table.from_arrays(
+                [
+                    self._pyarrow.array(column, type=field.type)
+                    for column, field in zip(columns, schema)
+                ],
+                schema=schema,
+            )
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+WRITERS = {
+    "csv": CsvWriter,
+    "jsonl": JsonLinesWriter,
+    "parquet": ParquetWriter,
+}
+
+
+class Exporter:
+    """
+    Writes each report to its own file in an output directory.
+    """
+
+    def __init__(self, export_format, output_dir):
+        """
+        Parameters:
+            - export_format: One of "csv", "jsonl" or "parquet".
+            :type export_format: str
+
+            - output_dir: The directory the files are written to.
+            :type output_dir: str
+        """
+        self.writer_class = WRITERS[export_format]
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+    def path_for(self, name):
+        """
+        Returns the file a report is written to, e.g. `new_client_report.csv`.
+
+        Parameters:
+            - name: The name of the report.
+            :type name: str
+
+        Returns:
+            - The path of the file.
+            :rtype: str
+        """
+        slug = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+        return os.path.join(self.output_dir, f"{slug}.{self.writer_class.extension}")
+
+    def export_cursor(self, cursor, name, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Streams the current result set of a cursor to a file.
+
+        Parameters:
+            - cursor: Database cursor object with a pending result set.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+            - name: The name of the report.
+            :type name: str
+
+            - batch_size: The number of rows fetched and written at a time.
+            :type batch_size: int
+
+        Returns:
+            - The path of the file and the number of rows written.
+            :rtype: tuple
+        """
+        path = self.path_for(name)
+        writer = self.writer_class(
+            path, [i[0] for i in cursor.description], cursor.description
+        )
+        count = 0
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                writer.write_batch(rows)
+                count += len(rows)
+        finally:
+            writer.close()
+        return path, count
+
+    def export_rows(self, name, column_names, rows, description=None):
+        """
+        Writes rows that are already in memory to a file.
+
+        Parameters:
+            - name: The name of the report.
+            :type name: str
+
+            - column_names: The column names of the rows.
+            :type column_names: list
+
+            - rows: The rows to write.
+            :type rows: list
+
+            - description: The description of the cursor the rows came
+              from, so Parquet columns get their MySQL types rather than
+              types guessed from the values, e.g. for a column of NULLs.
+            :type description: list
+
+        Returns:
+            - The path of the file and the number of rows written.
+            :rtype: tuple
+        """
+        path = self.path_for(name)
+        writer = self.writer_class(path, column_names, description)
+        try:
+            if rows:
+                writer.write_batch(rows)
+        finally:
+            writer.close()
+        return path, len(rows)
+
+
+def add_export_arguments(parser):
+    """
+    Adds the --format and --output options to a command line parser.
+
+    Parameters:
+        - parser: The parser to add the options to.
+        :type parser: argparse.ArgumentParser
+    """
+    parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default="table",
+        help="Print text tables, or write each report to a file in this format "
+        "(default: table).",
+    )
+    parser.add_argument(
+        "--output",
+        default=".",
+        help="Directory the exported files are written to (default: current directory).",
+    )
+
+
+def exporter_from_args(args):
+    """
+    Builds the exporter selected on the command line.
+
+    Parameters:
+        - args: Arguments parsed with the options from `add_export_arguments`.
+        :type args: argparse.Namespace
+
+    Returns:
+        - The exporter, or None when printing text tables.
+        :rtype: Exporter
+    """
+    if args.format == "table":
+        return None
+    return Exporter(args.format, args.output)
@@ -0,0 +1,362 @@
+"""
+    Title: keyset.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Pages through a table by its primary key (keyset pagination).
+
+    Each page seeks past the last key of the previous page, e.g.
+    `WHERE transaction_id > %s ORDER BY transaction_id LIMIT 20`, so the
+    server reads one page of the primary key index however deep the page
+    is. OFFSET would read and discard every row before the page instead.
+    Filters on columns without an index also make the server read the rows
+    they reject between two pages.
+
+    Table and column names are checked against information_schema before
+    they are put into SQL; filter values are always sent as parameters.
+"""
+
+import argparse
+import re
+
+PRIMARY_KEY_COLUMNS = """
+SELECT
+    column_name
+FROM
+    information_schema.statistics
+WHERE
+    table_schema = DATABASE()
+    AND table_name = %s
+    AND index_name = 'PRIMARY'
+ORDER BY
+    seq_in_index;
+"""
+
+TABLE_COLUMNS = """
+SELECT
+    column_name
+FROM
+    information_schema.columns
+WHERE
+    table_schema = DATABASE()
+    AND table_name = %s
+ORDER BY
+    ordinal_position;
+"""
+
+DEFAULT_PAGE_SIZE = 20
+
+# Comparison operators accepted in a filter such as "amount>=100".
+FILTER_OPERATORS = ("<=", ">=", "!=", "=", "<", ">")
+
+_FILTER_PATTERN = re.compile(
+    r"^\s*(\w+)\s*("
+    + "|".join(re.escape(operator) for operator in FILTER_OPERATORS)
+    + r")\s*(.*?)\s*$"
+)
+
+
+def parse_filter(text):
+    """
+    Parses a filter such as `client_id=42` or `amount >= 100`.
+
+    Parameters:
+        - text: The filter to parse.
+        :type text: str
+
+    Returns:
+        - The column, the operator and the value.
+        :rtype: tuple
+
+    Raises:
+        - ValueError: If the filter is not `<column><operator><value>`.
+    """
+    match = _FILTER_PATTERN.match(text)
+    if match is None:
+        raise ValueError(
+            f"Invalid Filter '{text}', Expected <column><operator><value> "
+            f"with one of {' '.join(FILTER_OPERATORS)}."
+        )
+    return match.groups()
+
+
+def _quote(name):
+    return f"`{name}`"
+
+
+class KeysetPager:
+    """
+    Moves forward and backward through a table one page at a time.
+
+    The pager remembers the keys of the first and last row of the current
+    page; `next_page` seeks after the last one and `previous_page` before the
+    first one. The primary key columns are always selected, so they are
+    added in front of a projection that leaves them out.
+    """
+
+    def __init__(
+        self, cursor, table_name, columns=None, filters=(), page_size=DEFAULT_PAGE_SIZE
+    ):
+        """
+        Parameters:
+            - cursor: Database cursor object.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+            - table_name: The table to page through.
+            :type table_name: str
+
+            - columns: The columns to show, defaults to every column.
+            :type columns: list
+
+            - filters: (column, operator, value) conditions, all of which
+              must hold. See `parse_filter`.
+            :type filters: list
+
+            - page_size: The number of rows per page.
+            :type page_size: int
+
+        Raises:
+            - ValueError: If the table has no primary key, or a column or
+              operator is unknown.
+        """
+        if page_size < 1:
+            raise ValueError("The Page Size Must Be at Least 1.")
+        self.cursor = cursor
+        self.table_name = table_name
+        self.page_size = page_size
+
+        cursor.execute(TABLE_COLUMNS, (table_name,))
+        table_columns = [row[0] for row in cursor.fetchall()]
+        if not table_columns:
+            raise ValueError(f"Table '{table_name}' Not Found.")
+        cursor.execute(PRIMARY_KEY_COLUMNS, (table_name,))
+        self.key_columns = [row[0] for row in cursor.fetchall()]
+        if not self.key_columns:
+            raise ValueError(f"Table '{table_name}' Has No Primary Key to Page By.")
+
+        columns = list(columns or table_columns)
+        for column in columns + [column for column, _, _ in filters]:
+            if column not in table_columns:
+                raise ValueError(f"Unknown Column '{column}' in {table_name}.")
+        for _, operator, _ in filters:
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(f"Unknown Operator '{operator}'.")
+        self.columns = [c for c in self.key_columns if c not in columns] + columns
+        self._key_positions = [self.columns.index(c) for c in self.key_columns]
+
+        self._select = (
+            f"SELECT {', '.join(_quote(c) for c in self.columns)} "
+            f"FROM {_quote(table_name)}"
+        )
+        self._conditions = [f"{_quote(c)} {op} %s" for c, op, _ in filters]
+        self._params = [value for _, _, value in filters]
+        self._key = ", ".join(_quote(c) for c in self.key_columns)
+        if len(self.key_columns) > 1:
+            # Row comparison, which MySQL runs as a range on the primary key
+            self._key = f"({self._key})"
+
+        self.first_key = None
+        self.last_key = None
+        self.has_previous = False
+        self.has_next = False
+
+    def _query(self, after=None, before=None, descending=False):
+        """
+        Builds the query of a page.
+
+        Returns:
+            - The SQL and its parameters.
+            :rtype: tuple
+        """
+        conditions = list(self._conditions)
+        params = list(self._params)
+        for key, operator in ((after, ">"), (before, "<")):
+            if key is not None:
+                placeholders = ", ".join(["%s"] * len(key))
+                if len(key) > 1:
+                    placeholders = f"({placeholders})"
+                conditions.append(f"{self._key} {operator} {placeholders}")
+                params.extend(key)
+        query = self._select
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        direction = " DESC" if descending else ""
+        order = ", ".join(f"{_quote(c)}{direction}" for c in self.key_columns)
+        # One row past the page tells whether there is another page after it
+        query += f" ORDER BY {order} LIMIT {self.page_size + 1}"
+        return query, params
+
+    def _fetch(self, after=None, before=None, descending=False):
+        """
+        Runs the query of a page and moves the pager to it if it has rows.
+
+        Returns:
+            - The rows of the page in key order; empty if there are none, in
+              which case the pager stays on the current page.
+            :rtype: list
+        """
+        self.cursor.execute(*self._query(after, before, descending))
+        rows = self.cursor.fetchall()
+        more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if descending:
+            rows.reverse()
+        if not rows:
+            if descending:
+                self.has_previous = False
+            else:
+                self.has_next = False
+            return rows
+
+        self.first_key = self._key_of(rows[0])
+        self.last_key = self._key_of(rows[-1])
+        if descending:
+            self.has_previous = more
+            self.has_next = before is not None
+        else:
+            self.has_next = more
+            self.has_previous = after is not None
+        return rows
+
+    def _key_of(self, row):
+        return tuple(row[i] for i in self._key_positions)
+
+    def first_page(self):
+        """
+        Returns the first page.
+        """
+        return self._fetch()
+
+    def last_page(self):
+        """
+        Returns the last page.
+        """
+        return self._fetch(descending=True)
+
+    def next_page(self):
+        """
+        Returns the page after the current one, or the first page.
+        """
+        if self.last_key is None:
+            return self.first_page()
+        return self._fetch(after=self.last_key)
+
+    def previous_page(self):
+        """
+        Returns the page before the current one, or the last page.
+        """
+        if self.first_key is None:
+            return self.last_page()
+        return self._fetch(before=self.first_key, descending=True)
+
+
+BROWSE_HELP = "[n]ext  [p]revious  [f]irst  [l]ast  [q]uit"
+
+
+def browse_table(pager, render, prompt=input, out=None):
+    """
+    Pages through a table interactively.
+
+    Parameters:
+        - pager: The pager of the table.
+        :type pager: KeysetPager
+
+        - render: Writes a page, called as `render(columns, rows)`.
+        :type render: callable
+
+        - prompt: Reads the next command, defaults to `input`.
+        :type prompt: callable
+
+        - out: The stream to write messages to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+    """
+    commands = {
+        "n": pager.next_page,
+        "p": pager.previous_page,
+        "f": pager.first_page,
+        "l": pager.last_page,
+    }
+    rows = pager.first_page()
+    if not rows:
+        print(f"No Data Found in {pager.table_name}.", file=out)
+        return
+    render(pager.columns, rows)
+    while True:
+        try:
+            command = prompt(f"\n{BROWSE_HELP}: ").strip().lower()[:1] or "n"
+        except EOFError:
+            return
+        if command == "q":
+            return
+        if command not in commands:
+            print(f"***Unknown Command. {BROWSE_HELP}", file=out)
+            continue
+        rows = commands[command]()
+        if rows:
+            render(pager.columns, rows)
+        else:
+            print(f"No More Rows in {pager.table_name}.", file=out)
+
+
+def _filter_argument(text):
+    try:
+        return parse_filter(text)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(str(err)) from None
+
+
+def add_browse_arguments(parser):
+    """
+    Adds the --browse option and its paging options to a command line parser.
+
+    Parameters:
+        - parser: The parser to add the options to.
+        :type parser: argparse.ArgumentParser
+    """
+    parser.add_argument(
+        "--browse",
+        metavar="TABLE",
+        help="Page through one table interactively instead of printing every table.",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help=f"Rows per page when browsing (default: {DEFAULT_PAGE_SIZE}).",
+    )
+    parser.add_argument(
+        "--columns",
+        type=lambda text: [column.strip() for column in text.split(",")],
+        help="Comma-separated columns to show when browsing (default: all).",
+    )
+    parser.add_argument(
+        "--where",
+        type=_filter_argument,
+        action="append",
+        default=[],
+        metavar="FILTER",
+        help="Only browse rows matching a filter such as client_id=42 or "
+        "amount>=100. May be given more than once.",
+    )
+
+
+def pager_from_args(cursor, args):
+    """
+    Builds the pager of the table selected on the command line.
+
+    Parameters:
+        - cursor: Database cursor object.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - args: Arguments parsed with the options from `add_browse_arguments`.
+        :type args: argparse.Namespace
+
+    Returns:
+        - The pager, or None when not browsing.
+        :rtype: KeysetPager
+
+    Raises:
+        - ValueError: If the table, a column or the page size is invalid.
+    """
+    if not args.browse:
+        return None
+    return KeysetPager(cursor, args.browse, args.columns, args.where, args.page_size)
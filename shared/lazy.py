@@ -0,0 +1,52 @@
+"""
+    Title: lazy.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Defers heavy imports until a module is first used.
+
+    Importing mysql.connector loads the pure Python protocol, probes for the
+    C extension and reads the client error locales, which is most of the
+    startup time of a short report run. A lazily imported module is found
+    at import time, so a missing package still fails early, but its code
+    only runs on the first attribute access.
+"""
+
+import importlib
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    Imports a module lazily.
+
+    Like the `import name` statement, a dotted name returns the top-level
+    package, so `mysql = lazy_import("mysql.connector")` is used exactly as
+    `import mysql.connector` would be. Parent packages are imported as usual.
+
+    Parameters:
+        - name: The full name of the module, e.g. "mysql.connector".
+        :type name: str
+
+    Returns:
+        - The top-level package of the module.
+        :rtype: types.ModuleType
+
+    Raises:
+        - ModuleNotFoundError: If the module is not installed.
+    """
+    top_level = name.partition(".")[0]
+    if name not in sys.modules:
+        parent, _, child = name.rpartition(".")
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+        if parent:
+            # The import system normally does this once the module has loaded
+            setattr(sys.modules[parent], child, module)
+    return sys.modules[top_level] if top_level != name else sys.modules[name]
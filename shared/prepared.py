@@ -0,0 +1,174 @@
+"""
+    Title: prepared.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Keeps parameterized queries prepared on each connection.
+
+    A prepared statement is parsed by the server once and then executed
+    through the binary protocol, which sends parameters and returns rows as
+    typed values instead of text. With the C extension (`_mysql_connector`)
+    the rows are also decoded in C rather than in Python.
+
+    Every connection has one registry, holding one prepared cursor per query,
+    so a pooled connection keeps its statements between checkouts. The pool
+    resets the session when a connection is returned, which deallocates the
+    statements on the server; the registry prepares them again on first use.
+
+    Environment Variables:
+        - DB_USE_PURE: Set to 1 to use the pure Python driver even when the
+          C extension is installed.
+        - DB_PREPARED: Set to 0 to send every query as text instead.
+"""
+
+import os
+
+from shared.lazy import lazy_import
+
+mysql = lazy_import("mysql.connector")
+
+# Returned by the server when a statement was deallocated by a session reset.
+ER_UNKNOWN_STMT_HANDLER = 1243
+
+
+def c_extension_available():
+    """
+    Checks whether the driver can use the C extension.
+
+    Returns:
+        - False when the extension is missing or `DB_USE_PURE` is set.
+        :rtype: bool
+    """
+    if os.getenv("DB_USE_PURE", "0") not in ("", "0"):
+        return False
+    return bool(getattr(mysql.connector, "HAVE_CEXT", False))
+
+
+def prepared_statements_enabled():
+    """
+    Checks whether queries should be sent as prepared statements.
+
+    Returns:
+        - False when `DB_PREPARED` is set to 0.
+        :rtype: bool
+    """
+    return os.getenv("DB_PREPARED", "1") not in ("", "0")
+
+
+class PreparedStatements:
+    """
+    Prepared cursors of one connection, keyed by the query text.
+
+    The connection must only be used by one thread at a time, which is
+    already the case for a pooled connection that has been checked out.
+    """
+
+    def __init__(self, connection):
+        """
+        Parameters:
+            - connection: The connection the statements are prepared on.
+            :type connection: mysql.connector.connection.MySQLConnection
+        """
+        self._connection = connection
+        self._cursors = {}
+        self.enabled = prepared_statements_enabled()
+        # Set per checkout, e.g. to Profiler.wrap_cursor
+        self.wrap_cursor = None
+
+    def _cursor(self, query):
+        """
+        Returns the cursor the query is prepared on, creating it if needed.
+        """
+        cursor = self._cursors.get(query)
+        if cursor is None:
+            if self.enabled:
+                try:
+                    cursor = self._connection.cursor(prepared=True)
+                except mysql.connector.NotSupportedError:
+                    # Fall back to the text protocol for this connection
+                    self.enabled = False
+            if cursor is None:
+                cursor = self._connection.cursor()
+            self._cursors[query] = cursor
+        return cursor
+
+    def _discard(self, query):
+        """
+        Closes the cursor of a query so it is prepared again on next use.
+        """
+        cursor = self._cursors.pop(query, None)
+        if cursor is not None:
+            try:
+                cursor.close()
+            except mysql.connector.Error:
+                pass
+
+    def execute(self, query, params=()):
+        """
+        Executes a query on its prepared cursor.
+
+        The query is prepared on the first call; later calls with the same
+        text only send the parameters. Results must be read completely
+        before another query is executed on the connection.
+
+        Parameters:
+            - query: The SQL, with `%s` placeholders.
+            :type query: str
+
+            - params: The query parameters.
+            :type params: tuple
+
+        Returns:
+            - The cursor holding the results.
+            :rtype: mysql.connector.cursor.MySQLCursorPrepared
+        """
+        cursor = self._cursor(query)
+        if self.wrap_cursor is not None:
+            cursor = self.wrap_cursor(cursor)
+        try:
+            cursor.execute(query, params)
+        except mysql.connector.Error as err:
+            if err.errno != ER_UNKNOWN_STMT_HANDLER:
+                raise
+            # The session was reset since the statement was prepared
+            self._discard(query)
+            cursor = self._cursor(query)
+            if self.wrap_cursor is not None:
+                cursor = self.wrap_cursor(cursor)
+            cursor.execute(query, params)
+        return cursor
+
+    def close(self):
+        """
+        Closes every cursor, deallocating the statements on the server.
+        """
+        for query in list(self._cursors):
+            self._discard(query)
+
+
+def prepared_statements(connection, wrap_cursor=None):
+    """
+    Returns the prepared statement registry of a connection.
+
+    A pooled connection is a new wrapper on every checkout, so the registry
+    is kept on the underlying connection and lives as long as it does.
+
+    Parameters:
+        - connection: The connection, pooled or not.
+        :type connection: mysql.connector.connection.MySQLConnection
+
+        - wrap_cursor: Called on each cursor before it executes, e.g.
+          `Profiler.wrap_cursor`. Replaces the one of the last checkout.
+        :type wrap_cursor: callable
+
+    Returns:
+        - The registry of the connection.
+        :rtype: PreparedStatements
+    """
+    raw_connection = getattr(connection, "_cnx", None) or connection
+    # Only the thread that checked the connection out can get here
+    registry = getattr(raw_connection, "_prepared_statements", None)
+    if registry is None:
+        registry = PreparedStatements(raw_connection)
+        raw_connection._prepared_statements = registry
+    registry.wrap_cursor = wrap_cursor
+    return registry
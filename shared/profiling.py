@@ -0,0 +1,365 @@
+"""
+    Title: profiling.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Lightweight timing of the phases of a report run.
+
+    A Profiler records wall time, call counts, rows and bytes per phase:
+        - connect: checking a connection out of the pool.
+        - execute: sending a query and waiting for the server.
+        - fetch: reading rows from the server.
+        - write: writing the rendered output.
+        - report: the whole of each report, when run through the runner.
+
+    Formatting time is what remains of the report time after the other
+    phases. Nothing is wrapped unless profiling is turned on, so a run
+    without --profile pays no overhead.
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PHASES = ("connect", "execute", "fetch", "write", "report")
+
+
+class PhaseStats:
+    """
+    The totals recorded for one phase.
+    """
+
+    __slots__ = ("calls", "seconds", "rows", "bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.bytes = 0
+
+
+class Profiler:
+    """
+    Collects per-phase totals from any number of threads.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    def record(self, phase, seconds, rows=0, nbytes=0):
+        """
+        Adds one call to the totals of a phase.
+
+        Parameters:
+            - phase: The name of the phase.
+            :type phase: str
+
+            - seconds: The wall time of the call.
+            :type seconds: float
+
+            - rows: The number of rows handled by the call.
+            :type rows: int
+
+            - nbytes: The number of bytes handled by the call.
+            :type nbytes: int
+        """
+        with self._lock:
+            stats = self.phases.get(phase)
+            if stats is None:
+                stats = self.phases[phase] = PhaseStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.rows += rows
+            stats.bytes += nbytes
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager that times a block as one call of a phase.
+
+        Parameters:
+            - name: The name of the phase.
+            :type name: str
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def wrap_cursor(self, cursor):
+        """
+        Returns a cursor that times its execute and fetch calls.
+
+        Parameters:
+            - cursor: Database cursor object.
+            :type cursor: mysql.connector.cursor.MySQLCursor
+
+        Returns:
+            - The profiled cursor.
+            :rtype: ProfiledCursor
+        """
+        return ProfiledCursor(cursor, self)
+
+    def wrap_stream(self, stream):
+        """
+        Returns a stream that times its writes and counts the bytes written.
+
+        Parameters:
+            - stream: The stream to wrap.
+            :type stream: io.TextIOBase
+
+        Returns:
+            - The profiled stream.
+            :rtype: ProfiledStream
+        """
+        return ProfiledStream(stream, self)
+
+    def summary(self):
+        """
+        Returns the totals of every phase, in phase order.
+
+        Returns:
+            - One dictionary per phase.
+            :rtype: list
+        """
+        with self._lock:
+            names = [name for name in PHASES if name in self.phases]
+            names += sorted(name for name in self.phases if name not in PHASES)
+            rows = [
+                {
+                    "phase": name,
+                    "calls": self.phases[name].calls,
+                    "seconds": round(self.phases[name].seconds, 6),
+                    "rows": self.phases[name].rows,
+                    "bytes": self.phases[name].bytes,
+                }
+                for name in names
+            ]
+        if "report" in self.phases:
+            measured = sum(
+                row["seconds"]
+                for row in rows
+                if row["phase"] in ("connect", "execute", "fetch", "write")
+            )
+            rows.append(
+                {
+                    "phase": "format/other",
+                    "calls": 0,
+                    "seconds": round(
+                        max(self.phases["report"].seconds - measured, 0.0), 6
+                    ),
+                    "rows": 0,
+                    "bytes": 0,
+                }
+            )
+        return rows
+
+    def print_summary(self, out=None):
+        """
+        Prints the per-phase totals as a table, to stderr by default.
+
+        Parameters:
+            - out: The stream to print to.
+            :type out: io.TextIOBase
+        """
+        out = out if out is not None else sys.stderr
+        print("\n-- PROFILE --", file=out)
+        print(
+            f"{'Phase':<14} {'Calls':>8} {'Seconds':>10} {'Rows':>12} {'Bytes':>14}",
+            file=out,
+        )
+        for row in self.summary():
+            print(
+                f"{row['phase']:<14} {row['calls']:>8} {row['seconds']:>10.3f} "
+                f"{row['rows']:>12,} {row['bytes']:>14,}",
+                file=out,
+            )
+
+    def write_json(self, path):
+        """
+        Appends the per-phase totals to a JSON Lines log, one object per phase.
+
+        Parameters:
+            - path: The log file.
+            :type path: str
+        """
+        timestamp = time.time()
+        with open(path, "a", encoding="utf-8") as log_file:
+            for row in self.summary():
+                log_file.write(json.dumps({"timestamp": timestamp, **row}) + "\n")
+
+    def write_prometheus(self, path):
+        """
+        Writes the per-phase totals in the Prometheus text exposition format.
+
+        Parameters:
+            - path: The file to write, e.g. for the node exporter textfile
+              collector.
+            :type path: str
+        """
+        metrics = [
+            ("seconds", "report_phase_seconds_total", "Wall time spent per phase."),
+            ("calls", "report_phase_calls_total", "Calls made per phase."),
+            ("rows", "report_phase_rows_total", "Rows handled per phase."),
+            ("bytes", "report_phase_bytes_total", "Bytes written per phase."),
+        ]
+        summary = self.summary()
+        lines = []
+        for key, metric, description in metrics:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for row in summary:
+                lines.append(f'{metric}{{phase="{row["phase"]}"}} {row[key]}')
+        with open(path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write("\n".join(lines) + "\n")
+
+
+class ProfiledCursor:
+    """
+    Cursor proxy that records execute and fetch calls with a Profiler.
+
+    Every other attribute is passed through to the wrapped cursor.
+    """
+
+    def __init__(self, cursor, profiler):
+        self._cursor = cursor
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def execute(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(*args, **kwargs)
+        finally:
+            self._profiler.record("execute", time.perf_counter() - start)
+
+    def executemany(self, operation, seq_params):
+        count = 0
+
+        def counted(params):
+            # Counts the parameter sets as the driver reads them, so
+            # generators are passed through without being consumed first
+            nonlocal count
+            for count, row in enumerate(params, 1):
+                yield row
+
+        start = time.perf_counter()
+        try:
+            if hasattr(seq_params, "__len__"):
+                count = len(seq_params)
+                return self._cursor.executemany(operation, seq_params)
+            return self._cursor.executemany(operation, counted(seq_params))
+        finally:
+            self._profiler.record("execute", time.perf_counter() - start, count)
+
+    def _fetch(self, fetch, *args):
+        start = time.perf_counter()
+        result = fetch(*args)
+        if isinstance(result, list):
+            rows = len(result)
+        else:
+            rows = 0 if result is None else 1
+        self._profiler.record("fetch", time.perf_counter() - start, rows)
+        return result
+
+    def fetchone(self):
+        return self._fetch(self._cursor.fetchone)
+
+    def fetchmany(self, size=1):
+        return self._fetch(self._cursor.fetchmany, size)
+
+    def fetchall(self):
+        return self._fetch(self._cursor.fetchall)
+
+
+class ProfiledStream:
+    """
+    Text stream proxy that records writes with a Profiler.
+    """
+
+    def __init__(self, stream, profiler):
+        self._stream = stream
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def write(self, text):
+        start = time.perf_counter()
+        try:
+            return self._stream.write(text)
+        finally:
+            self._profiler.record(
+                "write", time.perf_counter() - start, nbytes=len(text.encode())
+            )
+
+
+def add_profile_arguments(parser):
+    """
+    Adds the profiling options to a command line parser.
+
+    Parameters:
+        - parser: The parser to add the options to.
+        :type parser: argparse.ArgumentParser
+    """
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-phase timings (connect, execute, fetch, write) at exit.",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="PATH",
+        help="Append the per-phase timings to a JSON Lines log.",
+    )
+    parser.add_argument(
+        "--profile-prometheus",
+        metavar="PATH",
+        help="Write the per-phase timings in the Prometheus text format.",
+    )
+
+
+def profiler_from_args(args):
+    """
+    Builds a Profiler if any profiling option was given.
+
+    Parameters:
+        - args: Arguments parsed with the options from `add_profile_arguments`.
+        :type args: argparse.Namespace
+
+    Returns:
+        - The profiler, or None when profiling is off.
+        :rtype: Profiler
+    """
+    if args.profile or args.profile_json or args.profile_prometheus:
+        return Profiler()
+    return None
+
+
+def finish_profile(profiler, args):
+    """
+    Writes the profile to every destination selected on the command line.
+
+    Parameters:
+        - profiler: The profiler, or None when profiling is off.
+        :type profiler: Profiler
+
+        - args: Arguments parsed with the options from `add_profile_arguments`.
+        :type args: argparse.Namespace
+    """
+    if profiler is None:
+        return
+    if args.profile:
+        profiler.print_summary()
+    if args.profile_json:
+        profiler.write_json(args.profile_json)
+    if args.profile_prometheus:
+        profiler.write_prometheus(args.profile_prometheus)
@@ -0,0 +1,282 @@
+"""
+    Title: sql_script.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Splits and runs `.sql` scripts in a few round trips.
+
+    The tokenizer understands quoted strings, quoted identifiers, comments
+    and `DELIMITER` blocks, so semicolons inside strings or stored program
+    bodies do not split a statement. The runner sends statements to the
+    server in batches as multi-statement queries inside one transaction with
+    foreign key checks turned off, and times each statement as its result
+    comes back.
+
+    Requires MySQL Connector/Python 9.2 or later, where `cursor.execute` runs
+    multi-statement queries and `cursor.nextset` steps through the results.
+    `run_script` checks the installed version before sending anything.
+"""
+
+import sys
+import time
+
+# The number of statements sent to the server in one round trip.
+DEFAULT_BATCH_SIZE = 500
+
+# The first Connector/Python release whose cursors run multi-statement queries.
+MIN_CONNECTOR_VERSION = (9, 2)
+
+
+class Statement:
+    """
+    One statement of a SQL script.
+    """
+
+    def __init__(self, text, compound=False):
+        """
+        Parameters:
+            - text: The statement without its delimiter.
+            :type text: str
+
+            - compound: Whether the statement was ended by a custom
+              `DELIMITER`, such as a stored procedure or trigger body.
+            :type compound: bool
+        """
+        self.text = text
+        self.compound = compound
+        self.elapsed = 0.0
+
+    def preview(self, width=60):
+        """
+        Returns the statement on one line, shortened to `width` characters.
+        """
+        text = " ".join(self.text.split())
+        return text if len(text) <= width else text[: width - 3] + "..."
+
+
+def split_statements(script):
+    """
+    Splits a SQL script into statements.
+
+    Parameters:
+        - script: The contents of the `.sql` file.
+        :type script: str
+
+    Returns:
+        - The statements in the order they appear.
+        :rtype: list
+    """
+    statements = []
+    delimiter = ";"
+    current = []
+    length = len(script)
+    i = 0
+    at_line_start = True
+
+    def finish():
+        text = "".join(current).strip()
+        if text:
+            statements.append(Statement(text, compound=delimiter != ";"))
+        current.clear()
+
+    while i < length:
+        char = script[i]
+
+        # DELIMITER is a client command and is only valid at the start of a line
+        if at_line_start and script[i : i + 10].upper() == "DELIMITER ":
+            if not "".join(current).strip():
+                end = script.find("\n", i)
+                end = length if end == -1 else end
+                delimiter = script[i + 10 : end].strip() or ";"
+                current.clear()
+                i = end
+                continue
+
+        if char in "'\"`":
+            end = i + 1
+            while end < length:
+                if script[end] == "\\" and char != "`":
+                    end += 2
+                    continue
+                if script[end] == char:
+                    # A doubled quote is an escaped quote
+                    if end + 1 < length and script[end + 1] == char:
+                        end += 2
+                        continue
+                    break
+                end += 1
+            current.append(script[i : end + 1])
+            i = end + 1
+            at_line_start = False
+            continue
+
+        if char == "#" or (
+            script.startswith("--", i) and (i + 2 == length or script[i + 2] in " \t\r\n")
+        ):
+            end = script.find("\n", i)
+            i = length if end == -1 else end
+            continue
+
+        if script.startswith("/*", i):
+            end = script.find("*/", i + 2)
+            end = length if end == -1 else end + 2
+            # Keep /*! ... */ comments, MySQL runs their contents
+            if script.startswith("/*!", i):
+                current.append(script[i:end])
+            i = end
+            continue
+
+        if script.startswith(delimiter, i):
+            finish()
+            i += len(delimiter)
+            continue
+
+        current.append(char)
+        if char == "\n":
+            at_line_start = True
+        elif not char.isspace():
+            at_line_start = False
+        i += 1
+
+    finish()
+    return statements
+
+
+def _batches(statements, batch_size):
+    """
+    Groups statements into batches sent in one round trip each.
+
+    Compound statements are sent on their own.
+    """
+    batch = []
+    for statement in statements:
+        if statement.compound:
+            if batch:
+                yield batch
+                batch = []
+            yield [statement]
+            continue
+        batch.append(statement)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _run_batch(cursor, batch):
+    """
+    Sends a batch as one multi-statement query and times each statement.
+
+    The server runs the statements in order and returns each result as soon
+    as its statement finishes, so the time between results is the time of
+    each statement.
+    """
+    start = time.perf_counter()
+    cursor.execute(";\n".join(statement.text for statement in batch))
+    for statement in batch:
+        if cursor.with_rows:
+            cursor.fetchall()
+        now = time.perf_counter()
+        statement.elapsed = now - start
+        start = now
+        if not cursor.nextset():
+            break
+
+
+def check_connector_version():
+    """
+    Checks that the installed Connector/Python runs multi-statement queries.
+
+    Raises:
+        - RuntimeError: If the installed version is older than
+          MIN_CONNECTOR_VERSION.
+    """
+    import mysql.connector
+
+    version = tuple(mysql.connector.__version_info__[:2])
+    if version < MIN_CONNECTOR_VERSION:
+        required = ".".join(map(str, MIN_CONNECTOR_VERSION))
+        raise RuntimeError(
+            f"Running SQL Scripts Requires mysql-connector-python {required} or "
+            f"Later, Found {mysql.connector.__version__} "
+            f"(pip install 'mysql-connector-python>={required}')."
+        )
+
+
+def run_script(db, script, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Runs a SQL script inside a single transaction.
+
+    Foreign key checks are turned off for the load so tables can be filled in
+    any order. Note that DDL such as `CREATE TABLE` or `DROP TABLE` commits
+    implicitly in MySQL, so only the data changes are rolled back on error.
+
+    Parameters:
+        - db: Database connection.
+        :type db: mysql.connector.connection.MySQLConnection
+
+        - script: The contents of the `.sql` file.
+        :type script: str
+
+        - batch_size: The number of statements sent per round trip.
+        :type batch_size: int
+
+    Returns:
+        - The statements with their elapsed time, and the number of round
+          trips used.
+        :rtype: tuple
+
+    Raises:
+        - RuntimeError: If Connector/Python is older than 9.2.
+    """
+    check_connector_version()
+    statements = split_statements(script)
+    round_trips = 0
+    failed = False
+    cursor = db.cursor()
+    try:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for batch in _batches(statements, batch_size):
+            _run_batch(cursor, batch)
+            round_trips += 1
+        db.commit()
+    except Exception:
+        failed = True
+        db.rollback()
+        raise
+    finally:
+        try:
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+            cursor.close()
+        except Exception as err:
+            if not failed:
+                raise
+            # e.g. results still pending from the failed batch; the error that
+            # stopped the script is the one worth seeing
+            print(f"Error Restoring Foreign Key Checks: {err}", file=sys.stderr)
+    return statements, round_trips
+
+
+def print_script_timings(statements, round_trips, slowest=5):
+    """
+    Prints a summary of a script run and its slowest statements.
+
+    Parameters:
+        - statements: The statements returned by `run_script`.
+        :type statements: list
+
+        - round_trips: The number of round trips returned by `run_script`.
+        :type round_trips: int
+
+        - slowest: The number of slowest statements to list.
+        :type slowest: int
+    """
+    total = sum(statement.elapsed for statement in statements)
+    print(
+        f"Ran {len(statements)} Statements in {round_trips} Round Trips "
+        f"({total:.3f}s)."
+    )
+    for statement in sorted(statements, key=lambda s: s.elapsed, reverse=True)[
+        :slowest
+    ]:
+        print(f"  {statement.elapsed:>8.3f}s  {statement.preview()}")
@@ -0,0 +1,281 @@
+"""
+    Title: table_renderer.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Renders query results as aligned text tables.
+
+    Column widths are computed once from a bounded sample of the rows, and a
+    single `%`-style format template is built for the whole result set. Each
+    batch of rows is then written with one `write` call, so printing a row
+    never allocates a separate string per cell.
+"""
+
+import sys
+from decimal import ROUND_HALF_UP, Decimal
+
+# The number of rows inspected to size the columns before rendering starts.
+DEFAULT_SAMPLE_SIZE = 1000
+
+# Columns are never narrower than MIN_WIDTH or wider than MAX_WIDTH. Longer
+# values are not truncated, they simply push the rest of the row to the right.
+MIN_WIDTH = 10
+MAX_WIDTH = 40
+
+SEPARATOR = " | "
+
+CENTS = Decimal("0.01")
+
+
+def format_currency(value):
+    """
+    Formats a number as US dollars, e.g. `$1,234.50`.
+
+    Matches MySQL's `CONCAT('$', FORMAT(value, 2, 'en_US'))`, including
+    rounding halves away from zero and returning None for NULL. Python's
+    own formatting rounds halves to even, e.g. `$0.12` for 0.125.
+
+    Parameters:
+        - value: The amount to format.
+        :type value: decimal.Decimal
+
+    Returns:
+        - The formatted amount.
+        :rtype: str
+    """
+    if value is None:
+        return None
+    if not isinstance(value, Decimal):
+        # str() keeps a float's shortest decimal form, e.g. 0.125 not 0.1249...
+        value = Decimal(str(value))
+    return f"${value.quantize(CENTS, rounding=ROUND_HALF_UP):,.2f}"
+
+
+def _display_width(value):
+    """
+    Returns the printed width of a value, skipping `str()` for strings.
+
+    Parameters:
+        - value: The value to measure.
+        :type value: object
+
+    Returns:
+        - The number of characters the value takes when printed.
+        :rtype: int
+    """
+    if type(value) is str:
+        return len(value)
+    return len(str(value))
+
+
+def compute_widths(column_names, sample, min_width=MIN_WIDTH, max_width=MAX_WIDTH):
+    """
+    Computes the width of each column from the header and a sample of rows.
+
+    Parameters:
+        - column_names: The column names of the result set.
+        :type column_names: list
+
+        - sample: The rows used to size the columns.
+        :type sample: list
+
+        - min_width: The narrowest a column may be.
+        :type min_width: int
+
+        - max_width: The widest a column may be.
+        :type max_width: int
+
+    Returns:
+        - The width of each column.
+        :rtype: list
+    """
+    widths = [len(name) for name in column_names]
+    for row in sample:
+        for index, value in enumerate(row):
+            width = _display_width(value)
+            if width > widths[index]:
+                widths[index] = width
+    return [min(max(width, min_width), max_width) for width in widths]
+
+
+class TableRenderer:
+    """
+    Writes rows of a single result set using a pre-built format template.
+    """
+
+    def __init__(
+        self,
+        column_names,
+        sample=(),
+        out=None,
+        min_width=MIN_WIDTH,
+        max_width=MAX_WIDTH,
+        separator=SEPARATOR,
+        formatters=None,
+    ):
+        """
+        Parameters:
+            - column_names: The column names of the result set.
+            :type column_names: list
+
+            - sample: The rows used to size the columns, before formatting.
+            :type sample: list
+
+            - out: The stream to write to, defaults to `sys.stdout`.
+            :type out: io.TextIOBase
+
+            - min_width: The narrowest a column may be.
+            :type min_width: int
+
+            - max_width: The widest a column may be.
+            :type max_width: int
+
+            - separator: The text written between columns.
+            :type separator: str
+
+            - formatters: Maps column names to functions applied to their
+              values before writing. Other columns are written as they are.
+            :type formatters: dict
+        """
+        self.column_names = tuple(column_names)
+        self._formatters = [
+            (index, formatters[name])
+            for index, name in enumerate(self.column_names)
+            if formatters and name in formatters
+        ]
+        self.widths = compute_widths(
+            self.column_names, self._format(sample), min_width, max_width
+        )
+        self.template = (
+            separator.join(f"%-{width}s" for width in self.widths) + "\n"
+        )
+        self.out = out if out is not None else sys.stdout
+        self.rows_written = 0
+
+    def _format(self, rows):
+        """
+        Applies the column formatters to a batch of rows.
+        """
+        if not self._formatters:
+            return rows
+        formatted = []
+        for row in rows:
+            row = list(row)
+            for index, formatter in self._formatters:
+                row[index] = formatter(row[index])
+            formatted.append(tuple(row))
+        return formatted
+
+    def write_header(self):
+        """
+        Writes the column names followed by a dashed rule.
+        """
+        header = self.template % self.column_names
+        self.out.write(header + "-" * (len(header) - 1) + "\n")
+
+    def write_rows(self, rows):
+        """
+        Writes a batch of rows with a single `write` call.
+
+        Parameters:
+            - rows: The rows to write. Each row must be a tuple.
+            :type rows: list
+        """
+        if not rows:
+            return
+        rows = self._format(rows)
+        self.out.write("".join(map(self.template.__mod__, rows)))
+        self.rows_written += len(rows)
+
+
+def render_cursor(
+    cursor,
+    batch_size=DEFAULT_SAMPLE_SIZE,
+    sample_size=DEFAULT_SAMPLE_SIZE,
+    out=None,
+    formatters=None,
+):
+    """
+    Streams the current result set of a cursor as a text table.
+
+    Batches are read with `fetchmany` until `sample_size` rows have been seen,
+    the columns are sized from those rows, and the remaining batches are
+    written as they arrive.
+
+    Parameters:
+        - cursor: Database cursor object with a pending result set.
+        :type cursor: mysql.connector.cursor.MySQLCursor
+
+        - batch_size: The number of rows to fetch per round trip.
+        :type batch_size: int
+
+        - sample_size: The number of rows used to size the columns.
+        :type sample_size: int
+
+        - out: The stream to write to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+
+        - formatters: Maps column names to functions applied to their values
+          before writing, e.g. `{"amount": format_currency}`.
+        :type formatters: dict
+
+    Returns:
+        - The number of rows written. Nothing is written for an empty result.
+        :rtype: int
+    """
+    sample = []
+    rows = cursor.fetchmany(batch_size)
+    while rows:
+        sample.extend(rows)
+        if len(sample) >= sample_size:
+            break
+        rows = cursor.fetchmany(batch_size)
+
+    if not sample:
+        return 0
+
+    renderer = TableRenderer(
+        [i[0] for i in cursor.description], sample, out=out, formatters=formatters
+    )
+    renderer.write_header()
+    renderer.write_rows(sample)
+    del sample
+
+    while rows := cursor.fetchmany(batch_size):
+        renderer.write_rows(rows)
+
+    return renderer.rows_written
+
+
+def render_rows(
+    column_names, rows, out=None, sample_size=DEFAULT_SAMPLE_SIZE, formatters=None
+):
+    """
+    Renders rows that are already in memory as a text table.
+
+    Parameters:
+        - column_names: The column names of the result set.
+        :type column_names: list
+
+        - rows: The rows to write.
+        :type rows: list
+
+        - out: The stream to write to, defaults to `sys.stdout`.
+        :type out: io.TextIOBase
+
+        - sample_size: The number of rows used to size the columns.
+        :type sample_size: int
+
+        - formatters: Maps column names to functions applied to their values
+          before writing.
+        :type formatters: dict
+
+    Returns:
+        - The number of rows written.
+        :rtype: int
+    """
+    renderer = TableRenderer(
+        column_names, rows[:sample_size], out=out, formatters=formatters
+    )
+    renderer.write_header()
+    renderer.write_rows(rows)
+    return renderer.rows_written
@@ -0,0 +1,113 @@
+"""
+    Title: test_columnar.py
+    Author: Brittaney Perry-Morgan
+    Date: October 18th, 2026
+    Description: Round-trip checks of ColumnarRows against plain lists of rows.
+
+    Every check stores rows, reads them back by iterating, slicing, indexing
+    and unpickling, and compares the result with the rows that went in. The
+    fuzz check draws columns of one type with NULLs anywhere, including the
+    first row, in batches of random sizes.
+
+    Usage:
+        python -m unittest discover shared/tests
+"""
+
+import datetime
+import os
+import pickle
+import random
+import sys
+import unittest
+from decimal import Decimal
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from shared.columnar import MAX_SCALED, ColumnarRows
+
+FIRST_DATE = datetime.date(2020, 1, 1)
+
+
+def random_value(rng, kind):
+    """
+    Returns a random non-NULL value of one column kind.
+    """
+    if kind == "int":
+        small, large = rng.randint(-1000, 1000), rng.randint(-MAX_SCALED, MAX_SCALED)
+        return rng.choice([small, large])
+    if kind == "float":
+        return rng.uniform(-1e6, 1e6)
+    if kind == "decimal":
+        return Decimal(rng.randint(-10**9, 10**9)).scaleb(-rng.choice([0, 2, 6]))
+    if kind == "date":
+        return FIRST_DATE + datetime.timedelta(days=rng.randint(0, 3650))
+    return rng.choice(["Stock", "Bond", "Cash", f"client {rng.randint(0, 10**6)}"])
+
+
+KINDS = ["int", "float", "decimal", "date", "str"]
+
+
+class ColumnarRowsTest(unittest.TestCase):
+    def assertRoundTrip(self, rows):
+        stored = ColumnarRows([f"c{i}" for i in range(len(rows[0]))])
+        # Random batch sizes mix the batch and the per-value append paths
+        rng = random.Random(len(rows))
+        position = 0
+        while position < len(rows):
+            size = rng.randint(1, 50)
+            stored.extend(rows[position : position + size])
+            position += size
+
+        self.assertEqual(len(stored), len(rows))
+        self.assertEqual(list(stored), rows)
+        self.assertEqual(stored[:], rows)
+        self.assertEqual(stored[1:-1], rows[1:-1])
+        self.assertEqual(stored[::3], rows[::3])
+        self.assertEqual([stored[i] for i in range(len(rows))], rows)
+        self.assertEqual(stored[-1], rows[-1])
+        self.assertEqual(list(pickle.loads(pickle.dumps(stored))), rows)
+
+    def test_nullable_dates(self):
+        date = datetime.date(2025, 1, 5)
+        self.assertRoundTrip([(date,), (None,)])
+        self.assertRoundTrip([(None,), (date,)])
+        self.assertRoundTrip([(None,), (None,), (date,), (None,)])
+
+    def test_nullable_decimals(self):
+        self.assertRoundTrip([(Decimal("1.50"),), (None,), (Decimal("2.125"),)])
+        self.assertRoundTrip([(None,), (Decimal("10"),), (Decimal("0.01"),)])
+
+    def test_nullable_ints(self):
+        self.assertRoundTrip([(None,), (1,), (None,), (-5,)])
+        # A value beyond 64 bits switches the column to a list
+        self.assertRoundTrip([(None,), (1,), (2**70,), (None,)])
+
+    def test_all_null_column(self):
+        self.assertRoundTrip([(None, 1), (None, 2)])
+
+    def test_mixed_types_fall_back_to_a_list(self):
+        self.assertRoundTrip([(1,), ("one",), (None,), (Decimal("1.5"),)])
+
+    def test_decimal_scales_are_kept(self):
+        stored = ColumnarRows(["amount"], [(Decimal("5"),), (Decimal("1.25"),)])
+        self.assertEqual(str(stored[0][0]), "5.00")
+        self.assertEqual(list(stored), [(Decimal("5"),), (Decimal("1.25"),)])
+
+    def test_fuzz_nullable_columns(self):
+        rng = random.Random(310)
+        for _ in range(200):
+            kinds = [rng.choice(KINDS) for _ in range(rng.randint(1, 4))]
+            null_rate = rng.choice([0, 0.1, 0.5, 0.95])
+            rows = [
+                tuple(
+                    None if rng.random() < null_rate else random_value(rng, kind)
+                    for kind in kinds
+                )
+                for _ in range(rng.randint(1, 300))
+            ]
+            with self.subTest(kinds=kinds, null_rate=null_rate, rows=len(rows)):
+                self.assertRoundTrip(rows)
+
+
+if __name__ == "__main__":
+    unittest.main()